@@ -1,17 +1,30 @@
 """Analysis engine - orchestrates data fetching, strategy execution, and result storage."""
 
 import logging
+from collections.abc import Iterator, Sequence
 from datetime import UTC, datetime, timedelta
+from decimal import Decimal
 
+import numpy as np
 import pandas as pd
 
+from cryptopilot.analysis.features import FeatureFrame
 from cryptopilot.analysis.registry import create_strategy, get_strategy_class
-from cryptopilot.analysis.strategies.base import AnalysisResult
+from cryptopilot.analysis.strategies.base import AnalysisResult, StrategyBase
 from cryptopilot.database.models import AnalysisResultRecord, Timeframe
 from cryptopilot.database.repository import Repository
 
 logger = logging.getLogger(__name__)
 
+_OHLCV_VALUE_COLUMNS = ("open", "high", "low", "close", "volume")
+
+# Precision of confidence scores persisted to analysis_results
+_SCORE_QUANTUM = Decimal("0.0001")
+
+# Candles loaded per analysis, as a multiple of the strategy's required periods.
+# The extra history lets EMA/Wilder-smoothed indicators converge past their seed.
+HISTORY_MULTIPLIER = 2
+
 
 class AnalysisError(Exception):
     """Analysis operation errors."""
@@ -25,6 +38,72 @@ class InsufficientDataError(AnalysisError):
     pass
 
 
+class _OHLCVBuffer:
+    """Accumulates streamed OHLCV row batches as per-column float arrays.
+
+    Rows are ``(timestamp, open, high, low, close, volume)``, optionally
+    prefixed by ``symbol`` when ``with_symbol`` is set. Each batch is
+    converted as it arrives; the chunks are concatenated once by
+    :meth:`finish`.
+    """
+
+    def __init__(self, with_symbol: bool = False, dtype: type[np.floating] = np.float64) -> None:
+        self._with_symbol = with_symbol
+        self._dtype = dtype
+        self._symbol_chunks: list[tuple[object, ...]] = []
+        self._timestamp_chunks: list[pd.DatetimeIndex] = []
+        self._value_chunks: list[list[np.ndarray]] = [[] for _ in _OHLCV_VALUE_COLUMNS]
+        self.symbols: np.ndarray = np.empty(0, dtype=object)
+        self.timestamps: pd.DatetimeIndex = pd.DatetimeIndex([], tz=UTC)
+        self.values: list[np.ndarray] = []
+
+    def add(self, batch: Sequence[Sequence[object]]) -> None:
+        """Convert one batch of rows into column chunks."""
+        columns = zip(*batch, strict=True)
+        if self._with_symbol:
+            self._symbol_chunks.append(next(columns))
+        self._timestamp_chunks.append(pd.to_datetime(list(next(columns))))
+        for chunks, values in zip(self._value_chunks, columns, strict=True):
+            chunks.append(np.asarray(values, dtype=self._dtype))
+
+    def finish(self) -> int:
+        """Join the accumulated chunks into full columns.
+
+        Returns:
+            Total number of rows
+        """
+        if not self._timestamp_chunks:
+            return 0
+
+        if self._with_symbol:
+            self.symbols = np.asarray(
+                [symbol for chunk in self._symbol_chunks for symbol in chunk], dtype=object
+            )
+        self.timestamps = self._timestamp_chunks[0].append(self._timestamp_chunks[1:])
+        self.values = [
+            chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+            for chunks in self._value_chunks
+        ]
+        return len(self.timestamps)
+
+    def to_frame(self, start: int = 0, stop: int | None = None) -> pd.DataFrame:
+        """Build a DataFrame over rows ``[start, stop)`` without copying the columns."""
+        columns: dict[str, object] = {"timestamp": self.timestamps[start:stop]}
+        for name, values in zip(_OHLCV_VALUE_COLUMNS, self.values, strict=True):
+            columns[name] = values[start:stop]
+        return pd.DataFrame(columns, copy=False)
+
+    def symbol_ranges(self) -> Iterator[tuple[str, int, int]]:
+        """Yield ``(symbol, start, stop)`` for each run of rows sorted by symbol."""
+        if len(self.symbols) == 0:
+            return
+        boundaries = np.flatnonzero(self.symbols[1:] != self.symbols[:-1]) + 1
+        starts = np.concatenate(([0], boundaries))
+        stops = np.concatenate((boundaries, [len(self.symbols)]))
+        for start, stop in zip(starts.tolist(), stops.tolist(), strict=True):
+            yield str(self.symbols[start]), start, stop
+
+
 class AnalysisEngine:
     """Orchestrates market analysis.
 
@@ -38,8 +117,22 @@ class AnalysisEngine:
     def __init__(
         self,
         repo: Repository,
+        float_dtype: type[np.floating] = np.float64,
     ) -> None:
+        """Initialize analysis engine.
+
+        Args:
+            repo: Repository used for market data and result storage
+            float_dtype: dtype of the OHLCV columns handed to strategies. np.float32
+                halves memory traffic in the indicator kernels (which still
+                accumulate in float64) at the cost of ~7 significant digits in
+                the raw prices.
+        """
+        if float_dtype not in (np.float32, np.float64):
+            raise ValueError(f"float_dtype must be float32 or float64, got {float_dtype}")
+
         self._repo = repo
+        self._float_dtype = float_dtype
 
     async def analyze(
         self,
@@ -69,53 +162,107 @@ class AnalysisEngine:
         """
         symbol = symbol.upper().strip()
 
-        logger.info(f"Running {strategy_name} analysis on {symbol} ({timeframe.value})")
-
-        # 1. Validate strategy and get requirements
-        try:
-            strategy_cls = get_strategy_class(strategy_name)
-            strategy = create_strategy(strategy_name, **strategy_params)
-        except ValueError as e:
-            raise AnalysisError(f"Invalid strategy: {e}") from e
+        logger.info("Running %s analysis on %s (%s)", strategy_name, symbol, timeframe.value)
 
-        required_periods = strategy.get_required_periods()
+        strategy = self._create_strategy(strategy_name, strategy_params)
 
-        # 2. Fetch market data
         data = await self._fetch_market_data(
             symbol=symbol,
             timeframe=timeframe,
             provider=provider,
-            min_candles=required_periods,
+            min_candles=strategy.get_required_periods(),
+            max_candles=strategy.get_required_periods() * HISTORY_MULTIPLIER,
         )
 
-        if len(data) < required_periods:
-            raise InsufficientDataError(
-                f"Need {required_periods} candles for {strategy_name}, "
-                f"but only {len(data)} available. "
-                f"Run: cryptopilot collect --symbols {symbol} --days {required_periods}"
-            )
+        return await self._run_strategy(
+            symbol=symbol,
+            strategy_name=strategy_name,
+            strategy=strategy,
+            features=FeatureFrame(data),
+            save_result=save_result,
+        )
 
-        # 3. Run strategy analysis
-        try:
-            result = strategy.analyze(data)
-            logger.info(
-                f"Analysis complete: {result.action.value} "
-                f"(confidence: {result.confidence.value}, "
-                f"score: {result.confidence_score})"
-            )
-        except Exception as e:
-            logger.exception(f"Strategy execution failed: {e}")
-            raise AnalysisError(f"Strategy execution failed: {e}") from e
+    async def analyze_strategies(
+        self,
+        symbol: str,
+        strategy_names: Sequence[str],
+        timeframe: Timeframe = Timeframe.ONE_DAY,
+        provider: str = "coingecko",
+        save_results: bool = True,
+    ) -> dict[str, AnalysisResult]:
+        """Run several strategies (with default parameters) on one symbol.
 
-        # 4. Save result if requested
-        if save_result:
-            await self._save_result(
-                symbol=symbol,
-                strategy_name=strategy_name,
-                result=result,
-            )
+        The candles are fetched once, enough for the most demanding strategy.
+        Each strategy sees the same trailing window as :meth:`analyze` would
+        load for it (EMA and Wilder-smoothed indicators depend on where the
+        history starts), and strategies with the same window share one
+        FeatureFrame, so indicators they all read are computed once.
 
-        return result
+        Args:
+            symbol: Cryptocurrency symbol
+            strategy_names: Strategies to run
+            timeframe: Timeframe for analysis
+            provider: Data provider name
+            save_results: Whether to save results to database
+
+        Returns:
+            Dict of {strategy_name: AnalysisResult}, in the order of
+            ``strategy_names``
+
+        Raises:
+            InsufficientDataError: If there is no market data for the symbol
+            AnalysisError: If a strategy name is invalid
+
+        Note:
+            Strategies that need more candles than are available, or that
+            fail, are logged and left out of the result.
+        """
+        symbol = symbol.upper().strip()
+        strategies = {name: self._create_strategy(name, {}) for name in strategy_names}
+        if not strategies:
+            return {}
+
+        required = [strategy.get_required_periods() for strategy in strategies.values()]
+        data = await self._fetch_market_data(
+            symbol=symbol,
+            timeframe=timeframe,
+            provider=provider,
+            min_candles=min(required),
+            max_candles=max(required) * HISTORY_MULTIPLIER,
+        )
+        windows: dict[int, FeatureFrame] = {}
+
+        results: dict[str, AnalysisResult] = {}
+        for strategy_name, strategy in strategies.items():
+            window = strategy.get_required_periods() * HISTORY_MULTIPLIER
+            features = windows.get(window)
+            if features is None:
+                recent = data if len(data) <= window else data.iloc[-window:]
+                features = windows[window] = FeatureFrame(recent.reset_index(drop=True))
+
+            logger.info("Running %s analysis on %s (%s)", strategy_name, symbol, timeframe.value)
+            try:
+                results[strategy_name] = await self._run_strategy(
+                    symbol=symbol,
+                    strategy_name=strategy_name,
+                    strategy=strategy,
+                    features=features,
+                    save_result=False,
+                )
+            except InsufficientDataError as e:
+                logger.warning("Skipping %s: %s", strategy_name, e)
+            except AnalysisError as e:
+                logger.error("Analysis failed for %s: %s", strategy_name, e)
+
+        if save_results and results:
+            records = [
+                self._to_record(symbol, strategy_name, result)
+                for strategy_name, result in results.items()
+            ]
+            await self._repo.insert_results_many(records)
+            logger.debug("Saved %d analysis results for %s", len(records), symbol)
+
+        return results
 
     async def analyze_portfolio(
         self,
@@ -140,28 +287,126 @@ class AnalysisEngine:
             Dict of {symbol: AnalysisResult}
 
         Note:
-            Failures on individual symbols are logged but don't stop analysis.
+            Candles for all symbols are loaded with one query up front;
+            the strategy runs are CPU-bound and go one symbol at a time.
+            Failures on individual symbols are logged but don't stop
+            analysis. Results keep the order of ``symbols`` and are saved
+            together in one transaction at the end.
         """
-        results: dict[str, AnalysisResult] = {}
+        try:
+            strategy = self._create_strategy(strategy_name, strategy_params)
+        except AnalysisError as e:
+            logger.error("Analysis failed: %s", e)
+            return {}
+
+        # One query for every symbol's candles instead of one per symbol
+        normalized = {symbol: symbol.upper().strip() for symbol in symbols}
+        frames = await self._fetch_market_data_bulk(
+            symbols=list(dict.fromkeys(normalized.values())),
+            timeframe=timeframe,
+            provider=provider,
+            max_candles=strategy.get_required_periods() * HISTORY_MULTIPLIER,
+        )
 
+        results: dict[str, AnalysisResult] = {}
         for symbol in symbols:
+            normalized_symbol = normalized[symbol]
             try:
-                result = await self.analyze(
-                    symbol=symbol,
+                data = frames.get(normalized_symbol)
+                if data is None:
+                    raise InsufficientDataError(
+                        f"No market data found for {normalized_symbol} ({timeframe.value}). "
+                        f"Run: cryptopilot collect --symbols {normalized_symbol}"
+                    )
+                logger.info(
+                    "Running %s analysis on %s (%s)",
+                    strategy_name,
+                    normalized_symbol,
+                    timeframe.value,
+                )
+                results[symbol] = await self._run_strategy(
+                    symbol=normalized_symbol,
                     strategy_name=strategy_name,
-                    timeframe=timeframe,
-                    provider=provider,
-                    save_result=save_results,
-                    **strategy_params,
+                    strategy=strategy,
+                    features=FeatureFrame(data),
+                    save_result=False,
                 )
-                results[symbol] = result
             except InsufficientDataError as e:
-                logger.warning(f"Skipping {symbol}: {e}")
+                logger.warning("Skipping %s: %s", symbol, e)
             except AnalysisError as e:
-                logger.error(f"Analysis failed for {symbol}: {e}")
+                logger.error("Analysis failed for %s: %s", symbol, e)
+
+        if save_results and results:
+            records = [
+                self._to_record(normalized[symbol], strategy_name, result)
+                for symbol, result in results.items()
+            ]
+            await self._repo.insert_results_many(records)
+            logger.debug("Saved %d analysis results for %s", len(records), strategy_name)
 
         return results
 
+    def _create_strategy(
+        self,
+        strategy_name: str,
+        strategy_params: dict[str, object],
+    ) -> StrategyBase:
+        """Instantiate a registered strategy.
+
+        Raises:
+            AnalysisError: If the strategy name or parameters are invalid
+        """
+        try:
+            get_strategy_class(strategy_name)
+            return create_strategy(strategy_name, **strategy_params)
+        except ValueError as e:
+            raise AnalysisError(f"Invalid strategy: {e}") from e
+
+    async def _run_strategy(
+        self,
+        symbol: str,
+        strategy_name: str,
+        strategy: StrategyBase,
+        features: FeatureFrame,
+        save_result: bool,
+    ) -> AnalysisResult:
+        """Run a strategy on loaded market data and optionally save the result.
+
+        Raises:
+            InsufficientDataError: If ``features`` is shorter than the strategy requires
+            AnalysisError: If the strategy fails
+        """
+        data = features.data
+        required_periods = strategy.get_required_periods()
+        if len(data) < required_periods:
+            raise InsufficientDataError(
+                f"Need {required_periods} candles for {strategy_name}, "
+                f"but only {len(data)} available. "
+                f"Run: cryptopilot collect --symbols {symbol} --days {required_periods}"
+            )
+
+        try:
+            result = strategy.analyze(features)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Analysis complete: %s (confidence: %s, score: %.4f)",
+                    result.action.value,
+                    result.confidence.value,
+                    result.confidence_score,
+                )
+        except Exception as e:
+            logger.exception("Strategy execution failed: %s", e)
+            raise AnalysisError(f"Strategy execution failed: {e}") from e
+
+        if save_result:
+            await self._save_result(
+                symbol=symbol,
+                strategy_name=strategy_name,
+                result=result,
+            )
+
+        return result
+
     async def get_latest_analysis(
         self,
         symbol: str,
@@ -196,8 +441,8 @@ class AnalysisEngine:
         Returns:
             List of AnalysisResultRecords
         """
-        now = datetime.now(UTC)
-        start_date = (now - timedelta(days=days)).replace(hour=0, minute=0, second=0, microsecond=0)
+        today = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+        start_date = today - timedelta(days=days)
         return await self._repo.list_results(
             symbol=symbol,
             strategy=strategy,
@@ -211,6 +456,7 @@ class AnalysisEngine:
         timeframe: Timeframe,
         provider: str,
         min_candles: int,
+        max_candles: int | None = None,
     ) -> pd.DataFrame:
         """Fetch market data from database as DataFrame.
 
@@ -219,6 +465,8 @@ class AnalysisEngine:
             timeframe: Timeframe
             provider: Provider name
             min_candles: Minimum candles needed
+            max_candles: Load at most this many of the most recent candles
+                (None loads the full history)
 
         Returns:
             DataFrame with OHLCV data
@@ -226,33 +474,62 @@ class AnalysisEngine:
         Raises:
             InsufficientDataError: If not enough data available
         """
-        # Fetch OHLCV rows via repository (all SQL lives in Repository)
-        rows = await self._repo.get_ohlcv_rows(
+        # Stream OHLCV rows via repository (all SQL lives in Repository) and
+        # pack each batch into float64 arrays as it arrives, so the raw rows
+        # for the whole history are never held at once.
+        # Indicators read the REAL columns; final results use Decimal.
+        buffer = _OHLCVBuffer(dtype=self._float_dtype)
+        async for batch in self._repo.iter_ohlcv_rows(
             symbol=symbol,
             timeframe=timeframe,
             provider=provider,
-        )
+            limit=max_candles,
+        ):
+            buffer.add(batch)
 
-        if not rows:
+        num_rows = buffer.finish()
+        if num_rows == 0:
             raise InsufficientDataError(
                 f"No market data found for {symbol} ({timeframe.value}). "
                 f"Run: cryptopilot collect --symbols {symbol}"
             )
 
-        if len(rows) < min_candles:
-            raise InsufficientDataError(f"Need {min_candles} candles, only {len(rows)} available")
+        if num_rows < min_candles:
+            raise InsufficientDataError(f"Need {min_candles} candles, only {num_rows} available")
 
-        data = pd.DataFrame(rows)
+        return buffer.to_frame()
 
-        # Convert timestamp strings to datetime
-        data["timestamp"] = pd.to_datetime(data["timestamp"])
+    async def _fetch_market_data_bulk(
+        self,
+        symbols: list[str],
+        timeframe: Timeframe,
+        provider: str,
+        max_candles: int | None = None,
+    ) -> dict[str, pd.DataFrame]:
+        """Fetch market data for several symbols with a single query.
 
-        # Convert price/volume strings to float for indicators
-        # (Indicators work with float; final results use Decimal)
-        for col in ["open", "high", "low", "close", "volume"]:
-            data[col] = data[col].astype(float)
+        Args:
+            symbols: Normalized (uppercase) symbols to fetch
+            timeframe: Timeframe
+            provider: Provider name
+            max_candles: Load at most this many recent candles per symbol
 
-        return data
+        Returns:
+            Dict of {symbol: OHLCV DataFrame}; symbols without data are absent
+        """
+        buffer = _OHLCVBuffer(with_symbol=True, dtype=self._float_dtype)
+        async for batch in self._repo.iter_ohlcv_rows_for_symbols(
+            symbols=symbols,
+            timeframe=timeframe,
+            provider=provider,
+            limit=max_candles,
+        ):
+            buffer.add(batch)
+
+        buffer.finish()
+        return {
+            symbol: buffer.to_frame(start, stop) for symbol, start, stop in buffer.symbol_ranges()
+        }
 
     async def _save_result(
         self,
@@ -270,19 +547,28 @@ class AnalysisEngine:
         Returns:
             Row ID of saved record
         """
-        record = AnalysisResultRecord(
+        record = self._to_record(symbol, strategy_name, result)
+
+        row_id = await self._repo.insert_result(record)
+        logger.debug("Saved analysis result (id=%s) for %s", row_id, symbol)
+
+        return row_id
+
+    def _to_record(
+        self,
+        symbol: str,
+        strategy_name: str,
+        result: AnalysisResult,
+    ) -> AnalysisResultRecord:
+        """Convert a strategy result into a storable record (Decimal score)."""
+        return AnalysisResultRecord(
             symbol=symbol,
             strategy=strategy_name,
             action=result.action,
             confidence=result.confidence,
-            confidence_score=result.confidence_score,
-            evidence=result.evidence,
-            risk_assessment=result.risk_assessment,
-            market_context=result.market_context,
+            confidence_score=Decimal(str(result.confidence_score)).quantize(_SCORE_QUANTUM),
+            evidence=list(result.evidence),
+            risk_assessment=result.risk_assessment_dict(),
+            market_context=result.market_context_dict(),
             timestamp=datetime.now(UTC),
         )
-
-        row_id = await self._repo.insert_result(record)
-        logger.debug(f"Saved analysis result (id={row_id}) for {symbol}")
-
-        return row_id
@@ -0,0 +1,93 @@
+"""Run several strategies on the same candles.
+
+Strategies analyzing one symbol share their input, so an ensemble wraps it
+in a single :class:`~cryptopilot.analysis.features.FeatureFrame` and every
+strategy draws its indicators from it: each rolling pass runs once however
+many strategies read it.
+
+The strategies are otherwise independent and can run on worker threads.
+That pays off for :meth:`EnsembleRunner.run_batch` on long histories,
+where the time goes to numpy and the numba kernels (compiled ``nogil``);
+a single latest-bar ``analyze`` is mostly Python and gains nothing from
+threads, so ``max_workers`` defaults to 1.
+"""
+
+import logging
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+import pandas as pd
+
+from cryptopilot.analysis.features import FeatureFrame
+from cryptopilot.analysis.frames import OHLCVFrame
+from cryptopilot.analysis.strategies.base import AnalysisResult, StrategyBase
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class EnsembleRunner:
+    """Runs a fixed set of strategies on shared indicators.
+
+    Args:
+        strategies: Strategies to run; results are keyed by ``strategy.name``
+        max_workers: Threads used to run strategies concurrently (1 runs
+            them one after another on the calling thread)
+
+    Raises:
+        ValueError: If strategy names repeat or max_workers < 1
+    """
+
+    def __init__(self, strategies: Sequence[StrategyBase], max_workers: int = 1) -> None:
+        names = [strategy.name for strategy in strategies]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Strategy names must be unique, got {names}")
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+
+        self.strategies = list(strategies)
+        self.max_workers = max_workers
+
+    def run(self, data: OHLCVFrame | FeatureFrame) -> dict[str, AnalysisResult]:
+        """Analyze the latest bar with every strategy.
+
+        Args:
+            data: OHLCV frame (pandas or polars) or a FeatureFrame
+
+        Returns:
+            Dict of {strategy_name: AnalysisResult} in strategy order
+
+        Raises:
+            ValueError: If data is insufficient for any strategy
+        """
+        features = data if isinstance(data, FeatureFrame) else FeatureFrame(data)
+        return self._map(lambda strategy: strategy.analyze(features))
+
+    def run_batch(self, data: OHLCVFrame | FeatureFrame) -> dict[str, pd.DataFrame]:
+        """Produce every strategy's per-bar signals (see ``StrategyBase.analyze_batch``).
+
+        Args:
+            data: OHLCV frame (pandas or polars) or a FeatureFrame
+
+        Returns:
+            Dict of {strategy_name: signal DataFrame} in strategy order
+
+        Raises:
+            ValueError: If data is insufficient for any strategy
+        """
+        features = data if isinstance(data, FeatureFrame) else FeatureFrame(data)
+        return self._map(lambda strategy: strategy.analyze_batch(features))
+
+    def _map(self, call: Callable[[StrategyBase], _T]) -> dict[str, _T]:
+        """Apply ``call`` to each strategy, on worker threads if configured."""
+        if self.max_workers == 1 or len(self.strategies) < 2:
+            return {strategy.name: call(strategy) for strategy in self.strategies}
+
+        logger.debug("Running %d strategies on %d threads", len(self.strategies), self.max_workers)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(call, self.strategies))
+        return {
+            strategy.name: result for strategy, result in zip(self.strategies, results, strict=True)
+        }
@@ -0,0 +1,151 @@
+"""Indicators computed once per OHLCV frame and shared between strategies.
+
+Several strategies read the same indicators (every strategy reports the
+20-bar volatility and the 5/20 volume ratio). A :class:`FeatureFrame` wraps
+one frame and memoizes each indicator the first time a strategy asks for
+it, so running several strategies on the same candles rolls each window
+only once::
+
+    features = FeatureFrame(data)
+    results = {name: strategy.analyze(features) for name, strategy in strategies.items()}
+
+Strategies also accept a raw frame and wrap it themselves, so single
+strategy callers are unaffected.
+"""
+
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar, cast
+
+import numpy as np
+import pandas as pd
+
+from cryptopilot.analysis.frames import OHLCVFrame, as_pandas_frame
+from cryptopilot.analysis.indicators import (
+    MACDComponents,
+    calculate_bollinger_bands,
+    calculate_macd_components,
+    calculate_rate_of_change,
+    calculate_rsi,
+    calculate_sma,
+    calculate_volatility,
+    tail_mean,
+    volume_ratios,
+)
+
+_T = TypeVar("_T")
+
+
+class FeatureFrame:
+    """An OHLCV frame plus the indicators computed on it so far.
+
+    Indicator methods take the same parameters as their
+    ``cryptopilot.analysis.indicators`` counterparts and return the same
+    values; each distinct ``(indicator, params)`` is computed once per
+    frame. The frame must not be mutated after it is wrapped. It may be
+    shared between threads; an indicator first requested by two threads at
+    once can be computed twice, with either result kept.
+
+    Args:
+        data: pandas or polars OHLCV frame
+    """
+
+    __slots__ = ("data", "_features")
+
+    def __init__(self, data: OHLCVFrame) -> None:
+        self.data: pd.DataFrame = as_pandas_frame(data)
+        self._features: dict[tuple[Hashable, ...], Any] = {}
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        return f"FeatureFrame(rows={len(self.data)}, features={len(self._features)})"
+
+    def _memo(self, key: tuple[Hashable, ...], compute: Callable[[], _T]) -> _T:
+        try:
+            return cast(_T, self._features[key])
+        except KeyError:
+            value = self._features[key] = compute()
+            return value
+
+    @property
+    def close(self) -> pd.Series:
+        """Close prices (the same Series object on every access)."""
+        return self._memo(("column", "close"), lambda: self.data["close"])
+
+    @property
+    def volume(self) -> pd.Series:
+        """Volumes (the same Series object on every access)."""
+        return self._memo(("column", "volume"), lambda: self.data["volume"])
+
+    def has_nan(self, column: str) -> bool:
+        """Whether ``column`` has missing values; checked once per frame."""
+
+        def compute() -> bool:
+            series = self.data[column]
+            values = series.to_numpy()
+            if values.dtype.kind == "f":
+                return bool(np.isnan(values).any())
+            return bool(series.isna().any())
+
+        return self._memo(("has_nan", column), compute)
+
+    def sma(self, period: int) -> pd.Series:
+        """Simple moving average of close (see ``calculate_sma``)."""
+        return self._memo(("sma", period), lambda: calculate_sma(self.close, period))
+
+    def rsi(self, period: int = 14) -> pd.Series:
+        """RSI of close (see ``calculate_rsi``)."""
+        return self._memo(("rsi", period), lambda: calculate_rsi(self.close, period))
+
+    def bollinger_bands(
+        self, period: int = 20, num_std: float = 2.0
+    ) -> tuple[pd.Series, pd.Series, pd.Series]:
+        """Bollinger Bands of close (see ``calculate_bollinger_bands``)."""
+        return self._memo(
+            ("bollinger_bands", period, num_std),
+            lambda: calculate_bollinger_bands(self.close, period, num_std),
+        )
+
+    def macd(
+        self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9
+    ) -> tuple[pd.Series, pd.Series, pd.Series]:
+        """MACD line, signal and histogram of close (see ``calculate_macd``)."""
+        components = self.macd_components(fast_period, slow_period, signal_period)
+        return components.macd, components.signal, components.histogram
+
+    def macd_components(
+        self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9
+    ) -> MACDComponents:
+        """MACD lines plus their fast/slow EMAs (see ``calculate_macd_components``)."""
+        return self._memo(
+            ("macd", fast_period, slow_period, signal_period),
+            lambda: calculate_macd_components(self.close, fast_period, slow_period, signal_period),
+        )
+
+    def rate_of_change(self, period: int) -> pd.Series:
+        """Per-bar rate of change of close (see ``calculate_rate_of_change``)."""
+        return self._memo(
+            ("rate_of_change", period), lambda: calculate_rate_of_change(self.close, period)
+        )
+
+    def volatility(self, period: int = 20) -> pd.Series:
+        """Rolling volatility of close returns (see ``calculate_volatility``)."""
+        return self._memo(("volatility", period), lambda: calculate_volatility(self.close, period))
+
+    def volume_ratio(self, recent: int = 5, average: int = 20) -> float:
+        """Latest recent-to-average volume ratio, 1.0 when the average is not positive."""
+
+        def compute() -> float:
+            avg_volume = tail_mean(self.volume, average)
+            recent_volume = tail_mean(self.volume, recent)
+            return recent_volume / avg_volume if avg_volume > 0 else 1.0
+
+        return self._memo(("volume_ratio", recent, average), compute)
+
+    def volume_ratios(self, recent: int = 5, average: int = 20) -> np.ndarray:
+        """Per-bar recent-to-average volume ratios (see ``indicators.volume_ratios``)."""
+        return self._memo(
+            ("volume_ratios", recent, average),
+            lambda: volume_ratios(self.volume, recent, average),
+        )
@@ -0,0 +1,48 @@
+"""Adapters for OHLCV frames handed to strategies.
+
+Strategies compute on numpy arrays pulled from a pandas DataFrame. Callers
+that already hold data in polars (``pip install -e ".[polars]"``) can pass a
+``polars.DataFrame`` directly: its columns are exposed to pandas through
+their numpy buffers, which is zero-copy for numeric columns without nulls.
+"""
+
+from typing import TYPE_CHECKING, Any, TypeAlias
+
+import pandas as pd
+
+try:
+    import polars as pl
+
+    POLARS_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the optional extra
+    pl = None
+    POLARS_AVAILABLE = False
+
+if TYPE_CHECKING:
+    import polars
+
+    OHLCVFrame: TypeAlias = "pd.DataFrame | polars.DataFrame"
+else:
+    # Runtime stand-in that annotations can still union with FeatureFrame
+    OHLCVFrame: TypeAlias = Any
+
+
+def as_pandas_frame(data: OHLCVFrame) -> pd.DataFrame:
+    """Return ``data`` as a pandas DataFrame.
+
+    Args:
+        data: pandas or polars OHLCV frame
+
+    Returns:
+        The same frame if it is already pandas, otherwise a pandas view of it
+
+    Raises:
+        TypeError: If ``data`` is neither a pandas nor a polars DataFrame
+    """
+    if isinstance(data, pd.DataFrame):
+        return data
+
+    if pl is not None and isinstance(data, pl.DataFrame):
+        return pd.DataFrame({name: data.get_column(name).to_numpy() for name in data.columns})
+
+    raise TypeError(f"Expected a pandas or polars DataFrame, got {type(data).__name__}")
@@ -1,10 +1,136 @@
 """Technical analysis indicators using pandas.
 
-All indicators work on OHLCV DataFrames loaded from market_data.
+All indicators work on OHLCV DataFrames loaded from market_data. The rolling
+indicators delegate to the compiled kernels in ``cryptopilot.analysis.kernels``.
+Strategies sharing a frame reuse results through
+``cryptopilot.analysis.features.FeatureFrame``.
 """
 
+import math
+from typing import NamedTuple
+
+import numpy as np
 import pandas as pd
 
+from cryptopilot.analysis import kernels
+
+# kernels.crossover direction -> detect_crossover result
+_CROSSOVER_NAMES: dict[int, str | None] = {1: "bullish", -1: "bearish", 0: None}
+
+
+def _as_float_array(prices: pd.Series) -> np.ndarray:
+    """Return the values of a Series as a contiguous float array.
+
+    float32 input stays float32 (the kernels accumulate in float64 either
+    way); everything else is converted to float64.
+    """
+    dtype = np.float32 if prices.dtype == np.float32 else np.float64
+    return np.ascontiguousarray(prices.to_numpy(dtype=dtype))
+
+
+def tail_mean(values: pd.Series, n: int) -> float:
+    """Mean of the last ``n`` values (all values if fewer), NaN-skipping like pandas.
+
+    Args:
+        values: Series of values (typically 'volume')
+        n: Number of trailing values
+
+    Returns:
+        Mean of the tail, or NaN if it has no valid values
+    """
+    tail = values.to_numpy()[-n:].astype(np.float64, copy=False)
+    valid = tail[~np.isnan(tail)]
+    return float(valid.mean()) if valid.size else float("nan")
+
+
+def last_value(values: pd.Series, default: float | None = None) -> float:
+    """Last value of a Series as a Python float, without pandas indexing.
+
+    Args:
+        values: Series of values
+        default: Returned instead of NaN when given
+
+    Returns:
+        Last value, or ``default`` if it is NaN and a default was given
+    """
+    value = float(values.to_numpy()[-1])
+    if default is not None and math.isnan(value):
+        return default
+    return value
+
+
+def rate_of_change(values: pd.Series, period: int) -> float:
+    """Percentage change of the last value over ``period`` bars.
+
+    Equivalent to ``values.pct_change(period).iloc[-1] * 100`` without building
+    the full Series.
+
+    Args:
+        values: Series of prices (typically 'close')
+        period: Number of bars to look back
+
+    Returns:
+        Rate of change in percent, or NaN if there is not enough data
+    """
+    arr = values.to_numpy()
+    if len(arr) <= period:
+        return float("nan")
+    previous = float(arr[-1 - period])
+    if previous == 0.0 or math.isnan(previous):
+        return float("nan")
+    return (float(arr[-1]) / previous - 1.0) * 100
+
+
+def rolling_tail_mean(values: pd.Series, n: int) -> pd.Series:
+    """:func:`tail_mean` evaluated at every bar (mean of up to ``n`` trailing values).
+
+    Args:
+        values: Series of values (typically 'volume')
+        n: Number of trailing values
+
+    Returns:
+        Series whose value at each bar equals ``tail_mean`` of the prefix ending there
+    """
+    return pd.Series(kernels.trailing_nanmean(values.to_numpy(), n), index=values.index)
+
+
+def volume_ratios(volume: pd.Series, recent: int = 5, average: int = 20) -> np.ndarray:
+    """Recent-to-average volume ratio at every bar, as the strategies compute it.
+
+    Args:
+        volume: Series of volumes
+        recent: Trailing bars in the recent mean
+        average: Trailing bars in the average mean
+
+    Returns:
+        Array of ratios (1.0 where the average is not positive)
+    """
+    values = volume.to_numpy()
+    recent_mean = kernels.trailing_nanmean(values, recent)
+    average_mean = kernels.trailing_nanmean(values, average)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(average_mean > 0, recent_mean / average_mean, 1.0)
+
+
+def calculate_rate_of_change(prices: pd.Series, period: int) -> pd.Series:
+    """:func:`rate_of_change` evaluated at every bar.
+
+    Args:
+        prices: Series of prices (typically 'close')
+        period: Number of bars to look back
+
+    Returns:
+        Series of percentage changes (NaN where there is not enough data)
+    """
+    values = prices.to_numpy(dtype=np.float64)
+    out = np.full(values.shape[0], np.nan)
+    if values.shape[0] > period:
+        previous = values[:-period] if period else values
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change = (values[period:] / previous - 1.0) * 100
+        out[period:] = np.where(previous == 0.0, np.nan, change)
+    return pd.Series(out, index=prices.index)
+
 
 def calculate_sma(prices: pd.Series, period: int) -> pd.Series:
     """Calculate Simple Moving Average.
@@ -16,12 +142,15 @@ def calculate_sma(prices: pd.Series, period: int) -> pd.Series:
     Returns:
         Series with SMA values
     """
-    return prices.rolling(window=period, min_periods=period).mean()
+    out = kernels.rolling_mean(_as_float_array(prices), period)
+    return pd.Series(out, index=prices.index)
 
 
 def calculate_ema(prices: pd.Series, period: int) -> pd.Series:
     """Calculate Exponential Moving Average.
 
+    The first value is the SMA of the first ``period`` prices.
+
     Args:
         prices: Series of prices (typically 'close')
         period: Number of periods for EMA
@@ -29,12 +158,16 @@ def calculate_ema(prices: pd.Series, period: int) -> pd.Series:
     Returns:
         Series with EMA values
     """
-    return prices.ewm(span=period, adjust=False, min_periods=period).mean()
+    out = kernels.ema(_as_float_array(prices), period)
+    return pd.Series(out, index=prices.index)
 
 
 def calculate_rsi(prices: pd.Series, period: int = 14) -> pd.Series:
     """Calculate Relative Strength Index.
 
+    Uses Wilder's smoothing, seeded with the simple average of the first
+    ``period`` price changes.
+
     Args:
         prices: Series of prices (typically 'close')
         period: RSI period (default: 14)
@@ -42,18 +175,8 @@ def calculate_rsi(prices: pd.Series, period: int = 14) -> pd.Series:
     Returns:
         Series with RSI values (0-100)
     """
-    delta = prices.diff()
-
-    gain = delta.where(delta > 0, 0.0)
-    loss = -delta.where(delta < 0, 0.0)
-
-    avg_gain = gain.rolling(window=period, min_periods=period).mean()
-    avg_loss = loss.rolling(window=period, min_periods=period).mean()
-
-    rs = avg_gain / avg_loss
-    rsi = 100 - (100 / (1 + rs))
-
-    return rsi
+    out = kernels.rsi_wilder(_as_float_array(prices), period)
+    return pd.Series(out, index=prices.index)
 
 
 def calculate_bollinger_bands(
@@ -63,6 +186,8 @@ def calculate_bollinger_bands(
 ) -> tuple[pd.Series, pd.Series, pd.Series]:
     """Calculate Bollinger Bands.
 
+    Band width uses the population standard deviation (ddof=0) of the window.
+
     Args:
         prices: Series of prices (typically 'close')
         period: SMA period for middle band
@@ -71,13 +196,57 @@ def calculate_bollinger_bands(
     Returns:
         Tuple of (upper_band, middle_band, lower_band)
     """
-    middle = calculate_sma(prices, period)
-    std = prices.rolling(window=period, min_periods=period).std()
+    mean, std = kernels.rolling_mean_std(_as_float_array(prices), period, 0)
+    width = std * num_std
+    index = prices.index
 
-    upper = middle + (std * num_std)
-    lower = middle - (std * num_std)
+    return (
+        pd.Series(mean + width, index=index),
+        pd.Series(mean, index=index),
+        pd.Series(mean - width, index=index),
+    )
 
-    return upper, middle, lower
+
+class MACDComponents(NamedTuple):
+    """MACD lines together with the fast and slow EMAs they are built from."""
+
+    macd: pd.Series
+    signal: pd.Series
+    histogram: pd.Series
+    ema_fast: pd.Series
+    ema_slow: pd.Series
+
+
+def calculate_macd_components(
+    prices: pd.Series,
+    fast_period: int = 12,
+    slow_period: int = 26,
+    signal_period: int = 9,
+) -> MACDComponents:
+    """Calculate MACD and keep the EMAs computed along the way.
+
+    ``ema_fast``/``ema_slow`` equal ``calculate_ema(prices, fast_period)`` /
+    ``calculate_ema(prices, slow_period)`` for prices without NaN gaps, so
+    callers that need both MACD and the EMAs make one pass instead of three.
+
+    Args:
+        prices: Series of prices (typically 'close')
+        fast_period: Fast EMA period
+        slow_period: Slow EMA period
+        signal_period: Signal line EMA period
+
+    Returns:
+        MACDComponents of (macd, signal, histogram, ema_fast, ema_slow)
+    """
+    index = prices.index
+    return MACDComponents(
+        *(
+            pd.Series(line, index=index)
+            for line in kernels.macd(
+                _as_float_array(prices), fast_period, slow_period, signal_period
+            )
+        )
+    )
 
 
 def calculate_macd(
@@ -97,14 +266,8 @@ def calculate_macd(
     Returns:
         Tuple of (macd_line, signal_line, histogram)
     """
-    fast_ema = calculate_ema(prices, fast_period)
-    slow_ema = calculate_ema(prices, slow_period)
-
-    macd_line = fast_ema - slow_ema
-    signal_line = calculate_ema(macd_line, signal_period)
-    histogram = macd_line - signal_line
-
-    return macd_line, signal_line, histogram
+    components = calculate_macd_components(prices, fast_period, slow_period, signal_period)
+    return components.macd, components.signal, components.histogram
 
 
 def calculate_volatility(prices: pd.Series, period: int = 20) -> pd.Series:
@@ -117,8 +280,8 @@ def calculate_volatility(prices: pd.Series, period: int = 20) -> pd.Series:
     Returns:
         Series with volatility values
     """
-    returns = prices.pct_change()
-    return returns.rolling(window=period, min_periods=period).std()
+    returns = kernels.pct_change(_as_float_array(prices))
+    return pd.Series(kernels.rolling_std(returns, period, 1), index=prices.index)
 
 
 def calculate_atr(
@@ -129,6 +292,9 @@ def calculate_atr(
 ) -> pd.Series:
     """Calculate Average True Range.
 
+    True range is smoothed with Wilder's method, seeded with the simple
+    average of the first ``period`` true ranges.
+
     Args:
         high: High prices
         low: Low prices
@@ -138,14 +304,97 @@ def calculate_atr(
     Returns:
         Series with ATR values
     """
-    tr1 = high - low
-    tr2 = abs(high - close.shift())
-    tr3 = abs(low - close.shift())
+    out = kernels.atr_wilder(
+        _as_float_array(high),
+        _as_float_array(low),
+        _as_float_array(close),
+        period,
+    )
+    return pd.Series(out, index=close.index)
+
+
+def sma_tail(prices: pd.Series, period: int) -> float:
+    """Latest SMA value without computing the full series.
+
+    Args:
+        prices: Series of prices (typically 'close')
+        period: Number of periods for SMA
+
+    Returns:
+        SMA at the last bar (NaN if not enough data)
+    """
+    return float(kernels.sma_tail(_as_float_array(prices), period))
+
+
+def ema_tail(prices: pd.Series, period: int) -> float:
+    """Latest value of :func:`calculate_ema` without building the full series.
+
+    Args:
+        prices: Series of prices (typically 'close')
+        period: Number of periods for EMA
+
+    Returns:
+        EMA at the last bar (NaN if not enough data)
+    """
+    return float(kernels.ema_tail(_as_float_array(prices), period))
+
+
+def rsi_tail(prices: pd.Series, period: int = 14) -> float:
+    """Latest value of :func:`calculate_rsi` without building the full series.
+
+    Args:
+        prices: Series of prices (typically 'close')
+        period: RSI period (default: 14)
+
+    Returns:
+        RSI at the last bar (0-100, NaN if not enough data)
+    """
+    return float(kernels.rsi_tail(_as_float_array(prices), period))
+
+
+def bollinger_bands_tail(
+    prices: pd.Series,
+    period: int = 20,
+    num_std: float = 2.0,
+) -> tuple[float, float, float]:
+    """Latest Bollinger Bands computed from the final window only.
+
+    Use :func:`calculate_bollinger_bands` when the full bands are needed
+    (plotting, reports); strategies that read the last bar use this.
+
+    Args:
+        prices: Series of prices (typically 'close')
+        period: SMA period for middle band
+        num_std: Number of standard deviations for bands
+
+    Returns:
+        Tuple of (upper_band, middle_band, lower_band) at the last bar
+    """
+    upper, middle, lower, _ = kernels.bbands_tail(_as_float_array(prices), period, num_std)
+    return float(upper), float(middle), float(lower)
 
-    true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-    atr = true_range.rolling(window=period, min_periods=period).mean()
 
-    return atr
+def macd_tail(
+    prices: pd.Series,
+    fast_period: int = 12,
+    slow_period: int = 26,
+    signal_period: int = 9,
+) -> tuple[float, float, float]:
+    """Latest value of :func:`calculate_macd` without building the full series.
+
+    Args:
+        prices: Series of prices (typically 'close')
+        fast_period: Fast EMA period
+        slow_period: Slow EMA period
+        signal_period: Signal line EMA period
+
+    Returns:
+        Tuple of (macd, signal, histogram) at the last bar
+    """
+    macd_value, signal_value, histogram = kernels.macd_tail(
+        _as_float_array(prices), fast_period, slow_period, signal_period
+    )
+    return float(macd_value), float(signal_value), float(histogram)
 
 
 def is_uptrend(prices: pd.Series, short_period: int = 50, long_period: int = 200) -> bool:
@@ -159,13 +408,34 @@ def is_uptrend(prices: pd.Series, short_period: int = 50, long_period: int = 200
     Returns:
         True if short SMA > long SMA (uptrend)
     """
-    short_sma = calculate_sma(prices, short_period)
-    long_sma = calculate_sma(prices, long_period)
-
-    if short_sma.isna().all() or long_sma.isna().all():
+    if len(prices) < max(short_period, long_period):
         return False
 
-    return float(short_sma.iloc[-1]) > float(long_sma.iloc[-1])
+    # Only the latest SMA values matter, so average the tail windows
+    # directly instead of computing both full rolling series.
+    values = prices.to_numpy(dtype=np.float64)
+    short_sma = float(values[-short_period:].mean())
+    long_sma = float(values[-long_period:].mean())
+
+    return short_sma > long_sma
+
+
+def crossover_directions(
+    fast: pd.Series,
+    slow: pd.Series,
+    lookback: int = 5,
+) -> np.ndarray:
+    """:func:`detect_crossover` evaluated at every bar.
+
+    Args:
+        fast: Fast-moving indicator
+        slow: Slow-moving indicator
+        lookback: How many periods back to check
+
+    Returns:
+        int8 array with 1 (bullish), -1 (bearish) or 0 (none) per bar
+    """
+    return kernels.crossover_labels(_as_float_array(fast), _as_float_array(slow), lookback)
 
 
 def detect_crossover(
@@ -188,23 +458,10 @@ def detect_crossover(
     if len(fast) < lookback + 1 or len(slow) < lookback + 1:
         return None
 
-    recent = min(lookback, len(fast) - 1)
-
-    for i in range(1, recent + 1):
-        prev_idx = -i - 1
-        curr_idx = -i
-
-        prev_fast = float(fast.iloc[prev_idx])
-        prev_slow = float(slow.iloc[prev_idx])
-        curr_fast = float(fast.iloc[curr_idx])
-        curr_slow = float(slow.iloc[curr_idx])
-
-        # Bullish crossover: fast was below, now above
-        if prev_fast <= prev_slow and curr_fast > curr_slow:
-            return "bullish"
-
-        # Bearish crossover: fast was above, now below
-        if prev_fast >= prev_slow and curr_fast < curr_slow:
-            return "bearish"
-
-    return None
+    window = lookback + 1
+    # The most recent crossover wins: bullish when fast moves from at/below
+    # slow to above it, bearish for the reverse.
+    direction = kernels.crossover(
+        _as_float_array(fast)[-window:], _as_float_array(slow)[-window:], lookback
+    )
+    return _CROSSOVER_NAMES[direction]
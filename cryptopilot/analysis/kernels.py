@@ -0,0 +1,687 @@
+"""Compiled numeric kernels backing the indicator library.
+
+Kernels take 1-D float32 or float64 arrays and return arrays of the same
+length and dtype, with NaN in the warm-up region (pandas
+``min_periods=period`` semantics). A window that contains a NaN input also
+yields NaN. Running sums and smoothing state are always accumulated in
+float64, so float32 inputs only trade storage/bandwidth, not stability.
+Kernels are compiled without ``fastmath``: it lets LLVM assume there are no
+NaNs, which would break the warm-up and NaN-window handling.
+
+Compiled kernels release the GIL (``nogil``), so strategies analyzed on
+worker threads (see ``cryptopilot.analysis.ensemble``) overlap their
+indicator passes.
+
+``period`` is an ordinary runtime argument rather than a compile-time
+constant: per-period specializations would each need their own JIT
+compilation in every short-lived CLI process (closures cannot use the
+on-disk cache), which costs far more than the loop-bound unrolling saves.
+
+Numba is optional (``pip install -e ".[performance]"``). Without it the
+rolling mean/std fall back to vectorized ``sliding_window_view`` reductions,
+and the remaining kernels run as plain Python loops.
+"""
+
+from collections.abc import Callable
+from functools import cache
+from typing import Any
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the optional extra
+    NUMBA_AVAILABLE = False
+
+    def _njit_fallback(*args: Any, **kwargs: Any) -> Any:
+        """No-op stand-in for ``numba.njit`` when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            return func
+
+        return decorator
+
+    njit = _njit_fallback
+
+
+@njit(cache=True, nogil=True)
+def _rolling_mean_loop(arr: np.ndarray, period: int) -> np.ndarray:
+    """Rolling mean using a running sum (O(1) per step)."""
+    n = arr.shape[0]
+    out = np.full(n, np.nan, dtype=arr.dtype)
+    total = 0.0
+    nan_count = 0
+
+    for i in range(n):
+        x = arr[i]
+        if np.isnan(x):
+            nan_count += 1
+        else:
+            total += x
+
+        if i >= period:
+            old = arr[i - period]
+            if np.isnan(old):
+                nan_count -= 1
+            else:
+                total -= old
+
+        if i >= period - 1 and nan_count == 0:
+            out[i] = total / period
+
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _rolling_mean_std_loop(
+    arr: np.ndarray,
+    period: int,
+    ddof: int = 1,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Rolling mean and standard deviation in one pass using Welford's add/remove updates."""
+    n = arr.shape[0]
+    mean_out = np.full(n, np.nan, dtype=arr.dtype)
+    std_out = np.full(n, np.nan, dtype=arr.dtype)
+    count = 0
+    nan_count = 0
+    mean = 0.0
+    m2 = 0.0
+
+    for i in range(n):
+        x = arr[i]
+        if np.isnan(x):
+            nan_count += 1
+        else:
+            count += 1
+            delta = x - mean
+            mean += delta / count
+            m2 += delta * (x - mean)
+
+        if i >= period:
+            old = arr[i - period]
+            if np.isnan(old):
+                nan_count -= 1
+            else:
+                count -= 1
+                if count == 0:
+                    mean = 0.0
+                    m2 = 0.0
+                else:
+                    delta = old - mean
+                    mean -= delta / count
+                    m2 -= delta * (old - mean)
+
+        if i >= period - 1 and nan_count == 0:
+            mean_out[i] = mean
+            if count > ddof:
+                std_out[i] = np.sqrt(max(m2, 0.0) / (count - ddof))
+
+    return mean_out, std_out
+
+
+def _rolling_std_loop(arr: np.ndarray, period: int, ddof: int = 1) -> np.ndarray:
+    """Rolling standard deviation (the std half of :func:`_rolling_mean_std_loop`)."""
+    return _rolling_mean_std_loop(arr, period, ddof)[1]
+
+
+def _rolling_mean_windows(arr: np.ndarray, period: int) -> np.ndarray:
+    """Rolling mean as one numpy reduction over strided window views."""
+    out = np.full(arr.shape[0], np.nan, dtype=arr.dtype)
+    if arr.shape[0] >= period:
+        out[period - 1 :] = sliding_window_view(arr, period).mean(axis=1, dtype=np.float64)
+    return out
+
+
+def _rolling_std_windows(arr: np.ndarray, period: int, ddof: int = 1) -> np.ndarray:
+    """Rolling standard deviation as one numpy reduction over strided window views."""
+    out = np.full(arr.shape[0], np.nan, dtype=arr.dtype)
+    if arr.shape[0] >= period and period > ddof:
+        windows = sliding_window_view(arr, period)
+        out[period - 1 :] = windows.std(axis=1, ddof=ddof, dtype=np.float64)
+    return out
+
+
+def _rolling_mean_std_windows(
+    arr: np.ndarray,
+    period: int,
+    ddof: int = 1,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Rolling mean and standard deviation over strided window views."""
+    return _rolling_mean_windows(arr, period), _rolling_std_windows(arr, period, ddof)
+
+
+# The O(1)-per-step loops win once compiled; without numba the vectorized
+# window reductions are far faster than interpreting the loops.
+rolling_mean = _rolling_mean_loop if NUMBA_AVAILABLE else _rolling_mean_windows
+rolling_std = _rolling_std_loop if NUMBA_AVAILABLE else _rolling_std_windows
+rolling_mean_std = _rolling_mean_std_loop if NUMBA_AVAILABLE else _rolling_mean_std_windows
+
+
+@njit(cache=True, nogil=True)
+def _trailing_nanmean_loop(arr: np.ndarray, n: int) -> np.ndarray:
+    """Trailing NaN-skipping mean using a running sum and valid count (O(1) per step)."""
+    size = arr.shape[0]
+    out = np.full(size, np.nan)
+    total = 0.0
+    count = 0
+
+    for i in range(size):
+        x = arr[i]
+        if not np.isnan(x):
+            total += x
+            count += 1
+
+        if i >= n:
+            old = arr[i - n]
+            if not np.isnan(old):
+                total -= old
+                count -= 1
+
+        if count > 0:
+            out[i] = total / count
+        else:
+            total = 0.0  # drop rounding residue from values that rolled off
+
+    return out
+
+
+def _trailing_nanmean_windows(arr: np.ndarray, n: int) -> np.ndarray:
+    """Trailing NaN-skipping mean as one reduction over strided window views."""
+    padded = np.concatenate((np.full(n - 1, np.nan), arr.astype(np.float64, copy=False)))
+    windows = sliding_window_view(padded, n)
+    valid = ~np.isnan(windows)
+    counts = valid.sum(axis=1)
+    sums = np.where(valid, windows, 0.0).sum(axis=1)
+    out = np.full(arr.shape[0], np.nan)
+    np.divide(sums, counts, out=out, where=counts > 0)
+    return out
+
+
+def trailing_nanmean(arr: np.ndarray, n: int) -> np.ndarray:
+    """NaN-skipping mean of up to ``n`` trailing values at every position.
+
+    The first ``n - 1`` positions average the shorter prefix; a window with
+    no valid values yields NaN. Always returns float64.
+    """
+    if NUMBA_AVAILABLE:
+        return _trailing_nanmean_loop(np.ascontiguousarray(arr), n)
+    return _trailing_nanmean_windows(arr, n)
+
+
+def pct_change(arr: np.ndarray) -> np.ndarray:
+    """One-bar fractional change, NaN for the first element (``Series.pct_change()``)."""
+    out = np.full(arr.shape[0], np.nan, dtype=arr.dtype)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[1:] = arr[1:] / arr[:-1] - 1.0
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _crossover_loop(fast: np.ndarray, slow: np.ndarray, lookback: int) -> int:
+    """Direction of the most recent crossover within the last ``lookback`` bars.
+
+    Returns:
+        1 if fast last crossed above slow, -1 if it crossed below, 0 if neither
+    """
+    n = min(fast.shape[0], slow.shape[0])
+    stop = max(n - lookback, 1)
+    for i in range(n - 1, stop - 1, -1):
+        prev_fast = fast[i - 1]
+        prev_slow = slow[i - 1]
+        if prev_fast <= prev_slow and fast[i] > slow[i]:
+            return 1
+        if prev_fast >= prev_slow and fast[i] < slow[i]:
+            return -1
+    return 0
+
+
+def _crossing_signs(fast: np.ndarray, slow: np.ndarray) -> np.ndarray:
+    """Per-bar crossing (1 up, -1 down, 0 none) from the sign of ``fast - slow``.
+
+    A crossing at bar j compares bars j-1 and j, so bar 0 is always 0.
+    """
+    diff = fast.astype(np.float64) - slow
+    prev, curr = diff[:-1], diff[1:]
+    signs = np.zeros(diff.shape[0], dtype=np.int8)
+    signs[1:][(prev >= 0) & (curr < 0)] = -1
+    signs[1:][(prev <= 0) & (curr > 0)] = 1
+    return signs
+
+
+def _crossover_signs(fast: np.ndarray, slow: np.ndarray, lookback: int) -> int:
+    """Vectorized :func:`_crossover_loop` over the last ``lookback`` bars."""
+    n = min(fast.shape[0], slow.shape[0])
+    window = min(lookback, n - 1) + 1
+    signs = _crossing_signs(fast[n - window : n], slow[n - window : n])
+    crossed = np.flatnonzero(signs)
+    return int(signs[crossed[-1]]) if crossed.size else 0
+
+
+# Longest lookback served by a lookup table (4 ** 8 = 65536 int8 entries)
+_CROSSOVER_TABLE_MAX_LOOKBACK = 7
+
+
+@cache
+def _crossover_table(lookback: int) -> tuple[np.ndarray, np.ndarray]:
+    """Crossover direction for every comparison pattern of ``lookback + 1`` bars.
+
+    Each bar is a base-4 digit: 0 when fast/slow do not compare (NaN),
+    1 below, 2 equal, 3 above; the oldest bar is the lowest digit. Returns
+    ``(table, weights)`` with ``table[codes @ weights]`` equal to
+    :func:`_crossover_loop` over those bars.
+    """
+    window = lookback + 1
+    weights = 4 ** np.arange(window)
+    states = (np.arange(4**window)[:, None] // weights) % 4
+    at_or_below = (states == 1) | (states == 2)
+    at_or_above = (states == 2) | (states == 3)
+    up = at_or_below[:, :-1] & (states[:, 1:] == 3)
+    down = at_or_above[:, :-1] & (states[:, 1:] == 1)
+    signs = up.astype(np.int8) - down.astype(np.int8)
+
+    crossed = signs != 0
+    latest = lookback - 1 - np.argmax(crossed[:, ::-1], axis=1)
+    table = np.where(crossed.any(axis=1), signs[np.arange(signs.shape[0]), latest], 0)
+    return table.astype(np.int8), weights
+
+
+def _crossover_lookup(fast: np.ndarray, slow: np.ndarray, lookback: int) -> int:
+    """Branch-free :func:`_crossover_loop` via a table of every bar pattern.
+
+    Falls back to :func:`_crossover_signs` for short series and for lookbacks
+    past ``_CROSSOVER_TABLE_MAX_LOOKBACK``.
+    """
+    n = min(fast.shape[0], slow.shape[0])
+    if lookback > _CROSSOVER_TABLE_MAX_LOOKBACK or n <= lookback:
+        return _crossover_signs(fast, slow, lookback)
+
+    table, weights = _crossover_table(lookback)
+    recent_fast = fast[n - lookback - 1 : n]
+    recent_slow = slow[n - lookback - 1 : n]
+    codes = (
+        (recent_fast > recent_slow) * 3
+        + (recent_fast < recent_slow)
+        + (recent_fast == recent_slow) * 2
+    )
+    return int(table[codes @ weights])
+
+
+@njit(cache=True, nogil=True)
+def _crossover_labels_loop(fast: np.ndarray, slow: np.ndarray, lookback: int) -> np.ndarray:
+    """:func:`_crossover_loop` evaluated at every bar in one pass."""
+    n = min(fast.shape[0], slow.shape[0])
+    out = np.zeros(n, dtype=np.int8)
+    latest = -1
+    direction = 0
+    for i in range(1, n):
+        if fast[i - 1] <= slow[i - 1] and fast[i] > slow[i]:
+            latest = i
+            direction = 1
+        elif fast[i - 1] >= slow[i - 1] and fast[i] < slow[i]:
+            latest = i
+            direction = -1
+        if i >= lookback and latest > i - lookback:
+            out[i] = direction
+    return out
+
+
+def _crossover_labels_signs(fast: np.ndarray, slow: np.ndarray, lookback: int) -> np.ndarray:
+    """Vectorized :func:`_crossover_labels_loop`."""
+    signs = _crossing_signs(fast, slow)
+    positions = np.arange(signs.shape[0])
+    latest = np.maximum.accumulate(np.where(signs != 0, positions, -1))
+    recent = (latest >= 0) & (latest > positions - lookback) & (positions >= lookback)
+    return np.where(recent, signs[np.maximum(latest, 0)], 0).astype(np.int8)
+
+
+# Without numba, a few numpy ops beat interpreting the per-bar loops.
+crossover = _crossover_loop if NUMBA_AVAILABLE else _crossover_lookup
+crossover_labels = _crossover_labels_loop if NUMBA_AVAILABLE else _crossover_labels_signs
+
+
+@njit(cache=True, nogil=True)
+def rsi_wilder(arr: np.ndarray, period: int) -> np.ndarray:
+    """RSI with Wilder's smoothing, seeded by the mean of the first ``period`` moves."""
+    n = arr.shape[0]
+    out = np.full(n, np.nan, dtype=arr.dtype)
+    if n <= period:
+        return out
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        delta = arr[i] - arr[i - 1]
+        if delta > 0:
+            avg_gain += delta
+        else:
+            avg_loss -= delta
+    avg_gain /= period
+    avg_loss /= period
+
+    for i in range(period, n):
+        if i > period:
+            delta = arr[i] - arr[i - 1]
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+
+        if avg_loss == 0.0:
+            # Mirrors the pandas formula: no losses -> 100, no movement at all -> NaN
+            if avg_gain > 0.0:
+                out[i] = 100.0
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    return out
+
+
+@njit(cache=True, nogil=True)
+def ema(arr: np.ndarray, period: int) -> np.ndarray:
+    """Exponential moving average seeded with the SMA of the first ``period`` values.
+
+    Leading NaNs are skipped; the seed window starts at the first valid value.
+    """
+    n = arr.shape[0]
+    out = np.full(n, np.nan, dtype=arr.dtype)
+    alpha = 2.0 / (period + 1)
+
+    start = 0
+    while start < n and np.isnan(arr[start]):
+        start += 1
+    seed_end = start + period - 1
+    if seed_end >= n:
+        return out
+
+    value = 0.0
+    for i in range(start, seed_end + 1):
+        value += arr[i]
+    value /= period
+    out[seed_end] = value
+
+    for i in range(seed_end + 1, n):
+        x = arr[i]
+        if not np.isnan(x):
+            value = alpha * x + (1.0 - alpha) * value
+            out[i] = value
+
+    return out
+
+
+@njit(cache=True, nogil=True)
+def macd(
+    arr: np.ndarray,
+    fast_period: int,
+    slow_period: int,
+    signal_period: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """MACD line, signal line, histogram and the fast/slow EMAs in a single pass.
+
+    Every EMA is seeded with the SMA of its first ``period`` inputs, matching
+    :func:`ema`, so the result equals composing three ``ema`` calls.
+
+    Returns:
+        Tuple of (macd, signal, histogram, fast_ema, slow_ema)
+    """
+    n = arr.shape[0]
+    macd_out = np.full(n, np.nan, dtype=arr.dtype)
+    signal_out = np.full(n, np.nan, dtype=arr.dtype)
+    hist_out = np.full(n, np.nan, dtype=arr.dtype)
+    fast_out = np.full(n, np.nan, dtype=arr.dtype)
+    slow_out = np.full(n, np.nan, dtype=arr.dtype)
+
+    a_fast = 2.0 / (fast_period + 1)
+    a_slow = 2.0 / (slow_period + 1)
+    a_sig = 2.0 / (signal_period + 1)
+
+    fast = 0.0
+    slow = 0.0
+    signal = 0.0
+    seen = 0
+    macd_seen = 0
+
+    for i in range(n):
+        x = arr[i]
+        if np.isnan(x):
+            continue
+        seen += 1
+
+        if seen < fast_period:
+            fast += x
+        elif seen == fast_period:
+            fast = (fast + x) / fast_period
+        else:
+            fast = a_fast * x + (1.0 - a_fast) * fast
+        if seen >= fast_period:
+            fast_out[i] = fast
+
+        if seen < slow_period:
+            slow += x
+        elif seen == slow_period:
+            slow = (slow + x) / slow_period
+        else:
+            slow = a_slow * x + (1.0 - a_slow) * slow
+        if seen >= slow_period:
+            slow_out[i] = slow
+
+        if seen < fast_period or seen < slow_period:
+            continue
+
+        macd_i = fast - slow
+        macd_out[i] = macd_i
+        macd_seen += 1
+
+        if macd_seen < signal_period:
+            signal += macd_i
+            continue
+        if macd_seen == signal_period:
+            signal = (signal + macd_i) / signal_period
+        else:
+            signal = a_sig * macd_i + (1.0 - a_sig) * signal
+
+        signal_out[i] = signal
+        hist_out[i] = macd_i - signal
+
+    return macd_out, signal_out, hist_out, fast_out, slow_out
+
+
+@njit(cache=True, nogil=True)
+def atr_wilder(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    period: int,
+) -> np.ndarray:
+    """Average True Range with Wilder's smoothing, seeded by the SMA of the first ``period`` TRs.
+
+    The first bar has no previous close, so its true range is ``high - low``.
+    """
+    n = high.shape[0]
+    out = np.full(n, np.nan, dtype=close.dtype)
+    if n < period:
+        return out
+
+    atr = 0.0
+    for i in range(n):
+        tr = high[i] - low[i]
+        if i > 0:
+            prev_close = close[i - 1]
+            tr = max(tr, abs(high[i] - prev_close), abs(low[i] - prev_close))
+
+        if i < period - 1:
+            atr += tr
+        elif i == period - 1:
+            atr = (atr + tr) / period
+            out[i] = atr
+        else:
+            atr = (atr * (period - 1) + tr) / period
+            out[i] = atr
+
+    return out
+
+
+# Tail-only variants: the same recurrences as above, keeping only scalar state
+# and returning the value at the last bar. They skip the full-length output
+# allocations for callers that only read the latest reading.
+
+
+@njit(cache=True, nogil=True)
+def sma_tail(arr: np.ndarray, period: int) -> float:
+    """Mean of the last ``period`` values (NaN if too short or the window has a NaN)."""
+    n = arr.shape[0]
+    if n < period:
+        return np.nan
+    total = 0.0
+    for i in range(n - period, n):
+        total += arr[i]
+    return total / period
+
+
+@njit(cache=True, nogil=True)
+def bbands_tail(
+    arr: np.ndarray,
+    period: int,
+    num_std: float,
+) -> tuple[float, float, float, float]:
+    """Bollinger Bands of the last window only.
+
+    Returns:
+        Tuple of (upper, middle, lower, population std) at the last bar
+    """
+    n = arr.shape[0]
+    if n < period:
+        return np.nan, np.nan, np.nan, np.nan
+
+    mean = 0.0
+    for i in range(n - period, n):
+        mean += arr[i]
+    mean /= period
+
+    m2 = 0.0
+    for i in range(n - period, n):
+        delta = arr[i] - mean
+        m2 += delta * delta
+    std = np.sqrt(m2 / period)
+
+    return mean + num_std * std, mean, mean - num_std * std, std
+
+
+@njit(cache=True, nogil=True)
+def rsi_tail(arr: np.ndarray, period: int) -> float:
+    """Last value of :func:`rsi_wilder`."""
+    n = arr.shape[0]
+    if n <= period:
+        return np.nan
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        delta = arr[i] - arr[i - 1]
+        if delta > 0:
+            avg_gain += delta
+        else:
+            avg_loss -= delta
+    avg_gain /= period
+    avg_loss /= period
+
+    for i in range(period + 1, n):
+        delta = arr[i] - arr[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+
+    if avg_loss == 0.0:
+        return 100.0 if avg_gain > 0.0 else np.nan
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+@njit(cache=True, nogil=True)
+def ema_tail(arr: np.ndarray, period: int) -> float:
+    """Last value of :func:`ema` (NaN if the last input is NaN)."""
+    n = arr.shape[0]
+    alpha = 2.0 / (period + 1)
+
+    start = 0
+    while start < n and np.isnan(arr[start]):
+        start += 1
+    seed_end = start + period - 1
+    if seed_end >= n:
+        return np.nan
+
+    value = 0.0
+    for i in range(start, seed_end + 1):
+        value += arr[i]
+    value /= period
+
+    for i in range(seed_end + 1, n):
+        x = arr[i]
+        if not np.isnan(x):
+            value = alpha * x + (1.0 - alpha) * value
+
+    return value if not np.isnan(arr[n - 1]) else np.nan
+
+
+@njit(cache=True, nogil=True)
+def macd_tail(
+    arr: np.ndarray,
+    fast_period: int,
+    slow_period: int,
+    signal_period: int,
+) -> tuple[float, float, float]:
+    """Last values of :func:`macd` as (macd, signal, histogram)."""
+    a_fast = 2.0 / (fast_period + 1)
+    a_slow = 2.0 / (slow_period + 1)
+    a_sig = 2.0 / (signal_period + 1)
+
+    fast = 0.0
+    slow = 0.0
+    signal = 0.0
+    seen = 0
+    macd_seen = 0
+    macd_last = np.nan
+    signal_last = np.nan
+
+    for i in range(arr.shape[0]):
+        x = arr[i]
+        macd_last = np.nan
+        signal_last = np.nan
+        if np.isnan(x):
+            continue
+        seen += 1
+
+        if seen < fast_period:
+            fast += x
+        elif seen == fast_period:
+            fast = (fast + x) / fast_period
+        else:
+            fast = a_fast * x + (1.0 - a_fast) * fast
+
+        if seen < slow_period:
+            slow += x
+        elif seen == slow_period:
+            slow = (slow + x) / slow_period
+        else:
+            slow = a_slow * x + (1.0 - a_slow) * slow
+
+        if seen < fast_period or seen < slow_period:
+            continue
+
+        macd_last = fast - slow
+        macd_seen += 1
+
+        if macd_seen < signal_period:
+            signal += macd_last
+            continue
+        if macd_seen == signal_period:
+            signal = (signal + macd_last) / signal_period
+        else:
+            signal = a_sig * macd_last + (1.0 - a_sig) * signal
+        signal_last = signal
+
+    return macd_last, signal_last, macd_last - signal_last
@@ -1,6 +1,7 @@
 """Strategy registry for discovering and instantiating analysis strategies."""
 
 from collections.abc import Mapping
+from functools import lru_cache
 
 from cryptopilot.analysis.strategies.base import StrategyBase
 from cryptopilot.analysis.strategies.mean_reversion import MeanReversionStrategy
@@ -14,7 +15,10 @@ _STRATEGY_REGISTRY: Mapping[str, type[StrategyBase]] = {
     "momentum": MomentumStrategy,
 }
 
+_STRATEGY_NAMES: tuple[str, ...] = tuple(sorted(_STRATEGY_REGISTRY))
 
+
+@lru_cache(maxsize=64)
 def get_strategy_class(name: str) -> type[StrategyBase]:
     """Get strategy class by name.
 
@@ -31,7 +35,7 @@ def get_strategy_class(name: str) -> type[StrategyBase]:
     strategy_cls = _STRATEGY_REGISTRY.get(key)
 
     if strategy_cls is None:
-        available = ", ".join(sorted(_STRATEGY_REGISTRY.keys()))
+        available = ", ".join(_STRATEGY_NAMES)
         raise ValueError(f"Unknown strategy '{name}'. Available strategies: {available}")
 
     return strategy_cls
@@ -60,23 +64,31 @@ def list_strategies() -> list[str]:
     Returns:
         Sorted list of strategy names
     """
-    return sorted(_STRATEGY_REGISTRY.keys())
+    return list(_STRATEGY_NAMES)
 
 
-def get_strategy_info() -> dict[str, dict[str, object]]:
-    """Get information about all strategies.
-
-    Returns:
-        Dict of {strategy_name: {class, required_periods, ...}}
-    """
+def _build_strategy_info() -> dict[str, dict[str, object]]:
+    """Collect static metadata for every registered strategy (default parameters)."""
     info: dict[str, dict[str, object]] = {}
-
     for name, strategy_cls in _STRATEGY_REGISTRY.items():
-        instance = strategy_cls()
+        description = strategy_cls.__doc__ or "No description"
         info[name] = {
             "class": strategy_cls.__name__,
-            "required_periods": instance.get_required_periods(),
-            "description": strategy_cls.__doc__ or "No description",
+            "required_periods": strategy_cls().get_required_periods(),
+            "description": description,
+            "summary": description.split("\n")[0],
         }
-
     return info
+
+
+# Strategy metadata never changes at runtime, so it is computed once at import
+_STRATEGY_INFO: Mapping[str, Mapping[str, object]] = _build_strategy_info()
+
+
+def get_strategy_info() -> dict[str, dict[str, object]]:
+    """Get information about all strategies.
+
+    Returns:
+        Dict of {strategy_name: {class, required_periods, description, summary}}
+    """
+    return {name: dict(info) for name, info in _STRATEGY_INFO.items()}
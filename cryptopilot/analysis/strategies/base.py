@@ -5,15 +5,136 @@ consistent AnalysisResult objects.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from decimal import Decimal
+from typing import Any, Protocol, overload
 
+import numpy as np
 import pandas as pd
 
+from cryptopilot.analysis.features import FeatureFrame
+from cryptopilot.analysis.frames import OHLCVFrame
 from cryptopilot.database.models import ActionType, ConfidenceLevel
 
+_REQUIRED_COLUMNS = frozenset({"timestamp", "open", "high", "low", "close", "volume"})
+_CRITICAL_COLUMNS = ("close",)
 
-@dataclass
+_CONFIDENCE_LEVELS = np.array(
+    [ConfidenceLevel.HIGH, ConfidenceLevel.MEDIUM, ConfidenceLevel.LOW], dtype=object
+)
+
+# A signal branch for analyze_batch: (bar mask, action, score per bar or constant)
+SignalBranch = tuple[np.ndarray, ActionType, np.ndarray | float]
+
+
+class ResultFields(Protocol):
+    """A strategy's ``risk_assessment``/``market_context`` readings.
+
+    Each strategy declares these as a ``typing.NamedTuple`` of floats and
+    labels, which is far cheaper to build per bar than a dict of Decimals.
+    """
+
+    def _asdict(self) -> dict[str, Any]: ...
+
+
+def decimal_values(values: Mapping[str, float | str]) -> dict[str, Decimal | str]:
+    """Convert the float entries of a result mapping to Decimal.
+
+    Strategies do their arithmetic in floats; results are converted once
+    here when they are displayed or persisted. Strings pass through.
+
+    Args:
+        values: Mapping of names to floats or labels
+
+    Returns:
+        Mapping with floats converted via their shortest repr
+    """
+    return {
+        key: value if isinstance(value, str) else Decimal(repr(value))
+        for key, value in values.items()
+    }
+
+
+class Evidence(Sequence[str]):
+    """Evidence lines recorded as format templates and rendered on first read.
+
+    Strategies record ``(template, args)`` pairs with :meth:`add`; the text is
+    only built when the evidence is read, so callers that act on the signal
+    alone (backtests, unsaved comparisons) never pay for string formatting.
+    """
+
+    __slots__ = ("_entries", "_rendered")
+
+    def __init__(self) -> None:
+        self._entries: list[tuple[str, tuple[Any, ...]]] = []
+        self._rendered: list[str] | None = None
+
+    def add(self, template: str, *args: Any) -> None:
+        """Record an evidence line.
+
+        Args:
+            template: ``str.format`` template, or the literal text when no args are given
+            *args: Values substituted into the template when rendered
+        """
+        self._entries.append((template, args))
+        self._rendered = None
+
+    def _lines(self) -> list[str]:
+        if self._rendered is None:
+            self._rendered = [
+                template.format(*args) if args else template for template, args in self._entries
+            ]
+        return self._rendered
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        return self._lines()[index]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._lines())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Evidence | list | tuple):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"Evidence({self._lines()!r})"
+
+
+def _signal_frame(
+    data: pd.DataFrame,
+    first: int,
+    actions: Sequence[ActionType],
+    scores: np.ndarray,
+    levels: Sequence[ConfidenceLevel],
+) -> pd.DataFrame:
+    """Assemble the ``analyze_batch`` frame for the bars from ``first`` on."""
+    index = data.index[first:]
+    return pd.DataFrame(
+        {
+            "timestamp": data["timestamp"].to_numpy()[first:],
+            # object dtype keeps the enum members instead of inferring strings
+            "action": pd.Series(actions, index=index, dtype=object),
+            "confidence_score": scores,
+            "confidence": pd.Series(levels, index=index, dtype=object),
+        },
+        index=index,
+    )
+
+
+@dataclass(slots=True)
 class AnalysisResult:
     """Standardized output from all strategies.
 
@@ -22,16 +143,44 @@ class AnalysisResult:
 
     action: ActionType
     confidence: ConfidenceLevel
-    confidence_score: Decimal  # 0.0 - 1.0
-    evidence: list[str]  # Human-readable reasons for the recommendation
-    risk_assessment: dict[str, Decimal | str] | None = None
-    market_context: dict[str, Decimal | str] | None = None
+    confidence_score: float  # 0.0 - 1.0; converted to Decimal when persisted
+    evidence: Sequence[str]  # Human-readable reasons (an Evidence renders lazily)
+    risk_assessment: ResultFields | None = None  # float readings (NamedTuple)
+    market_context: ResultFields | None = None
 
     def __post_init__(self) -> None:
         """Validate confidence score."""
-        if not (Decimal("0") <= self.confidence_score <= Decimal("1")):
+        if not (0.0 <= self.confidence_score <= 1.0):
             raise ValueError(f"Confidence score must be 0-1, got {self.confidence_score}")
 
+    def risk_assessment_dict(self) -> dict[str, Decimal | str] | None:
+        """Return ``risk_assessment`` as a mapping with Decimal values."""
+        if self.risk_assessment is None:
+            return None
+        return decimal_values(self.risk_assessment._asdict())
+
+    def market_context_dict(self) -> dict[str, Decimal | str] | None:
+        """Return ``market_context`` as a mapping with Decimal values."""
+        if self.market_context is None:
+            return None
+        return decimal_values(self.market_context._asdict())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the result as plain data, with Decimal risk/context values.
+
+        Returns:
+            Dict with action, confidence, confidence_score, evidence,
+            risk_assessment and market_context
+        """
+        return {
+            "action": self.action,
+            "confidence": self.confidence,
+            "confidence_score": self.confidence_score,
+            "evidence": list(self.evidence),
+            "risk_assessment": self.risk_assessment_dict(),
+            "market_context": self.market_context_dict(),
+        }
+
 
 class StrategyBase(ABC):
     """Abstract base class for all trading strategies.
@@ -53,13 +202,15 @@ class StrategyBase(ABC):
         pass
 
     @abstractmethod
-    def analyze(self, data: pd.DataFrame) -> AnalysisResult:
+    def analyze(self, data: OHLCVFrame | FeatureFrame) -> AnalysisResult:
         """Analyze market data and produce a trading signal.
 
         Args:
-            data: DataFrame with OHLCV data (columns: timestamp, open, high, low, close, volume)
+            data: pandas or polars DataFrame with OHLCV data
+                  (columns: timestamp, open, high, low, close, volume)
                   Must be sorted by timestamp ascending
                   Must have at least get_required_periods() rows
+                  A FeatureFrame shares its indicators with other strategies
 
         Returns:
             AnalysisResult with action, confidence, and supporting evidence
@@ -69,43 +220,136 @@ class StrategyBase(ABC):
         """
         pass
 
-    def validate_data(self, data: pd.DataFrame) -> None:
+    def analyze_batch(self, data: OHLCVFrame | FeatureFrame) -> pd.DataFrame:
+        """Produce the signal for every bar of a frame in one call.
+
+        Row ``i`` holds what ``analyze(data.iloc[: i + 1])`` returns (action,
+        score and level), for every bar with at least
+        ``get_required_periods()`` candles of history. This default runs
+        ``analyze`` on each prefix; strategies override it with a vectorized
+        sweep over indicators computed once on the whole frame.
+
+        Args:
+            data: OHLCV DataFrame (pandas or polars) or FeatureFrame sorted by
+                timestamp ascending
+
+        Returns:
+            DataFrame indexed like the covered bars of ``data`` with columns
+            timestamp, action, confidence_score and confidence
+
+        Raises:
+            ValueError: If data is insufficient or invalid
+        """
+        data = self.prepare_data(data)
+
+        first = self.get_required_periods() - 1
+        results = [self.analyze(data.iloc[: i + 1]) for i in range(first, len(data))]
+        return _signal_frame(
+            data,
+            first,
+            [result.action for result in results],
+            np.array([result.confidence_score for result in results], dtype=np.float64),
+            [result.confidence for result in results],
+        )
+
+    def _select_signals(
+        self,
+        data: pd.DataFrame,
+        branches: list[SignalBranch],
+        default: tuple[ActionType, np.ndarray | float],
+    ) -> pd.DataFrame:
+        """Build the ``analyze_batch`` frame from per-bar decision branches.
+
+        Branches are checked in order like the if/elif chain in ``analyze``:
+        each bar takes the action and score of the first branch whose mask
+        is set, or ``default`` when none is.
+        """
+        conditions = [mask for mask, _, _ in branches]
+        actions = np.array([action for _, action, _ in branches] + [default[0]], dtype=object)
+        codes = np.select(conditions, list(range(len(branches))), default=len(branches))
+        scores = np.select(conditions, [score for _, _, score in branches], default=default[1])
+        # Same thresholds as calculate_confidence_level
+        levels = np.select([scores >= 0.7, scores >= 0.4], [0, 1], default=2)
+
+        first = self.get_required_periods() - 1
+        return _signal_frame(
+            data,
+            first,
+            actions[codes[first:]],
+            scores[first:].astype(np.float64),
+            _CONFIDENCE_LEVELS[levels[first:]],
+        )
+
+    def prepare_data(self, data: OHLCVFrame | FeatureFrame) -> pd.DataFrame:
+        """Convert ``data`` to pandas and validate it.
+
+        Args:
+            data: pandas or polars OHLCV frame, or a FeatureFrame
+
+        Returns:
+            Validated pandas DataFrame
+
+        Raises:
+            TypeError: If data is not a supported frame type
+            ValueError: If data is invalid
+        """
+        return self.prepare_features(data).data
+
+    def prepare_features(self, data: OHLCVFrame | FeatureFrame) -> FeatureFrame:
+        """Wrap ``data`` in a FeatureFrame (unless it already is one) and validate it.
+
+        Args:
+            data: pandas or polars OHLCV frame, or a FeatureFrame
+
+        Returns:
+            FeatureFrame over the validated pandas DataFrame
+
+        Raises:
+            TypeError: If data is not a supported frame type
+            ValueError: If data is invalid
+        """
+        features = data if isinstance(data, FeatureFrame) else FeatureFrame(data)
+        self.validate_data(features)
+        return features
+
+    def validate_data(self, data: pd.DataFrame | FeatureFrame) -> None:
         """Validate input DataFrame has required structure.
 
         Args:
-            data: DataFrame to validate
+            data: DataFrame to validate, or a FeatureFrame (whose NaN checks
+                are then shared by every strategy validating it)
 
         Raises:
             ValueError: If data is invalid
         """
-        required_cols = {"timestamp", "open", "high", "low", "close", "volume"}
-        missing = required_cols - set(data.columns)
+        features = data if isinstance(data, FeatureFrame) else FeatureFrame(data)
+        data = features.data
+        missing = _REQUIRED_COLUMNS.difference(data.columns)
 
         if missing:
-            raise ValueError(f"DataFrame missing required columns: {missing}")
+            raise ValueError(f"DataFrame missing required columns: {set(missing)}")
 
         min_periods = self.get_required_periods()
         if len(data) < min_periods:
             raise ValueError(f"{self.name} requires {min_periods} candles, got {len(data)}")
 
         # Check for NaN in critical columns
-        critical_cols = ["close"]
-        for col in critical_cols:
-            if data[col].isna().any():
+        for col in _CRITICAL_COLUMNS:
+            if features.has_nan(col):
                 raise ValueError(f"Column '{col}' contains NaN values. Run data integrity checks.")
 
-    def calculate_confidence_level(self, score: Decimal) -> ConfidenceLevel:
+    def calculate_confidence_level(self, score: float) -> ConfidenceLevel:
         """Map confidence score to confidence level.
 
         Args:
-            score: Decimal between 0 and 1
+            score: Float between 0 and 1
 
         Returns:
             HIGH (>0.7), MEDIUM (0.4-0.7), or LOW (<0.4)
         """
-        if score >= Decimal("0.7"):
+        if score >= 0.7:
             return ConfidenceLevel.HIGH
-        elif score >= Decimal("0.4"):
+        elif score >= 0.4:
             return ConfidenceLevel.MEDIUM
         else:
             return ConfidenceLevel.LOW
@@ -14,19 +14,63 @@ Confidence based on:
 - Recent volatility
 """
 
-from decimal import Decimal
+from typing import NamedTuple
 
+import numpy as np
 import pandas as pd
 
-from cryptopilot.analysis.indicators import (
-    calculate_bollinger_bands,
-    calculate_rsi,
-    calculate_volatility,
+from cryptopilot.analysis.features import FeatureFrame
+from cryptopilot.analysis.frames import OHLCVFrame
+from cryptopilot.analysis.indicators import bollinger_bands_tail, last_value, rsi_tail
+from cryptopilot.analysis.strategies.base import (
+    AnalysisResult,
+    Evidence,
+    StrategyBase,
 )
-from cryptopilot.analysis.strategies.base import AnalysisResult, StrategyBase
 from cryptopilot.database.models import ActionType
 
 
+class MeanReversionRisk(NamedTuple):
+    """Readings behind a mean reversion signal."""
+
+    rsi: float
+    bb_position: float
+    volatility: float
+    band_width_pct: float
+    volume_ratio: float
+
+
+class MeanReversionContext(NamedTuple):
+    """Market state seen by the mean reversion strategy."""
+
+    current_price: float
+    upper_bb: float
+    middle_bb: float
+    lower_bb: float
+    rsi: float
+    mean_reversion_zone: str
+
+
+def _extreme_score(
+    rsi_extremity: float | np.ndarray,
+    band_distance: float | np.ndarray,
+    volume_ratio: float | np.ndarray,
+) -> np.ndarray:
+    """Confidence of a strong oversold/overbought signal, capped at 0.95."""
+    rsi_boost = np.minimum(rsi_extremity * 0.3, 0.3)
+    bb_boost = band_distance * 0.2
+    volume_boost = np.where(volume_ratio > 1.3, 0.1, 0.0)
+    return np.minimum(0.65 + rsi_boost + bb_boost + volume_boost, 0.95)
+
+
+def _add_volume_evidence(evidence: Evidence, volume_ratio: float) -> None:
+    """Record the volume reading that feeds ``_extreme_score``."""
+    if volume_ratio > 1.3:
+        evidence.add("High volume confirming: {:.1f}x average", volume_ratio)
+    else:
+        evidence.add("Volume: {:.1f}x average", volume_ratio)
+
+
 class MeanReversionStrategy(StrategyBase):
     """RSI + Bollinger Bands mean reversion strategy.
 
@@ -57,34 +101,70 @@ class MeanReversionStrategy(StrategyBase):
         """Need enough data for RSI and Bollinger Bands."""
         return max(self.rsi_period, self.bb_period) + 20
 
-    def analyze(self, data: pd.DataFrame) -> AnalysisResult:
+    def analyze_batch(self, data: OHLCVFrame | FeatureFrame) -> pd.DataFrame:
+        """Vectorized :meth:`analyze` over every bar (see ``StrategyBase.analyze_batch``).
+
+        The bands come from the rolling kernel rather than per-window tail
+        sums, so scores can differ from ``analyze`` in the last few ulps.
+        """
+        features = self.prepare_features(data)
+
+        price = features.close.to_numpy(dtype=np.float64)
+        rsi = features.rsi(self.rsi_period).to_numpy()
+        upper_bb, _, lower_bb = (
+            band.to_numpy() for band in features.bollinger_bands(self.bb_period, self.bb_std)
+        )
+
+        bb_range = upper_bb - lower_bb
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bb_position = np.where(bb_range > 0, (price - lower_bb) / bb_range, 0.5)
+        volume_ratio = features.volume_ratios()
+
+        oversold_score = _extreme_score(
+            (self.rsi_oversold - rsi) / self.rsi_oversold, 0.2 - bb_position, volume_ratio
+        )
+        overbought_score = _extreme_score(
+            (rsi - self.rsi_overbought) / (100 - self.rsi_overbought),
+            bb_position - 0.8,
+            volume_ratio,
+        )
+
+        return self._select_signals(
+            features.data,
+            [
+                ((rsi < self.rsi_oversold) & (bb_position < 0.2), ActionType.BUY, oversold_score),
+                (
+                    (rsi > self.rsi_overbought) & (bb_position > 0.8),
+                    ActionType.SELL,
+                    overbought_score,
+                ),
+                ((rsi < 40) & (bb_position < 0.3), ActionType.BUY, 0.45),
+                ((rsi > 60) & (bb_position > 0.7), ActionType.SELL, 0.45),
+            ],
+            default=(ActionType.HOLD, np.where(np.abs(bb_position - 0.5) < 0.15, 0.60, 0.50)),
+        )
+
+    def analyze(self, data: OHLCVFrame | FeatureFrame) -> AnalysisResult:
         """Analyze using RSI and Bollinger Bands.
 
         Args:
-            data: OHLCV DataFrame
+            data: OHLCV DataFrame (pandas or polars) or a shared FeatureFrame
 
         Returns:
             AnalysisResult with BUY/SELL/HOLD recommendation
         """
-        self.validate_data(data)
+        features = self.prepare_features(data)
 
         # Calculate indicators
-        close = data["close"]
-        volume = data["volume"]
+        close = features.close
 
-        rsi = calculate_rsi(close, self.rsi_period)
-        upper_bb, middle_bb, lower_bb = calculate_bollinger_bands(
+        # Only the latest readings are used, so compute them directly
+        current_price = last_value(close)
+        current_rsi = rsi_tail(close, self.rsi_period)
+        current_upper_bb, current_middle_bb, current_lower_bb = bollinger_bands_tail(
             close, self.bb_period, self.bb_std
         )
-        volatility = calculate_volatility(close, period=20)
-
-        # Current values
-        current_price = float(close.iloc[-1])
-        current_rsi = float(rsi.iloc[-1])
-        current_upper_bb = float(upper_bb.iloc[-1])
-        current_middle_bb = float(middle_bb.iloc[-1])
-        current_lower_bb = float(lower_bb.iloc[-1])
-        current_vol = float(volatility.iloc[-1]) if not pd.isna(volatility.iloc[-1]) else 0.0
+        current_vol = last_value(features.volatility(20), default=0.0)
 
         # Calculate position within Bollinger Bands (0 = lower, 1 = upper)
         bb_range = current_upper_bb - current_lower_bb
@@ -94,157 +174,132 @@ class MeanReversionStrategy(StrategyBase):
             bb_position = 0.5
 
         # Volume analysis
-        avg_volume = float(volume.tail(20).mean())
-        recent_volume = float(volume.tail(5).mean())
-        volume_ratio = recent_volume / avg_volume if avg_volume > 0 else 1.0
+        volume_ratio = features.volume_ratio()
 
         # Calculate band width (volatility indicator)
         band_width_pct = (bb_range / current_middle_bb) * 100 if current_middle_bb > 0 else 0
 
         # Decision logic
-        evidence: list[str] = []
+        evidence = Evidence()
         action: ActionType
-        confidence_score: Decimal
+        confidence_score: float
 
         # OVERSOLD - BUY signal
         if current_rsi < self.rsi_oversold and bb_position < 0.2:
             action = ActionType.BUY
-            evidence.append(f"Oversold: RSI at {current_rsi:.1f} (threshold: {self.rsi_oversold})")
-            evidence.append(
-                f"Price near lower Bollinger Band: ${current_price:.2f} "
-                f"(band: ${current_lower_bb:.2f})"
+            evidence.add("Oversold: RSI at {:.1f} (threshold: {})", current_rsi, self.rsi_oversold)
+            evidence.add(
+                "Price near lower Bollinger Band: ${:.2f} (band: ${:.2f})",
+                current_price,
+                current_lower_bb,
             )
-            evidence.append(f"Band position: {bb_position * 100:.1f}% of range")
+            evidence.add("Band position: {:.1f}% of range", bb_position * 100)
 
-            # Calculate confidence
-            # More oversold = higher confidence
+            # More oversold and closer to the band = higher confidence
             rsi_extremity = (self.rsi_oversold - current_rsi) / self.rsi_oversold
-            rsi_boost = min(Decimal(str(rsi_extremity * 0.3)), Decimal("0.3"))
-
-            # Closer to band = higher confidence
-            bb_boost = Decimal(str((0.2 - bb_position) * 0.2))
-
-            base_confidence = Decimal("0.65")
-
-            # Volume confirmation adds confidence
-            if volume_ratio > 1.3:
-                evidence.append(f"High volume confirming: {volume_ratio:.1f}x average")
-                volume_boost = Decimal("0.1")
-            else:
-                evidence.append(f"Volume: {volume_ratio:.1f}x average")
-                volume_boost = Decimal("0")
-
-            confidence_score = min(
-                base_confidence + rsi_boost + bb_boost + volume_boost, Decimal("0.95")
-            )
+            confidence_score = float(_extreme_score(rsi_extremity, 0.2 - bb_position, volume_ratio))
+            _add_volume_evidence(evidence, volume_ratio)
 
             # Risk warning if volatility is high
             if band_width_pct > 10:
-                evidence.append(f"⚠ High volatility: Band width {band_width_pct:.1f}%")
+                evidence.add("⚠ High volatility: Band width {:.1f}%", band_width_pct)
 
         # OVERBOUGHT - SELL signal
         elif current_rsi > self.rsi_overbought and bb_position > 0.8:
             action = ActionType.SELL
-            evidence.append(
-                f"Overbought: RSI at {current_rsi:.1f} (threshold: {self.rsi_overbought})"
+            evidence.add(
+                "Overbought: RSI at {:.1f} (threshold: {})", current_rsi, self.rsi_overbought
             )
-            evidence.append(
-                f"Price near upper Bollinger Band: ${current_price:.2f} "
-                f"(band: ${current_upper_bb:.2f})"
+            evidence.add(
+                "Price near upper Bollinger Band: ${:.2f} (band: ${:.2f})",
+                current_price,
+                current_upper_bb,
             )
-            evidence.append(f"Band position: {bb_position * 100:.1f}% of range")
+            evidence.add("Band position: {:.1f}% of range", bb_position * 100)
 
-            # Calculate confidence
             rsi_extremity = (current_rsi - self.rsi_overbought) / (100 - self.rsi_overbought)
-            rsi_boost = min(Decimal(str(rsi_extremity * 0.3)), Decimal("0.3"))
-
-            bb_boost = Decimal(str((bb_position - 0.8) * 0.2))
-
-            base_confidence = Decimal("0.65")
-
-            if volume_ratio > 1.3:
-                evidence.append(f"High volume confirming: {volume_ratio:.1f}x average")
-                volume_boost = Decimal("0.1")
-            else:
-                evidence.append(f"Volume: {volume_ratio:.1f}x average")
-                volume_boost = Decimal("0")
-
-            confidence_score = min(
-                base_confidence + rsi_boost + bb_boost + volume_boost, Decimal("0.95")
-            )
+            confidence_score = float(_extreme_score(rsi_extremity, bb_position - 0.8, volume_ratio))
+            _add_volume_evidence(evidence, volume_ratio)
 
             if band_width_pct > 10:
-                evidence.append(f"⚠ High volatility: Band width {band_width_pct:.1f}%")
+                evidence.add("⚠ High volatility: Band width {:.1f}%", band_width_pct)
 
         # Potential reversal zones (lower confidence)
         elif current_rsi < 40 and bb_position < 0.3:
             action = ActionType.BUY
-            evidence.append(
-                f"Weak oversold signal: RSI {current_rsi:.1f}, BB position {bb_position * 100:.1f}%"
+            evidence.add(
+                "Weak oversold signal: RSI {:.1f}, BB position {:.1f}%",
+                current_rsi,
+                bb_position * 100,
             )
-            evidence.append(f"Current price: ${current_price:.2f}")
-            evidence.append(f"Middle band (mean): ${current_middle_bb:.2f}")
-            evidence.append("Price below mean - potential reversal zone")
+            evidence.add("Current price: ${:.2f}", current_price)
+            evidence.add("Middle band (mean): ${:.2f}", current_middle_bb)
+            evidence.add("Price below mean - potential reversal zone")
 
-            confidence_score = Decimal("0.45")
+            confidence_score = 0.45
 
         elif current_rsi > 60 and bb_position > 0.7:
             action = ActionType.SELL
-            evidence.append(
-                f"Weak overbought signal: RSI {current_rsi:.1f}, "
-                f"BB position {bb_position * 100:.1f}%"
+            evidence.add(
+                "Weak overbought signal: RSI {:.1f}, BB position {:.1f}%",
+                current_rsi,
+                bb_position * 100,
             )
-            evidence.append(f"Current price: ${current_price:.2f}")
-            evidence.append(f"Middle band (mean): ${current_middle_bb:.2f}")
-            evidence.append("Price above mean - potential reversal zone")
+            evidence.add("Current price: ${:.2f}", current_price)
+            evidence.add("Middle band (mean): ${:.2f}", current_middle_bb)
+            evidence.add("Price above mean - potential reversal zone")
 
-            confidence_score = Decimal("0.45")
+            confidence_score = 0.45
 
         # HOLD - normal range
         else:
             action = ActionType.HOLD
-            evidence.append(
-                f"RSI in normal range: {current_rsi:.1f} "
-                f"({self.rsi_oversold}-{self.rsi_overbought})"
+            evidence.add(
+                "RSI in normal range: {:.1f} ({}-{})",
+                current_rsi,
+                self.rsi_oversold,
+                self.rsi_overbought,
             )
-            evidence.append(f"Price within Bollinger Bands: ${current_price:.2f}")
-            evidence.append(
-                f"Band position: {bb_position * 100:.1f}% "
-                f"(lower: ${current_lower_bb:.2f}, upper: ${current_upper_bb:.2f})"
+            evidence.add("Price within Bollinger Bands: ${:.2f}", current_price)
+            evidence.add(
+                "Band position: {:.1f}% (lower: ${:.2f}, upper: ${:.2f})",
+                bb_position * 100,
+                current_lower_bb,
+                current_upper_bb,
             )
-            evidence.append("No clear mean reversion signal")
+            evidence.add("No clear mean reversion signal")
 
             # Distance from mean affects confidence
             distance_from_mean = abs(bb_position - 0.5)
             if distance_from_mean < 0.15:
-                evidence.append("Price very close to mean - stable")
-                confidence_score = Decimal("0.60")
+                evidence.add("Price very close to mean - stable")
+                confidence_score = 0.60
             else:
-                evidence.append("Monitor for breakout or reversal")
-                confidence_score = Decimal("0.50")
+                evidence.add("Monitor for breakout or reversal")
+                confidence_score = 0.50
 
         # Risk assessment
-        risk_assessment = {
-            "rsi": Decimal(str(current_rsi)),
-            "bb_position": Decimal(str(bb_position)),
-            "volatility": Decimal(str(current_vol)),
-            "band_width_pct": Decimal(str(band_width_pct)),
-            "volume_ratio": Decimal(str(volume_ratio)),
-        }
+        risk_assessment = MeanReversionRisk(
+            rsi=current_rsi,
+            bb_position=bb_position,
+            volatility=current_vol,
+            band_width_pct=band_width_pct,
+            volume_ratio=volume_ratio,
+        )
 
         # Market context
-        market_context = {
-            "current_price": Decimal(str(current_price)),
-            "upper_bb": Decimal(str(current_upper_bb)),
-            "middle_bb": Decimal(str(current_middle_bb)),
-            "lower_bb": Decimal(str(current_lower_bb)),
-            "rsi": Decimal(str(current_rsi)),
-            "mean_reversion_zone": "oversold"
+        market_context = MeanReversionContext(
+            current_price=current_price,
+            upper_bb=current_upper_bb,
+            middle_bb=current_middle_bb,
+            lower_bb=current_lower_bb,
+            rsi=current_rsi,
+            mean_reversion_zone="oversold"
             if current_rsi < 40
             else "overbought"
             if current_rsi > 60
             else "neutral",
-        }
+        )
 
         confidence_level = self.calculate_confidence_level(confidence_score)
 
@@ -14,20 +14,73 @@ Confidence based on:
 - Trend consistency
 """
 
-from decimal import Decimal
+import math
+from typing import NamedTuple
 
+import numpy as np
 import pandas as pd
 
+from cryptopilot.analysis.features import FeatureFrame
+from cryptopilot.analysis.frames import OHLCVFrame
 from cryptopilot.analysis.indicators import (
-    calculate_ema,
-    calculate_macd,
-    calculate_volatility,
+    crossover_directions,
     detect_crossover,
+    last_value,
+    rate_of_change,
+)
+from cryptopilot.analysis.strategies.base import (
+    AnalysisResult,
+    Evidence,
+    StrategyBase,
 )
-from cryptopilot.analysis.strategies.base import AnalysisResult, StrategyBase
 from cryptopilot.database.models import ActionType
 
 
+class MomentumRisk(NamedTuple):
+    """Readings behind a momentum signal."""
+
+    macd: float
+    signal: float
+    histogram: float
+    momentum_pct: float
+    momentum_strength: float
+    volatility: float
+    volume_ratio: float
+
+
+class MomentumContext(NamedTuple):
+    """Market state seen by the momentum strategy."""
+
+    current_price: float
+    ema_fast: float
+    ema_slow: float
+    macd_trend: str
+    histogram_trend: str
+    momentum_direction: str
+
+
+def _confirmed_score(
+    momentum_strength: float | np.ndarray,
+    volume_ratio: float | np.ndarray,
+    strengthening: bool | np.ndarray,
+) -> np.ndarray:
+    """Confidence of a crossover confirmed by momentum, capped at 0.95."""
+    momentum_boost = np.minimum(momentum_strength / 100 * 0.15, 0.15)
+    volume_boost = np.select([volume_ratio > 1.3, volume_ratio > 1.0], [0.1, 0.05], 0.0)
+    hist_boost = np.where(strengthening, 0.05, 0.0)
+    return np.asarray(np.minimum(0.70 + momentum_boost + volume_boost + hist_boost, 0.95))
+
+
+def _add_volume_evidence(evidence: Evidence, volume_ratio: float) -> None:
+    """Record the volume reading that feeds ``_confirmed_score``."""
+    if volume_ratio > 1.3:
+        evidence.add("Strong volume confirming: {:.1f}x average", volume_ratio)
+    elif volume_ratio > 1.0:
+        evidence.add("Volume confirming: {:.1f}x average", volume_ratio)
+    else:
+        evidence.add("Weak volume: {:.1f}x average", volume_ratio)
+
+
 class MomentumStrategy(StrategyBase):
     """MACD-based momentum strategy.
 
@@ -58,50 +111,81 @@ class MomentumStrategy(StrategyBase):
         """Need enough data for MACD + momentum calculation."""
         return max(self.macd_slow, self.momentum_period) + self.macd_signal + 20
 
-    def analyze(self, data: pd.DataFrame) -> AnalysisResult:
+    def analyze_batch(self, data: OHLCVFrame | FeatureFrame) -> pd.DataFrame:
+        """Vectorized :meth:`analyze` over every bar (see ``StrategyBase.analyze_batch``)."""
+        features = self.prepare_features(data)
+
+        macd_line, signal_line, histogram = features.macd(
+            self.macd_fast, self.macd_slow, self.macd_signal
+        )
+        crossover = crossover_directions(macd_line, signal_line, self.crossover_lookback)
+
+        macd = macd_line.to_numpy()
+        signal = signal_line.to_numpy()
+        hist = histogram.to_numpy()
+        momentum = np.nan_to_num(features.rate_of_change(self.momentum_period).to_numpy(), nan=0.0)
+        volume_ratio = features.volume_ratios()
+
+        strengthening = np.zeros(hist.shape[0], dtype=bool)
+        strengthening[1:] = np.abs(hist[1:]) > np.abs(hist[:-1])
+        momentum_strength = np.minimum(np.abs(momentum), 50) / 50 * 100
+
+        confirmed_score = _confirmed_score(momentum_strength, volume_ratio, strengthening)
+
+        strong = np.abs(momentum) > 10
+        consolidating = (np.abs(hist) < 0.5) & (np.abs(momentum) < 5)
+
+        return self._select_signals(
+            features.data,
+            [
+                ((crossover == 1) & (momentum > 0), ActionType.BUY, confirmed_score),
+                ((crossover == -1) & (momentum < 0), ActionType.SELL, confirmed_score),
+                (crossover == 1, ActionType.BUY, 0.50),
+                (crossover == -1, ActionType.SELL, 0.50),
+                (strong & (macd > signal) & (momentum > 0), ActionType.HOLD, 0.65),
+                (strong & (macd < signal) & (momentum < 0), ActionType.HOLD, 0.65),
+            ],
+            default=(ActionType.HOLD, np.where(consolidating, 0.55, 0.45)),
+        )
+
+    def analyze(self, data: OHLCVFrame | FeatureFrame) -> AnalysisResult:
         """Analyze using MACD and price momentum.
 
         Args:
-            data: OHLCV DataFrame
+            data: OHLCV DataFrame (pandas or polars) or a shared FeatureFrame
 
         Returns:
             AnalysisResult with BUY/SELL/HOLD recommendation
         """
-        self.validate_data(data)
+        features = self.prepare_features(data)
 
         # Calculate indicators
-        close = data["close"]
-        volume = data["volume"]
+        close = features.close
 
-        macd_line, signal_line, histogram = calculate_macd(
-            close, self.macd_fast, self.macd_slow, self.macd_signal
+        # One MACD pass also yields the fast/slow EMAs reported in the context
+        macd_line, signal_line, histogram, ema_fast, ema_slow = features.macd_components(
+            self.macd_fast, self.macd_slow, self.macd_signal
         )
-        ema_fast = calculate_ema(close, self.macd_fast)
-        ema_slow = calculate_ema(close, self.macd_slow)
-        volatility = calculate_volatility(close, period=20)
-
-        # Price momentum (rate of change)
-        price_momentum = close.pct_change(self.momentum_period) * 100
 
         # Current values
-        current_price = float(close.iloc[-1])
-        current_macd = float(macd_line.iloc[-1])
-        current_signal = float(signal_line.iloc[-1])
-        current_histogram = float(histogram.iloc[-1])
-        current_momentum = (
-            float(price_momentum.iloc[-1]) if not pd.isna(price_momentum.iloc[-1]) else 0.0
-        )
-        current_ema_fast = float(ema_fast.iloc[-1])
-        current_ema_slow = float(ema_slow.iloc[-1])
-        current_vol = float(volatility.iloc[-1]) if not pd.isna(volatility.iloc[-1]) else 0.0
+        current_price = last_value(close)
+        current_macd = last_value(macd_line)
+        current_signal = last_value(signal_line)
+        current_histogram = last_value(histogram)
+        current_ema_fast = last_value(ema_fast)
+        current_ema_slow = last_value(ema_slow)
+        current_vol = last_value(features.volatility(20), default=0.0)
+
+        # Price momentum (rate of change over momentum_period bars)
+        current_momentum = rate_of_change(close, self.momentum_period)
+        if math.isnan(current_momentum):
+            current_momentum = 0.0
 
         # Detect MACD crossover
         crossover = detect_crossover(macd_line, signal_line, self.crossover_lookback)
 
         # Volume analysis
-        avg_volume = float(volume.tail(20).mean())
-        recent_volume = float(volume.tail(5).mean())
-        volume_ratio = recent_volume / avg_volume if avg_volume > 0 else 1.0
+        volume_ratio = features.volume_ratio()
 
         # Histogram trend (is momentum strengthening?)
         hist_values = histogram.tail(5).values
@@ -115,171 +199,149 @@ class MomentumStrategy(StrategyBase):
         momentum_strength = min(abs(current_momentum), 50) / 50 * 100
 
         # Decision logic
-        evidence: list[str] = []
+        evidence = Evidence()
         action: ActionType
-        confidence_score: Decimal
+        confidence_score: float
 
         # BULLISH MOMENTUM - BUY
         if crossover == "bullish" and current_momentum > 0:
             action = ActionType.BUY
-            evidence.append(
-                f"MACD bullish crossover: MACD ({current_macd:.4f}) crossed above "
-                f"Signal ({current_signal:.4f})"
+            evidence.add(
+                "MACD bullish crossover: MACD ({:.4f}) crossed above Signal ({:.4f})",
+                current_macd,
+                current_signal,
             )
-            evidence.append(
-                f"Positive momentum: Price up {current_momentum:.1f}% over {self.momentum_period} periods"
+            evidence.add(
+                "Positive momentum: Price up {:.1f}% over {} periods",
+                current_momentum,
+                self.momentum_period,
             )
-            evidence.append(f"Current price: ${current_price:.2f}")
-            evidence.append(
-                f"MACD histogram: {current_histogram:.4f} ({'strengthening' if histogram_trend == 'strengthening' else 'weakening'})"
-            )
-
-            # Base confidence from strong crossover
-            base_confidence = Decimal("0.70")
+            evidence.add("Current price: ${:.2f}", current_price)
+            evidence.add("MACD histogram: {:.4f} ({})", current_histogram, histogram_trend)
 
-            # Boost from momentum strength
-            momentum_boost = min(Decimal(str(momentum_strength / 100 * 0.15)), Decimal("0.15"))
-
-            # Volume confirmation
-            if volume_ratio > 1.3:
-                evidence.append(f"Strong volume confirming: {volume_ratio:.1f}x average")
-                volume_boost = Decimal("0.1")
-            elif volume_ratio > 1.0:
-                evidence.append(f"Volume confirming: {volume_ratio:.1f}x average")
-                volume_boost = Decimal("0.05")
-            else:
-                evidence.append(f"Weak volume: {volume_ratio:.1f}x average")
-                volume_boost = Decimal("0")
-
-            # Histogram strengthening adds confidence
+            # Volume confirmation and a strengthening histogram add confidence
+            _add_volume_evidence(evidence, volume_ratio)
             if histogram_trend == "strengthening":
-                evidence.append("Momentum accelerating")
-                hist_boost = Decimal("0.05")
-            else:
-                hist_boost = Decimal("0")
+                evidence.add("Momentum accelerating")
 
-            confidence_score = min(
-                base_confidence + momentum_boost + volume_boost + hist_boost, Decimal("0.95")
+            confidence_score = float(
+                _confirmed_score(
+                    momentum_strength, volume_ratio, histogram_trend == "strengthening"
+                )
             )
 
         # BEARISH MOMENTUM - SELL
         elif crossover == "bearish" and current_momentum < 0:
             action = ActionType.SELL
-            evidence.append(
-                f"MACD bearish crossover: MACD ({current_macd:.4f}) crossed below "
-                f"Signal ({current_signal:.4f})"
+            evidence.add(
+                "MACD bearish crossover: MACD ({:.4f}) crossed below Signal ({:.4f})",
+                current_macd,
+                current_signal,
             )
-            evidence.append(
-                f"Negative momentum: Price down {abs(current_momentum):.1f}% over {self.momentum_period} periods"
+            evidence.add(
+                "Negative momentum: Price down {:.1f}% over {} periods",
+                abs(current_momentum),
+                self.momentum_period,
             )
-            evidence.append(f"Current price: ${current_price:.2f}")
-            evidence.append(
-                f"MACD histogram: {current_histogram:.4f} ({'strengthening' if histogram_trend == 'strengthening' else 'weakening'})"
-            )
-
-            base_confidence = Decimal("0.70")
-            momentum_boost = min(Decimal(str(momentum_strength / 100 * 0.15)), Decimal("0.15"))
-
-            if volume_ratio > 1.3:
-                evidence.append(f"Strong volume confirming: {volume_ratio:.1f}x average")
-                volume_boost = Decimal("0.1")
-            elif volume_ratio > 1.0:
-                evidence.append(f"Volume confirming: {volume_ratio:.1f}x average")
-                volume_boost = Decimal("0.05")
-            else:
-                evidence.append(f"Weak volume: {volume_ratio:.1f}x average")
-                volume_boost = Decimal("0")
+            evidence.add("Current price: ${:.2f}", current_price)
+            evidence.add("MACD histogram: {:.4f} ({})", current_histogram, histogram_trend)
 
+            _add_volume_evidence(evidence, volume_ratio)
             if histogram_trend == "strengthening":
-                evidence.append("Downward momentum accelerating")
-                hist_boost = Decimal("0.05")
-            else:
-                hist_boost = Decimal("0")
+                evidence.add("Downward momentum accelerating")
 
-            confidence_score = min(
-                base_confidence + momentum_boost + volume_boost + hist_boost, Decimal("0.95")
+            confidence_score = float(
+                _confirmed_score(
+                    momentum_strength, volume_ratio, histogram_trend == "strengthening"
+                )
             )
 
         # Crossover without momentum confirmation (lower confidence)
         elif crossover == "bullish":
             action = ActionType.BUY
-            evidence.append(f"MACD bullish crossover but weak momentum: {current_momentum:.1f}%")
-            evidence.append(f"Current price: ${current_price:.2f}")
-            evidence.append("⚠ Momentum not confirming - proceed with caution")
-            confidence_score = Decimal("0.50")
+            evidence.add("MACD bullish crossover but weak momentum: {:.1f}%", current_momentum)
+            evidence.add("Current price: ${:.2f}", current_price)
+            evidence.add("⚠ Momentum not confirming - proceed with caution")
+            confidence_score = 0.50
 
         elif crossover == "bearish":
             action = ActionType.SELL
-            evidence.append(f"MACD bearish crossover but weak momentum: {current_momentum:.1f}%")
-            evidence.append(f"Current price: ${current_price:.2f}")
-            evidence.append("⚠ Momentum not confirming - proceed with caution")
-            confidence_score = Decimal("0.50")
+            evidence.add("MACD bearish crossover but weak momentum: {:.1f}%", current_momentum)
+            evidence.add("Current price: ${:.2f}", current_price)
+            evidence.add("⚠ Momentum not confirming - proceed with caution")
+            confidence_score = 0.50
 
         # Strong momentum without recent crossover
         elif abs(current_momentum) > 10 and current_macd > current_signal and current_momentum > 0:
             action = ActionType.HOLD
-            evidence.append(
-                f"Strong upward momentum: {current_momentum:.1f}% over {self.momentum_period} periods"
+            evidence.add(
+                "Strong upward momentum: {:.1f}% over {} periods",
+                current_momentum,
+                self.momentum_period,
             )
-            evidence.append(f"MACD above signal: {current_macd:.4f} > {current_signal:.4f}")
-            evidence.append(f"Current price: ${current_price:.2f}")
-            evidence.append("Riding existing momentum - no new entry signal")
-            confidence_score = Decimal("0.65")
+            evidence.add("MACD above signal: {:.4f} > {:.4f}", current_macd, current_signal)
+            evidence.add("Current price: ${:.2f}", current_price)
+            evidence.add("Riding existing momentum - no new entry signal")
+            confidence_score = 0.65
 
         elif abs(current_momentum) > 10 and current_macd < current_signal and current_momentum < 0:
             action = ActionType.HOLD
-            evidence.append(
-                f"Strong downward momentum: {abs(current_momentum):.1f}% over {self.momentum_period} periods"
+            evidence.add(
+                "Strong downward momentum: {:.1f}% over {} periods",
+                abs(current_momentum),
+                self.momentum_period,
             )
-            evidence.append(f"MACD below signal: {current_macd:.4f} < {current_signal:.4f}")
-            evidence.append(f"Current price: ${current_price:.2f}")
-            evidence.append("In downtrend - wait for reversal signal")
-            confidence_score = Decimal("0.65")
+            evidence.add("MACD below signal: {:.4f} < {:.4f}", current_macd, current_signal)
+            evidence.add("Current price: ${:.2f}", current_price)
+            evidence.add("In downtrend - wait for reversal signal")
+            confidence_score = 0.65
 
         # HOLD - no clear momentum
         else:
             action = ActionType.HOLD
-            evidence.append(
-                f"Weak momentum: {current_momentum:.1f}% over {self.momentum_period} periods"
+            evidence.add(
+                "Weak momentum: {:.1f}% over {} periods", current_momentum, self.momentum_period
             )
-            evidence.append(
-                f"MACD: {current_macd:.4f}, Signal: {current_signal:.4f}, "
-                f"Histogram: {current_histogram:.4f}"
+            evidence.add(
+                "MACD: {:.4f}, Signal: {:.4f}, Histogram: {:.4f}",
+                current_macd,
+                current_signal,
+                current_histogram,
             )
-            evidence.append(f"Current price: ${current_price:.2f}")
+            evidence.add("Current price: ${:.2f}", current_price)
 
             # Check if consolidating
             if abs(current_histogram) < 0.5 and abs(current_momentum) < 5:
-                evidence.append("Market consolidating - wait for breakout")
-                confidence_score = Decimal("0.55")
+                evidence.add("Market consolidating - wait for breakout")
+                confidence_score = 0.55
             else:
-                evidence.append("Mixed signals - no clear direction")
-                confidence_score = Decimal("0.45")
+                evidence.add("Mixed signals - no clear direction")
+                confidence_score = 0.45
 
         # Risk assessment
-        risk_assessment = {
-            "macd": Decimal(str(current_macd)),
-            "signal": Decimal(str(current_signal)),
-            "histogram": Decimal(str(current_histogram)),
-            "momentum_pct": Decimal(str(current_momentum)),
-            "momentum_strength": Decimal(str(momentum_strength)),
-            "volatility": Decimal(str(current_vol)),
-            "volume_ratio": Decimal(str(volume_ratio)),
-        }
+        risk_assessment = MomentumRisk(
+            macd=current_macd,
+            signal=current_signal,
+            histogram=current_histogram,
+            momentum_pct=current_momentum,
+            momentum_strength=momentum_strength,
+            volatility=current_vol,
+            volume_ratio=volume_ratio,
+        )
 
         # Market context
-        market_context = {
-            "current_price": Decimal(str(current_price)),
-            "ema_fast": Decimal(str(current_ema_fast)),
-            "ema_slow": Decimal(str(current_ema_slow)),
-            "macd_trend": "bullish" if current_macd > current_signal else "bearish",
-            "histogram_trend": histogram_trend,
-            "momentum_direction": "up"
+        market_context = MomentumContext(
+            current_price=current_price,
+            ema_fast=current_ema_fast,
+            ema_slow=current_ema_slow,
+            macd_trend="bullish" if current_macd > current_signal else "bearish",
+            histogram_trend=histogram_trend,
+            momentum_direction="up"
             if current_momentum > 0
             else "down"
             if current_momentum < 0
             else "flat",
-        }
+        )
 
         confidence_level = self.calculate_confidence_level(confidence_score)
 
@@ -11,19 +11,57 @@ Confidence is based on:
 - Recent trend consistency
 """
 
-from decimal import Decimal
+from typing import NamedTuple
 
+import numpy as np
 import pandas as pd
 
-from cryptopilot.analysis.indicators import (
-    calculate_sma,
-    calculate_volatility,
-    detect_crossover,
+from cryptopilot.analysis.features import FeatureFrame
+from cryptopilot.analysis.frames import OHLCVFrame
+from cryptopilot.analysis.indicators import crossover_directions, detect_crossover, last_value
+from cryptopilot.analysis.strategies.base import (
+    AnalysisResult,
+    Evidence,
+    StrategyBase,
 )
-from cryptopilot.analysis.strategies.base import AnalysisResult, StrategyBase
 from cryptopilot.database.models import ActionType
 
 
+class TrendRisk(NamedTuple):
+    """Readings behind a trend following signal."""
+
+    volatility: float
+    separation_pct: float
+    volume_ratio: float
+
+
+class TrendContext(NamedTuple):
+    """Market state seen by the trend following strategy."""
+
+    current_price: float
+    fast_sma: float
+    slow_sma: float
+    trend: str
+
+
+def _crossover_score(
+    separation_pct: float | np.ndarray,
+    volume_ratio: float | np.ndarray,
+) -> np.ndarray:
+    """Confidence of a golden/death cross, capped at 0.95."""
+    base_confidence = np.where(volume_ratio > 1.2, 0.75, 0.65)
+    sep_boost = np.minimum(separation_pct / 100, 0.15)
+    return np.asarray(np.minimum(base_confidence + sep_boost, 0.95))
+
+
+def _add_volume_evidence(evidence: Evidence, volume_ratio: float) -> None:
+    """Record the volume reading that feeds ``_crossover_score``."""
+    if volume_ratio > 1.2:
+        evidence.add("Volume confirming: {:.1f}x average", volume_ratio)
+    else:
+        evidence.add("Volume neutral: {:.1f}x average", volume_ratio)
+
+
 class TrendFollowingStrategy(StrategyBase):
     """Dual SMA crossover strategy.
 
@@ -48,30 +86,50 @@ class TrendFollowingStrategy(StrategyBase):
         """Need enough data for slow SMA plus crossover lookback."""
         return self.slow_period + self.crossover_lookback
 
-    def analyze(self, data: pd.DataFrame) -> AnalysisResult:
+    def analyze_batch(self, data: OHLCVFrame | FeatureFrame) -> pd.DataFrame:
+        """Vectorized :meth:`analyze` over every bar (see ``StrategyBase.analyze_batch``)."""
+        features = self.prepare_features(data)
+
+        fast_sma = features.sma(self.fast_period)
+        slow_sma = features.sma(self.slow_period)
+        crossover = crossover_directions(fast_sma, slow_sma, self.crossover_lookback)
+
+        fast = fast_sma.to_numpy()
+        slow = slow_sma.to_numpy()
+        separation_pct = np.abs((fast - slow) / slow * 100)
+        volume_ratio = features.volume_ratios()
+
+        cross_score = _crossover_score(separation_pct, volume_ratio)
+
+        return self._select_signals(
+            features.data,
+            [
+                (crossover == 1, ActionType.BUY, cross_score),
+                (crossover == -1, ActionType.SELL, cross_score),
+            ],
+            default=(ActionType.HOLD, np.where(separation_pct > 5, 0.70, 0.50)),
+        )
+
+    def analyze(self, data: OHLCVFrame | FeatureFrame) -> AnalysisResult:
         """Analyze trend using SMA crossover.
 
         Args:
-            data: OHLCV DataFrame
+            data: OHLCV DataFrame (pandas or polars) or a shared FeatureFrame
 
         Returns:
             AnalysisResult with BUY/SELL/HOLD recommendation
         """
-        self.validate_data(data)
+        features = self.prepare_features(data)
 
         # Calculate indicators
-        close = data["close"]
-        volume = data["volume"]
-
-        fast_sma = calculate_sma(close, self.fast_period)
-        slow_sma = calculate_sma(close, self.slow_period)
-        volatility = calculate_volatility(close, period=20)
+        fast_sma = features.sma(self.fast_period)
+        slow_sma = features.sma(self.slow_period)
 
         # Current values
-        current_price = float(close.iloc[-1])
-        current_fast = float(fast_sma.iloc[-1])
-        current_slow = float(slow_sma.iloc[-1])
-        current_vol = float(volatility.iloc[-1]) if not pd.isna(volatility.iloc[-1]) else 0.0
+        current_price = last_value(features.close)
+        current_fast = last_value(fast_sma)
+        current_slow = last_value(slow_sma)
+        current_vol = last_value(features.volatility(20), default=0.0)
 
         # Detect crossover
         crossover = detect_crossover(fast_sma, slow_sma, self.crossover_lookback)
@@ -80,105 +138,93 @@ class TrendFollowingStrategy(StrategyBase):
         separation_pct = abs((current_fast - current_slow) / current_slow * 100)
 
         # Volume analysis (compare recent to average)
-        avg_volume = float(volume.tail(20).mean())
-        recent_volume = float(volume.tail(5).mean())
-        volume_ratio = recent_volume / avg_volume if avg_volume > 0 else 1.0
+        volume_ratio = features.volume_ratio()
 
         # Decision logic
-        evidence: list[str] = []
+        evidence = Evidence()
         action: ActionType
-        confidence_score: Decimal
+        confidence_score: float
 
         if crossover == "bullish":
             action = ActionType.BUY
-            evidence.append(
-                f"Golden cross: Fast SMA ({self.fast_period}) crossed above "
-                f"Slow SMA ({self.slow_period})"
+            evidence.add(
+                "Golden cross: Fast SMA ({}) crossed above Slow SMA ({})",
+                self.fast_period,
+                self.slow_period,
             )
-            evidence.append(f"Current price: ${current_price:.2f}")
-            evidence.append(f"Fast SMA: ${current_fast:.2f}, Slow SMA: ${current_slow:.2f}")
+            evidence.add("Current price: ${:.2f}", current_price)
+            evidence.add("Fast SMA: ${:.2f}, Slow SMA: ${:.2f}", current_fast, current_slow)
 
-            # Higher confidence if volume confirms
-            if volume_ratio > 1.2:
-                evidence.append(f"Volume confirming: {volume_ratio:.1f}x average")
-                base_confidence = Decimal("0.75")
-            else:
-                evidence.append(f"Volume neutral: {volume_ratio:.1f}x average")
-                base_confidence = Decimal("0.65")
-
-            # Adjust for separation strength
-            sep_boost = min(Decimal(str(separation_pct / 100)), Decimal("0.15"))
-            confidence_score = min(base_confidence + sep_boost, Decimal("0.95"))
+            # Volume confirmation and separation strength raise confidence
+            _add_volume_evidence(evidence, volume_ratio)
+            confidence_score = float(_crossover_score(separation_pct, volume_ratio))
 
         elif crossover == "bearish":
             action = ActionType.SELL
-            evidence.append(
-                f"Death cross: Fast SMA ({self.fast_period}) crossed below "
-                f"Slow SMA ({self.slow_period})"
+            evidence.add(
+                "Death cross: Fast SMA ({}) crossed below Slow SMA ({})",
+                self.fast_period,
+                self.slow_period,
             )
-            evidence.append(f"Current price: ${current_price:.2f}")
-            evidence.append(f"Fast SMA: ${current_fast:.2f}, Slow SMA: ${current_slow:.2f}")
-
-            if volume_ratio > 1.2:
-                evidence.append(f"Volume confirming: {volume_ratio:.1f}x average")
-                base_confidence = Decimal("0.75")
-            else:
-                evidence.append(f"Volume neutral: {volume_ratio:.1f}x average")
-                base_confidence = Decimal("0.65")
+            evidence.add("Current price: ${:.2f}", current_price)
+            evidence.add("Fast SMA: ${:.2f}, Slow SMA: ${:.2f}", current_fast, current_slow)
 
-            sep_boost = min(Decimal(str(separation_pct / 100)), Decimal("0.15"))
-            confidence_score = min(base_confidence + sep_boost, Decimal("0.95"))
+            _add_volume_evidence(evidence, volume_ratio)
+            confidence_score = float(_crossover_score(separation_pct, volume_ratio))
 
         else:
             # No recent crossover - check current position
             if current_fast > current_slow:
                 # In uptrend but no recent signal
                 action = ActionType.HOLD
-                evidence.append(
-                    f"Uptrend: Fast SMA (${current_fast:.2f}) above Slow SMA (${current_slow:.2f})"
+                evidence.add(
+                    "Uptrend: Fast SMA (${:.2f}) above Slow SMA (${:.2f})",
+                    current_fast,
+                    current_slow,
                 )
-                evidence.append(f"Separation: {separation_pct:.1f}%")
-                evidence.append("No recent crossover - holding pattern")
+                evidence.add("Separation: {:.1f}%", separation_pct)
+                evidence.add("No recent crossover - holding pattern")
 
                 # Higher confidence for stronger trends
                 if separation_pct > 5:
-                    confidence_score = Decimal("0.70")
-                    evidence.append("Strong uptrend continuation")
+                    confidence_score = 0.70
+                    evidence.add("Strong uptrend continuation")
                 else:
-                    confidence_score = Decimal("0.50")
-                    evidence.append("Weak uptrend - monitor closely")
+                    confidence_score = 0.50
+                    evidence.add("Weak uptrend - monitor closely")
 
             else:
                 # In downtrend but no recent signal
                 action = ActionType.HOLD
-                evidence.append(
-                    f"Downtrend: Fast SMA (${current_fast:.2f}) below "
-                    f"Slow SMA (${current_slow:.2f})"
+                evidence.add(
+                    "Downtrend: Fast SMA (${:.2f}) below Slow SMA (${:.2f})",
+                    current_fast,
+                    current_slow,
                 )
-                evidence.append(f"Separation: {separation_pct:.1f}%")
-                evidence.append("No recent crossover - holding pattern")
+                evidence.add("Separation: {:.1f}%", separation_pct)
+                evidence.add("No recent crossover - holding pattern")
 
                 if separation_pct > 5:
-                    confidence_score = Decimal("0.70")
-                    evidence.append("Strong downtrend continuation")
+                    confidence_score = 0.70
+                    evidence.add("Strong downtrend continuation")
                 else:
-                    confidence_score = Decimal("0.50")
-                    evidence.append("Weak downtrend - monitor closely")
+                    confidence_score = 0.50
+                    evidence.add("Weak downtrend - monitor closely")
 
         # Risk assessment
-        risk_assessment = {
-            "volatility": Decimal(str(current_vol)),
-            "separation_pct": Decimal(str(separation_pct)),
-            "volume_ratio": Decimal(str(volume_ratio)),
-        }
+        risk_assessment = TrendRisk(
+            volatility=current_vol,
+            separation_pct=separation_pct,
+            volume_ratio=volume_ratio,
+        )
 
         # Market context
-        market_context = {
-            "current_price": Decimal(str(current_price)),
-            "fast_sma": Decimal(str(current_fast)),
-            "slow_sma": Decimal(str(current_slow)),
-            "trend": "up" if current_fast > current_slow else "down",
-        }
+        market_context = TrendContext(
+            current_price=current_price,
+            fast_sma=current_fast,
+            slow_sma=current_slow,
+            trend="up" if current_fast > current_slow else "down",
+        )
 
         confidence_level = self.calculate_confidence_level(confidence_score)
 
@@ -21,22 +21,29 @@ app = typer.Typer(
 
 
 def setup_logging(verbose: bool = False) -> None:
-    """Configure logging for the CLI."""
+    """Configure logging for the CLI.
+
+    The Rich handler is installed on the first call only; later calls (the
+    app invoked again in-process) just update the level.
+    """
     level = logging.DEBUG if verbose else logging.INFO
 
-    logging.basicConfig(
-        level=level,
-        format="%(message)s",
-        datefmt="[%X]",
-        handlers=[
-            RichHandler(
-                console=console,
-                rich_tracebacks=True,
-                show_time=True,
-                show_path=False,
-            ),
-        ],
-    )
+    root = logging.getLogger()
+    if not any(isinstance(handler, RichHandler) for handler in root.handlers):
+        logging.basicConfig(
+            level=level,
+            format="%(message)s",
+            datefmt="[%X]",
+            handlers=[
+                RichHandler(
+                    console=console,
+                    rich_tracebacks=True,
+                    show_time=True,
+                    show_path=False,
+                ),
+            ],
+        )
+    root.setLevel(level)
 
 
 @app.callback()
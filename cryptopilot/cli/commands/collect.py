@@ -1,17 +1,17 @@
 import asyncio
 import logging
-from collections.abc import Sequence
 
 import typer
 from rich.console import Console
 
+from cryptopilot.cli.context import cli_context
 from cryptopilot.cli.formatters import print_collection_header, print_collection_summary
-from cryptopilot.collectors.gap_filler import GapFiller
+from cryptopilot.cli.parsers import parse_symbols, parse_timeframe
+from cryptopilot.collectors.gap_filler import GapCheckResult, GapFiller
 from cryptopilot.collectors.market_data import MarketDataCollector
 from cryptopilot.config.settings import get_settings
-from cryptopilot.database.connection import DatabaseConnection
 from cryptopilot.database.models import Timeframe
-from cryptopilot.database.repository import Repository
+from cryptopilot.database.pool import DEFAULT_MAX_IDLE
 from cryptopilot.providers.registry import create_provider
 from cryptopilot.utils.retry import RetryConfig
 
@@ -19,25 +19,6 @@ console = Console()
 logger = logging.getLogger(__name__)
 
 
-def _parse_symbols(arg: str | None, default_symbols: Sequence[str]) -> list[str]:
-    if arg is None:
-        return [s.upper() for s in default_symbols]
-
-    parts = [p.strip().upper() for p in arg.split(",") if p.strip()]
-    if not parts:
-        raise typer.BadParameter("At least one symbol must be provided")
-    return parts
-
-
-def _parse_timeframe(raw: str | None, default_tf: str) -> Timeframe:
-    value = (raw or default_tf).strip()
-    try:
-        return Timeframe(value)
-    except ValueError as exc:
-        allowed = ", ".join(tf.value for tf in Timeframe)
-        raise typer.BadParameter(f"Invalid timeframe '{value}'. Allowed: {allowed}") from exc
-
-
 async def _run_collect(
     symbols: list[str],
     timeframe: Timeframe,
@@ -48,128 +29,136 @@ async def _run_collect(
     fill_gaps: bool,
     dry_run: bool,
 ) -> None:
-    settings = get_settings()
+    async with cli_context() as ctx:
+        provider = create_provider(
+            provider_name,
+            api_key=ctx.settings.api.api_key,
+            request_timeout=ctx.settings.api.request_timeout,
+        )
+        provider_info = provider.get_info()
+
+        retry_cfg = RetryConfig(
+            max_retries=ctx.settings.api.max_retries,
+            exponential_base=ctx.settings.api.retry_backoff,
+        )
 
-    db = DatabaseConnection(
-        db_path=settings.database.path,
-        schema_path=settings.database.schema_path,
-    )
-    await db.initialize()
-
-    repo = Repository(db)
-
-    provider = create_provider(
-        provider_name,
-        api_key=settings.api.api_key,
-        request_timeout=settings.api.request_timeout,
-    )
-    provider_info = provider.get_info()
-
-    retry_cfg = RetryConfig(
-        max_retries=settings.api.max_retries,
-        exponential_base=settings.api.retry_backoff,
-    )
-
-    collector = MarketDataCollector(
-        repository=repo,
-        provider=provider,
-        provider_name=provider_name,
-        base_currency=settings.currency.base_currency,
-        batch_size=settings.data.batch_size,
-        retry_config=retry_cfg,
-    )
-
-    print_collection_header(
-        console,
-        provider_name=provider_info.name,
-        base_url=provider_info.base_url,
-        timeframe=timeframe.value,
-        base_currency=settings.currency.base_currency,
-        symbols=symbols,
-        days=days,
-        dry_run=dry_run,
-    )
-
-    results = await collector.collect(
-        symbols=symbols,
-        timeframe=timeframe,
-        lookback_days=days,
-        update_all=update_all,
-        continue_on_error=continue_on_error,
-        dry_run=dry_run,
-    )
-
-    print_collection_summary(console, results)
-
-    if dry_run or not results:
-        if dry_run:
-            console.print("[yellow]DRY RUN:[/yellow] no data was written to the database.")
-        return
-
-    if not (settings.data.gap_fill_check or fill_gaps):
-        return
-    else:
-        gap_filler = GapFiller(
-            repository=repo,
+        collector = MarketDataCollector(
+            repository=ctx.repo,
             provider=provider,
             provider_name=provider_name,
-            base_currency=settings.currency.base_currency,
-            batch_size=settings.data.batch_size,
+            base_currency=ctx.settings.currency.base_currency,
+            batch_size=ctx.settings.data.batch_size,
             retry_config=retry_cfg,
+            max_concurrency=ctx.settings.api.max_concurrent_requests,
         )
 
-        console.print(
-            "[dim]Running data integrity check for recent window (gap detection)...[/dim]"
+        print_collection_header(
+            console,
+            provider_name=provider_info.name,
+            base_url=provider_info.base_url,
+            timeframe=timeframe.value,
+            base_currency=ctx.settings.currency.base_currency,
+            symbols=symbols,
+            days=days,
+            dry_run=dry_run,
         )
-        total_issues = 0
 
-        for symbol in symbols:
-            try:
-                if fill_gaps:
-                    check, inserted = await gap_filler.fill_gaps_recent(
+        results = await collector.collect(
+            symbols=symbols,
+            timeframe=timeframe,
+            lookback_days=days,
+            update_all=update_all,
+            continue_on_error=continue_on_error,
+            dry_run=dry_run,
+        )
+
+        print_collection_summary(console, results)
+
+        if dry_run or not results:
+            if dry_run:
+                console.print("[yellow]DRY RUN:[/yellow] no data was written to the database.")
+            return
+
+        if not (ctx.settings.data.gap_fill_check or fill_gaps):
+            return
+        else:
+            gap_filler = GapFiller(
+                repository=ctx.repo,
+                provider=provider,
+                provider_name=provider_name,
+                base_currency=ctx.settings.currency.base_currency,
+                batch_size=ctx.settings.data.batch_size,
+                retry_config=retry_cfg,
+                max_concurrency=ctx.settings.api.max_concurrent_requests,
+            )
+
+            console.print(
+                "[dim]Running data integrity check for recent window (gap detection)...[/dim]"
+            )
+            total_issues = 0
+
+            # Detection only reads SQLite, so symbols are checked concurrently
+            # on the connection pool's warm connections; filling fetches the
+            # gaps of one symbol concurrently, so symbols go one at a time.
+            semaphore = asyncio.Semaphore(1 if fill_gaps else DEFAULT_MAX_IDLE)
+
+            async def _check(symbol: str) -> GapCheckResult:
+                async with semaphore:
+                    if fill_gaps:
+                        check, _inserted = await gap_filler.fill_gaps_recent(
+                            symbol=symbol,
+                            timeframe=timeframe,
+                            lookback_days=days,
+                            dry_run=dry_run,
+                        )
+                        return check
+                    return await gap_filler.detect_gaps_recent(
                         symbol=symbol,
                         timeframe=timeframe,
                         lookback_days=days,
-                        dry_run=dry_run,
+                    )
+
+            checks = await asyncio.gather(
+                *(_check(symbol) for symbol in symbols), return_exceptions=True
+            )
+
+            for symbol, check in zip(symbols, checks, strict=True):
+                if isinstance(check, BaseException):
+                    if not isinstance(check, Exception):
+                        raise check
+                    logger.error("Gap check failed for %s: %s", symbol, check, exc_info=check)
+                    console.print(f"[red]Gap check failed for {symbol}: {check}[/red]")
+                    continue
+
+                issues = check.issues_found
+                total_issues += issues
+
+                if issues == 0:
+                    logger.info(
+                        "Integrity check: no gaps detected for %s %s", symbol, timeframe.value
                     )
                 else:
-                    check = await gap_filler.detect_gaps_recent(
-                        symbol=symbol,
-                        timeframe=timeframe,
-                        lookback_days=days,
+                    logger.warning(
+                        "Integrity check: %d missing candles across %d gaps for %s %s",
+                        issues,
+                        len(check.gaps),
+                        symbol,
+                        timeframe.value,
+                    )
+                    console.print(
+                        f"[yellow]Integrity: {symbol} {timeframe.value} has "
+                        f"{issues} missing candles across {len(check.gaps)} gaps.[/yellow]"
                     )
-            except Exception as exc:
-                logger.exception("Gap check failed for %s: %s", symbol, exc)
-                console.print(f"[red]Gap check failed for {symbol}: {exc}[/red]")
-                continue
-
-            issues = check.issues_found
-            total_issues += issues
 
-            if issues == 0:
-                logger.info("Integrity check: no gaps detected for %s %s", symbol, timeframe.value)
-            else:
-                logger.warning(
-                    "Integrity check: %d missing candles across %d gaps for %s %s",
-                    issues,
-                    len(check.gaps),
-                    symbol,
-                    timeframe.value,
+            if total_issues == 0:
+                console.print(
+                    "[green]Data integrity check passed – no gaps detected in the checked window.[/green]"
                 )
+            else:
                 console.print(
-                    f"[yellow]Integrity: {symbol} {timeframe.value} has "
-                    f"{issues} missing candles across {len(check.gaps)} gaps.[/yellow]"
+                    f"[yellow]Data integrity check found {total_issues} missing candles in total.[/yellow]"
                 )
 
-        if total_issues == 0:
-            console.print(
-                "[green]Data integrity check passed – no gaps detected in the checked window.[/green]"
-            )
-        else:
-            console.print(
-                f"[yellow]Data integrity check found {total_issues} missing candles in total.[/yellow]"
-            )
-
 
 def collect_command(
     symbols: str = typer.Option(
@@ -223,8 +212,8 @@ def collect_command(
     """Collect market data from configured provider into the local database."""
     settings = get_settings()
 
-    symbol_list = _parse_symbols(symbols, settings.data.default_symbols)
-    tf = _parse_timeframe(timeframe, settings.data.default_timeframe)
+    symbol_list = parse_symbols(symbols, settings.data.default_symbols)
+    tf = parse_timeframe(timeframe, settings.data.default_timeframe)
     lookback_days = days if days is not None else settings.data.retention_days
     provider_name = (provider or settings.api.default_provider).lower()
 
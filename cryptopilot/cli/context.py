@@ -0,0 +1,63 @@
+"""Database, repository and services shared by the CLI commands."""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from cryptopilot.config.settings import Settings, get_settings
+from cryptopilot.database.connection import DatabaseConnection
+from cryptopilot.database.repository import Repository
+from cryptopilot.portfolio.manager import PortfolioManager
+
+if TYPE_CHECKING:
+    from cryptopilot.analysis.engine import AnalysisEngine
+
+
+@dataclass
+class CLIContext:
+    """Services for one CLI command, built on a single pooled database.
+
+    ``engine`` and ``portfolio`` are created on first access; the analysis
+    stack (pandas, numba kernels) is only imported by commands that use it.
+    """
+
+    settings: Settings
+    db: DatabaseConnection
+    repo: Repository
+
+    @cached_property
+    def engine(self) -> "AnalysisEngine":
+        """Analysis engine configured from settings."""
+        import numpy as np
+
+        from cryptopilot.analysis.engine import AnalysisEngine
+
+        dtype = self.settings.analysis.indicator_dtype
+        float_dtype = np.float32 if dtype == "float32" else np.float64
+        return AnalysisEngine(self.repo, float_dtype=float_dtype)
+
+    @cached_property
+    def portfolio(self) -> PortfolioManager:
+        """Portfolio manager on the shared repository."""
+        return PortfolioManager(self.repo, self.db)
+
+
+@asynccontextmanager
+async def cli_context() -> AsyncIterator[CLIContext]:
+    """Open and initialize the configured database for a command.
+
+    The database's connection pool is closed when the block exits.
+
+    Usage:
+        async with cli_context() as ctx:
+            result = await ctx.engine.analyze(...)
+    """
+    settings = get_settings()
+    async with DatabaseConnection(
+        db_path=settings.database.path,
+        schema_path=settings.database.schema_path,
+    ) as db:
+        await db.initialize()
+        yield CLIContext(settings=settings, db=db, repo=Repository(db))
@@ -18,17 +18,20 @@ def print_collection_header(
     dry_run: bool,
 ) -> None:
     symbols_str = ", ".join(symbols)
-    console.print(
-        "[bold cyan]CryptoPilot – Market Data Collection[/bold cyan]\n",
-    )
-    console.print(f"Provider: [green]{provider_name}[/green] ([blue]{base_url}[/blue])")
-    console.print(f"Symbols : [magenta]{symbols_str}[/magenta]")
-    console.print(
-        f"Window  : Last [magenta]{days}[/magenta] days @ timeframe [magenta]{timeframe}[/magenta]"
-    )
-    console.print(f"Base    : [magenta]{base_currency}[/magenta]")
-    console.print(f"Dry run : {'[yellow]YES[/yellow]' if dry_run else 'NO'}")
-    console.print("")
+    # One terminal write for the whole header
+    with console:
+        console.print(
+            "[bold cyan]CryptoPilot – Market Data Collection[/bold cyan]\n",
+        )
+        console.print(f"Provider: [green]{provider_name}[/green] ([blue]{base_url}[/blue])")
+        console.print(f"Symbols : [magenta]{symbols_str}[/magenta]")
+        console.print(
+            f"Window  : Last [magenta]{days}[/magenta] days "
+            f"@ timeframe [magenta]{timeframe}[/magenta]"
+        )
+        console.print(f"Base    : [magenta]{base_currency}[/magenta]")
+        console.print(f"Dry run : {'[yellow]YES[/yellow]' if dry_run else 'NO'}")
+        console.print("")
 
 
 def print_collection_summary(
@@ -58,10 +61,12 @@ def print_collection_summary(
         total_fetched += res.candles_fetched
         total_inserted += res.candles_inserted
 
-    console.print("")
-    console.print(table)
-    console.print(
-        f"\n[bold]Total candles fetched:[/bold] {total_fetched}  •  "
-        f"[bold]inserted:[/bold] {total_inserted}"
-    )
-    console.print("")
+    # Table and totals go out in a single terminal write
+    with console:
+        console.print("")
+        console.print(table)
+        console.print(
+            f"\n[bold]Total candles fetched:[/bold] {total_fetched}  •  "
+            f"[bold]inserted:[/bold] {total_inserted}"
+        )
+        console.print("")
@@ -0,0 +1,60 @@
+"""Parsers for command-line arguments shared by the CLI commands."""
+
+import re
+from collections.abc import Sequence
+from decimal import Decimal
+
+import typer
+
+from cryptopilot.database.models import Timeframe
+
+# Timeframe lookup and the error hint, built once from the enum
+_TIMEFRAME_BY_VALUE: dict[str, Timeframe] = {tf.value: tf for tf in Timeframe}
+_ALLOWED_TIMEFRAMES = ", ".join(_TIMEFRAME_BY_VALUE)
+
+# Plain non-negative decimal: "5", "0.05", "65000.", ".5" (no sign, exponent, NaN or Infinity)
+_DECIMAL_RE = re.compile(r"(?:\d+(?:\.\d*)?|\.\d+)")
+
+
+def parse_symbols(arg: str | None, default_symbols: Sequence[str]) -> list[str]:
+    """Parse a comma-separated symbol list, falling back to the configured defaults.
+
+    Raises:
+        typer.BadParameter: If ``arg`` contains no symbols
+    """
+    if arg is None:
+        return [s.upper() for s in default_symbols]
+
+    parts = [symbol.upper() for part in arg.split(",") if (symbol := part.strip())]
+    if not parts:
+        raise typer.BadParameter("At least one symbol must be provided")
+    return parts
+
+
+def parse_timeframe(raw: str | None, default_tf: str) -> Timeframe:
+    """Parse timeframe string to Timeframe enum.
+
+    Raises:
+        typer.BadParameter: If the timeframe is not supported
+    """
+    value = (raw or default_tf).strip()
+    timeframe = _TIMEFRAME_BY_VALUE.get(value)
+    if timeframe is None:
+        raise typer.BadParameter(f"Invalid timeframe '{value}'. Allowed: {_ALLOWED_TIMEFRAMES}")
+    return timeframe
+
+
+def parse_decimal(name: str, raw: str) -> Decimal:
+    """Parse a non-negative decimal amount given on the command line.
+
+    Args:
+        name: Argument name used in the error message
+        raw: Value as typed by the user
+
+    Raises:
+        typer.BadParameter: If ``raw`` is not a plain non-negative decimal number
+    """
+    value = raw.strip()
+    if not _DECIMAL_RE.fullmatch(value):
+        raise typer.BadParameter(f"Invalid {name} '{raw}'. Expected a number such as 0.05")
+    return Decimal(value)
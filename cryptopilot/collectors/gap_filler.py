@@ -1,8 +1,12 @@
+import asyncio
 import logging
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from itertools import chain
 from typing import Final
 
+from cryptopilot.collectors.market_data import DEFAULT_MAX_CONCURRENCY
 from cryptopilot.database.models import MarketDataRecord, Timeframe
 from cryptopilot.database.repository import Repository
 from cryptopilot.providers.base import OHLCV, DataProviderBase
@@ -17,6 +21,11 @@ _TIMEFRAME_DELTAS: Final[dict[Timeframe, timedelta]] = {
     Timeframe.ONE_WEEK: timedelta(weeks=1),
 }
 
+# Gaps separated by at most this many stored candles are fetched with one
+# provider request; re-downloading the candles in between is cheaper than
+# another round-trip (they are ignored on insert)
+_GAP_MERGE_CANDLES: Final = 12
+
 
 @dataclass
 class Gap:
@@ -42,6 +51,43 @@ class GapCheckResult:
         return sum(g.missing_candles for g in self.gaps)
 
 
+def _find_gaps(timestamps: list[datetime], tf_delta: timedelta) -> list[Gap]:
+    """Gaps between consecutive sorted timestamps more than one interval (+1s slack) apart."""
+    # Imported here: numpy would otherwise load with every CLI command
+    import numpy as np
+
+    epoch_seconds = np.fromiter(
+        (ts.timestamp() for ts in timestamps), dtype=np.float64, count=len(timestamps)
+    )
+    # Scan all intervals at once; only the few gap positions are visited in Python
+    jumps = np.flatnonzero(np.diff(epoch_seconds) > tf_delta.total_seconds() + 1)
+
+    gaps: list[Gap] = []
+    for i in jumps.tolist():
+        prev, ts = timestamps[i], timestamps[i + 1]
+        missing = int((ts - prev) // tf_delta) - 1
+        if missing > 0:
+            gaps.append(Gap(start=prev + tf_delta, end=ts - tf_delta, missing_candles=missing))
+    return gaps
+
+
+def _merge_gaps(gaps: list[Gap], tf_delta: timedelta) -> list[Gap]:
+    """Coalesce sorted gaps lying within ``_GAP_MERGE_CANDLES`` candles of each other."""
+    max_distance = tf_delta * (_GAP_MERGE_CANDLES + 1)
+    merged: list[Gap] = []
+    for gap in gaps:
+        if merged and gap.start - merged[-1].end <= max_distance:
+            last = merged[-1]
+            merged[-1] = Gap(
+                start=last.start,
+                end=gap.end,
+                missing_candles=last.missing_candles + gap.missing_candles,
+            )
+        else:
+            merged.append(gap)
+    return merged
+
+
 class GapFiller:
     """Detect and optionally fill gaps in market_data.
 
@@ -56,13 +102,18 @@ class GapFiller:
         base_currency: str,
         batch_size: int = 100,
         retry_config: RetryConfig | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ) -> None:
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+
         self._repo = repository
         self._provider = provider
         self._provider_name = provider_name
         self._base_currency = base_currency
         self._batch_size = batch_size
         self._retry_config = retry_config or RetryConfig()
+        self._max_concurrency = max_concurrency
 
     async def detect_gaps_recent(
         self,
@@ -102,44 +153,26 @@ class GapFiller:
                 gaps=gaps,
             )
 
-        tf_delta = _TIMEFRAME_DELTAS[timeframe]
+        result = GapCheckResult(
+            symbol=symbol,
+            timeframe=timeframe,
+            checked_from=start,
+            checked_to=now,
+            gaps=_find_gaps(timestamps, _TIMEFRAME_DELTAS[timeframe]),
+        )
 
-        prev = timestamps[0]
-        for ts in timestamps[1:]:
-            delta = ts - prev
-            # simple heuristic: if difference is more than one interval (+1s slack), treat as gap
-            if delta > tf_delta + timedelta(seconds=1):
-                missing = int(delta // tf_delta) - 1
-                if missing > 0:
-                    gap_start = prev + tf_delta
-                    gap_end = ts - tf_delta
-                    gaps.append(
-                        Gap(
-                            start=gap_start,
-                            end=gap_end,
-                            missing_candles=missing,
-                        )
-                    )
-            prev = ts
-
-        if gaps:
+        if result.gaps:
             logger.warning(
                 "Gap check: detected %d gaps (%d missing candles) for %s %s",
-                len(gaps),
-                sum(g.missing_candles for g in gaps),
+                len(result.gaps),
+                result.issues_found,
                 symbol,
                 timeframe.value,
             )
         else:
             logger.info("Gap check: no gaps detected for %s %s", symbol, timeframe.value)
 
-        return GapCheckResult(
-            symbol=symbol,
-            timeframe=timeframe,
-            checked_from=start,
-            checked_to=now,
-            gaps=gaps,
-        )
+        return result
 
     async def fill_gaps_recent(
         self,
@@ -166,28 +199,29 @@ class GapFiller:
             return result, 0
 
         tf_delta = _TIMEFRAME_DELTAS[timeframe]
-        total_inserted = 0
+        semaphore = asyncio.Semaphore(self._max_concurrency)
 
-        for gap in result.gaps:
+        async def _fetch_gap(gap: Gap) -> list[OHLCV]:
             # extend window slightly to ensure we capture full missing range
             fetch_start = gap.start - tf_delta
             fetch_end = gap.end + tf_delta
 
-            logger.info(
-                "Gap fill: %s %s – fetching missing window %s → %s (%d missing candles)",
-                symbol,
-                timeframe.value,
-                fetch_start.isoformat(),
-                fetch_end.isoformat(),
-                gap.missing_candles,
-            )
+            async with semaphore:
+                logger.info(
+                    "Gap fill: %s %s – fetching missing window %s → %s (%d missing candles)",
+                    symbol,
+                    timeframe.value,
+                    fetch_start.isoformat(),
+                    fetch_end.isoformat(),
+                    gap.missing_candles,
+                )
+                candles = await self._fetch_ohlcv(
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    start=fetch_start,
+                    end=fetch_end,
+                )
 
-            candles = await self._fetch_ohlcv(
-                symbol=symbol,
-                timeframe=timeframe,
-                start=fetch_start,
-                end=fetch_end,
-            )
             if not candles:
                 logger.warning(
                     "Gap fill: provider returned no candles for %s %s in window %s → %s",
@@ -196,18 +230,52 @@ class GapFiller:
                     fetch_start.isoformat(),
                     fetch_end.isoformat(),
                 )
-                continue
+            return candles
+
+        # Nearby gaps share a request; the windows are independent, so fetch
+        # them concurrently, then write the candles of every window that
+        # arrived in one insert (already stored candles in a window are
+        # ignored). A failed window doesn't discard the others.
+        windows = _merge_gaps(result.gaps, tf_delta)
+        outcomes = await asyncio.gather(
+            *(_fetch_gap(gap) for gap in windows), return_exceptions=True
+        )
 
-            records = self._to_records(symbol, timeframe, candles)
-            inserted = await self._repo.insert_market_data(records, self._batch_size)
-            total_inserted += inserted
+        candle_lists: list[list[OHLCV]] = []
+        failures: list[Exception] = []
+        for gap, outcome in zip(windows, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, Exception):
+                    raise outcome
+                logger.error(
+                    "Gap fill: fetching %s %s window %s → %s failed: %s",
+                    symbol,
+                    timeframe.value,
+                    gap.start.isoformat(),
+                    gap.end.isoformat(),
+                    outcome,
+                )
+                failures.append(outcome)
+            else:
+                candle_lists.append(outcome)
 
-            logger.info(
-                "Gap fill: inserted %d rows for %s %s while filling gap",
-                inserted,
-                symbol,
-                timeframe.value,
-            )
+        records = chain.from_iterable(
+            self._iter_records(symbol, timeframe, candles) for candles in candle_lists
+        )
+        total_inserted = await self._repo.insert_market_data(records, self._batch_size)
+
+        logger.info(
+            "Gap fill: inserted %d rows for %s %s while filling %d gaps (%d requests, %d failed)",
+            total_inserted,
+            symbol,
+            timeframe.value,
+            len(result.gaps),
+            len(windows),
+            len(failures),
+        )
+
+        if failures:
+            raise failures[0]
 
         return result, total_inserted
 
@@ -229,16 +297,16 @@ class GapFiller:
             config=self._retry_config,
         )
 
-    def _to_records(
+    def _iter_records(
         self,
         symbol: str,
         timeframe: Timeframe,
         candles: list[OHLCV],
-    ) -> list[MarketDataRecord]:
-        """Convert provider OHLCV into DB records."""
+    ) -> Iterator[MarketDataRecord]:
+        """Convert provider OHLCV into DB records, one at a time as consumed."""
         now = datetime.now(UTC)
 
-        return [
+        return (
             MarketDataRecord(
                 symbol=symbol,
                 base_currency=self._base_currency,
@@ -253,4 +321,4 @@ class GapFiller:
                 collected_at=now,
             )
             for candle in candles
-        ]
+        )
@@ -1,5 +1,6 @@
+import asyncio
 import logging
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 
@@ -17,6 +18,9 @@ _TIMEFRAME_DELTAS: dict[Timeframe, timedelta] = {
     Timeframe.ONE_WEEK: timedelta(weeks=1),
 }
 
+# Upper bound on symbols fetched from the provider at once by collect
+DEFAULT_MAX_CONCURRENCY = 4
+
 
 @dataclass
 class CollectionResult:
@@ -47,13 +51,18 @@ class MarketDataCollector:
         base_currency: str,
         batch_size: int = 100,
         retry_config: RetryConfig | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ) -> None:
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+
         self._repo = repository
         self._provider = provider
         self._provider_name = provider_name
         self._base_currency = base_currency
         self._batch_size = batch_size
         self._retry_config = retry_config or RetryConfig()
+        self._max_concurrency = max_concurrency
 
     async def collect(
         self,
@@ -75,35 +84,58 @@ class MarketDataCollector:
             dry_run: If True, fetch from provider but do not write anything to the DB.
 
         Returns:
-            Per-symbol collection summaries.
+            Per-symbol collection summaries, in the order of ``symbols``.
+
+        Note:
+            Symbols are collected concurrently (up to ``max_concurrency`` at a
+            time). Without ``continue_on_error`` the first failure cancels the
+            symbols still in flight and is re-raised.
         """
         now = datetime.now(UTC)
-        results: list[CollectionResult] = []
-
-        for raw_symbol in symbols:
-            symbol = raw_symbol.upper().strip()
-            try:
-                result = await self._collect_single(
-                    symbol=symbol,
-                    timeframe=timeframe,
-                    now=now,
-                    lookback_days=lookback_days,
-                    update_all=update_all,
-                    dry_run=dry_run,
-                )
-                results.append(result)
-            except Exception as exc:
-                logger.exception("Failed to collect data for %s: %s", symbol, exc)
-                if not continue_on_error:
-                    raise
-                continue
-
-        return results
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        normalized = [raw_symbol.upper().strip() for raw_symbol in symbols]
+
+        # Where each symbol's stored history ends, read with one query up front
+        latest_by_symbol = await self._repo.get_latest_timestamps(
+            symbols=normalized,
+            timeframe=timeframe,
+            provider=self._provider_name,
+        )
+
+        async def _collect_one(symbol: str) -> CollectionResult | None:
+            async with semaphore:
+                try:
+                    return await self._collect_single(
+                        symbol=symbol,
+                        timeframe=timeframe,
+                        latest=latest_by_symbol.get(symbol),
+                        now=now,
+                        lookback_days=lookback_days,
+                        update_all=update_all,
+                        dry_run=dry_run,
+                    )
+                except Exception as exc:
+                    logger.exception("Failed to collect data for %s: %s", symbol, exc)
+                    if not continue_on_error:
+                        raise
+                    return None
+
+        tasks = [asyncio.ensure_future(_collect_one(symbol)) for symbol in normalized]
+        try:
+            outcomes = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        return [result for result in outcomes if result is not None]
 
     async def _collect_single(
         self,
         symbol: str,
         timeframe: Timeframe,
+        latest: datetime | None,
         now: datetime,
         lookback_days: int,
         update_all: bool,
@@ -119,11 +151,6 @@ class MarketDataCollector:
             dry_run,
         )
 
-        latest = await self._repo.get_latest_timestamp(
-            symbol=symbol,
-            timeframe=timeframe,
-            provider=self._provider_name,
-        )
         tf_delta = _TIMEFRAME_DELTAS[timeframe]
 
         if latest is None:
@@ -159,8 +186,6 @@ class MarketDataCollector:
                 end=None,
             )
 
-        records = self._to_records(symbol, timeframe, candles)
-
         if dry_run:
             inserted = 0
             logger.info(
@@ -170,6 +195,7 @@ class MarketDataCollector:
                 timeframe.value,
             )
         else:
+            records = self._iter_records(symbol, timeframe, candles)
             inserted = await self._repo.insert_market_data(records, self._batch_size)
             logger.info(
                 "Inserted %d rows for %s %s (fetched %d candles)",
@@ -206,16 +232,16 @@ class MarketDataCollector:
             config=self._retry_config,
         )
 
-    def _to_records(
+    def _iter_records(
         self,
         symbol: str,
         timeframe: Timeframe,
         candles: list[OHLCV],
-    ) -> list[MarketDataRecord]:
-        """Convert provider OHLCV into DB records."""
+    ) -> Iterator[MarketDataRecord]:
+        """Convert provider OHLCV into DB records, one at a time as consumed."""
         now = datetime.now(UTC)
 
-        return [
+        return (
             MarketDataRecord(
                 symbol=symbol,
                 base_currency=self._base_currency,
@@ -230,4 +256,4 @@ class MarketDataCollector:
                 collected_at=now,
             )
             for candle in candles
-        ]
+        )
@@ -1,5 +1,6 @@
 """Configuration management with hierarchy: CLI args > ENV vars > TOML > Defaults."""
 
+import tomllib
 from pathlib import Path
 from typing import Any
 
@@ -7,6 +8,33 @@ import toml
 from pydantic import BaseModel, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Parsed config files keyed by path, with the (st_mtime_ns, st_size) they were read at
+_toml_cache: dict[Path, tuple[int, int, dict[str, Any]]] = {}
+
+# Settings written to config.toml (the database location is left to its default)
+_TOML_FIELDS = {"api", "data", "analysis", "reporting", "currency", "debug", "log_level"}
+
+
+def config_dir() -> Path:
+    """Directory holding config.toml and the default database (~/.cryptopilot).
+
+    Resolved on every call so a changed HOME (tests, sandboxes) is honoured.
+    """
+    return Path.home() / ".cryptopilot"
+
+
+def _read_toml(path: Path) -> dict[str, Any]:
+    """Parse a TOML file, reusing the previous parse while the file is unchanged."""
+    st = path.stat()
+    cached = _toml_cache.get(path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+
+    with open(path, "rb") as f:
+        data = tomllib.load(f)
+    _toml_cache[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
 
 class APIConfig(BaseModel):
     """API configuration."""
@@ -16,6 +44,7 @@ class APIConfig(BaseModel):
     request_timeout: int = 30
     max_retries: int = 3
     retry_backoff: float = 2.0
+    max_concurrent_requests: int = Field(default=4, ge=1)
 
 
 class DataConfig(BaseModel):
@@ -36,6 +65,9 @@ class AnalysisConfig(BaseModel):
     )
     confidence_threshold: float = 0.6
     risk_tolerance: str = "moderate"
+    # dtype of the price/volume arrays fed to the indicator kernels; "float32"
+    # halves their memory traffic (scores are still computed in float64)
+    indicator_dtype: str = "float64"
 
     @field_validator("risk_tolerance")
     @classmethod
@@ -45,6 +77,14 @@ class AnalysisConfig(BaseModel):
             raise ValueError(f"risk_tolerance must be one of {allowed}")
         return v.lower()
 
+    @field_validator("indicator_dtype")
+    @classmethod
+    def validate_indicator_dtype(cls, v: str) -> str:
+        allowed = ["float32", "float64"]
+        if v.lower() not in allowed:
+            raise ValueError(f"indicator_dtype must be one of {allowed}")
+        return v.lower()
+
 
 class ReportingConfig(BaseModel):
     """Reporting and LLM configuration."""
@@ -66,7 +106,7 @@ class CurrencyConfig(BaseModel):
 class DatabaseConfig(BaseModel):
     """Database configuration."""
 
-    path: Path = Field(default_factory=lambda: Path.home() / ".cryptopilot" / "cryptopilot.db")
+    path: Path = Field(default_factory=lambda: config_dir() / "cryptopilot.db")
     schema_path: Path = Field(
         default_factory=lambda: Path(__file__).parent.parent / "database" / "schema.sql"
     )
@@ -100,30 +140,21 @@ class Settings(BaseSettings):
         settings_dict: dict[str, Any] = {}
 
         if path is None:
-            path = Path.home() / ".cryptopilot" / "config.toml"
+            path = config_dir() / "config.toml"
 
         if path.exists():
-            with open(path) as f:
-                settings_dict = toml.load(f)
+            settings_dict = _read_toml(path)
 
         return cls(**settings_dict)
 
     def save_to_toml(self, path: Path | None = None) -> None:
         """Save current settings to TOML file."""
         if path is None:
-            path = Path.home() / ".cryptopilot" / "config.toml"
+            path = config_dir() / "config.toml"
 
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        settings_dict = {
-            "api": self.api.model_dump(exclude_none=True),
-            "data": self.data.model_dump(exclude_none=True),
-            "analysis": self.analysis.model_dump(exclude_none=True),
-            "reporting": self.reporting.model_dump(exclude_none=True),
-            "currency": self.currency.model_dump(exclude_none=True),
-            "debug": self.debug,
-            "log_level": self.log_level,
-        }
+        settings_dict = self.model_dump(include=_TOML_FIELDS, exclude_none=True)
 
         with open(path, "w") as f:
             toml.dump(settings_dict, f)
@@ -1,7 +1,7 @@
 """Async SQLite connection management with connection pooling and proper initialization."""
 
 import asyncio
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
 from contextlib import asynccontextmanager
 from decimal import Decimal
 from pathlib import Path
@@ -9,16 +9,68 @@ from typing import Any
 
 import aiosqlite
 
+from cryptopilot.database.migrations import apply_migrations
+from cryptopilot.database.pool import (
+    DEFAULT_MAX_IDLE,
+    DEFAULT_STATEMENT_CACHE_SIZE,
+    SQLiteConnectionPool,
+)
 
-class DatabaseConnection:
-    """Manages async SQLite connections with proper initialization and connection pooling."""
 
-    def __init__(self, db_path: Path, schema_path: Path) -> None:
+class DatabaseConnection:
+    """Manages async SQLite connections with proper initialization and connection pooling.
+
+    Connections come from a :class:`SQLiteConnectionPool`, so successive
+    queries reuse an open, already configured connection (and its page and
+    statement caches) instead of reconnecting. Every connection is opened
+    with a sqlite3 statement cache of ``statement_cache_size`` entries, so
+    repeated queries with identical SQL text reuse their compiled statement
+    instead of being re-parsed.
+
+    Reads run concurrently on separate pooled connections (WAL readers do
+    not block each other or the writer). Writes -- :meth:`execute`,
+    :meth:`execute_many` and :meth:`transaction` -- are serialized by an
+    in-process lock, so concurrent writers queue on the event loop instead
+    of polling SQLite's busy handler.
+
+    Call :meth:`close` (or use the instance as an async context manager)
+    before the event loop ends to close the pooled connections.
+
+    Usage:
+        async with DatabaseConnection(db_path, schema_path) as db:
+            await db.initialize()
+            ...
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        schema_path: Path,
+        statement_cache_size: int = DEFAULT_STATEMENT_CACHE_SIZE,
+        max_idle_connections: int = DEFAULT_MAX_IDLE,
+    ) -> None:
         self.db_path = db_path
         self.schema_path = schema_path
+        self.statement_cache_size = statement_cache_size
+        self._pool = SQLiteConnectionPool(
+            db_path,
+            max_idle=max_idle_connections,
+            statement_cache_size=statement_cache_size,
+        )
         self._lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
         self._initialized = False
 
+    async def __aenter__(self) -> "DatabaseConnection":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the pooled connections."""
+        await self._pool.close()
+
     async def initialize(self) -> None:
         """Initialize database with schema if needed."""
         async with self._lock:
@@ -27,20 +79,27 @@ class DatabaseConnection:
 
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("PRAGMA foreign_keys = ON")
-                await db.execute("PRAGMA journal_mode = WAL")
+            async with self._pool.connection() as db:
+                # Close the cursor: an unfinished PRAGMA statement would keep a
+                # read lock open across the schema transaction below
+                async with db.execute("PRAGMA journal_mode = WAL"):
+                    pass
 
                 schema_sql = self.schema_path.read_text()
                 await db.executescript(schema_sql)
                 await db.commit()
 
+                await apply_migrations(db)
+
             self._initialized = True
 
     @asynccontextmanager
     async def get_connection(self) -> AsyncGenerator[aiosqlite.Connection, None]:
         """Get a database connection with proper configuration.
 
+        The connection goes back to the pool when the block exits; an
+        uncommitted transaction is rolled back.
+
         Usage:
             async with db.get_connection() as conn:
                 await conn.execute(...)
@@ -48,22 +107,14 @@ class DatabaseConnection:
         if not self._initialized:
             await self.initialize()
 
-        async with aiosqlite.connect(self.db_path) as conn:
-            await conn.execute("PRAGMA foreign_keys = ON")
-
-            conn.row_factory = aiosqlite.Row
-
-            try:
-                yield conn
-            except Exception:
-                await conn.rollback()
-                raise
+        async with self._pool.connection() as conn:
+            yield conn
 
     async def execute(
         self, query: str, parameters: tuple[Any, ...] | dict[str, Any] | None = None
     ) -> aiosqlite.Cursor:
         """Execute a single query."""
-        async with self.get_connection() as conn:
+        async with self._write_lock, self.get_connection() as conn:
             if parameters:
                 cursor = await conn.execute(query, parameters)
             else:
@@ -75,7 +126,7 @@ class DatabaseConnection:
         self, query: str, parameters: list[tuple[Any, ...]] | list[dict[str, Any]]
     ) -> None:
         """Execute query with multiple parameter sets (bulk insert)."""
-        async with self.get_connection() as conn:
+        async with self._write_lock, self.get_connection() as conn:
             await conn.executemany(query, parameters)
             await conn.commit()
 
@@ -101,8 +152,26 @@ class DatabaseConnection:
                 cursor = await conn.execute(query)
             return await cursor.fetchall()
 
+    async def fetch_iter(
+        self,
+        query: str,
+        parameters: tuple[Any, ...] | dict[str, Any] | None = None,
+        chunk_size: int = 10_000,
+    ) -> AsyncIterator[list[aiosqlite.Row]]:
+        """Stream rows in batches of up to ``chunk_size`` instead of buffering them all."""
+        async with self.get_connection() as conn:
+            if parameters:
+                cursor = await conn.execute(query, parameters)
+            else:
+                cursor = await conn.execute(query)
+            try:
+                while batch := await cursor.fetchmany(chunk_size):
+                    yield list(batch)
+            finally:
+                await cursor.close()
+
     async def transaction(self) -> "Transaction":
-        """Begin an explicit transaction."""
+        """Begin an explicit write transaction (``BEGIN IMMEDIATE``)."""
         return Transaction(self)
 
     async def get_schema_version(self) -> int:
@@ -117,7 +186,13 @@ class DatabaseConnection:
 
 
 class Transaction:
-    """Context manager for explicit transactions."""
+    """Context manager for explicit write transactions.
+
+    Holds the database's write lock for the whole block and starts with
+    ``BEGIN IMMEDIATE``: the SQLite write lock is taken up front, so another
+    process's writer makes it wait on the busy timeout instead of failing
+    with SQLITE_BUSY when a read is upgraded to a write.
+    """
 
     def __init__(self, db: DatabaseConnection) -> None:
         self.db = db
@@ -127,19 +202,33 @@ class Transaction:
         if not self.db._initialized:
             await self.db.initialize()
 
-        self._conn = await aiosqlite.connect(self.db.db_path).__aenter__()
-        await self._conn.execute("PRAGMA foreign_keys = ON")
-        self._conn.row_factory = aiosqlite.Row
-        await self._conn.execute("BEGIN")
+        await self.db._write_lock.acquire()
+        try:
+            self._conn = await self.db._pool.acquire()
+            try:
+                await self._conn.execute("BEGIN IMMEDIATE")
+            except BaseException:
+                await self.db._pool.release(self._conn)
+                self._conn = None
+                raise
+        except BaseException:
+            self.db._write_lock.release()
+            raise
         return self._conn
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         if self._conn:
-            if exc_type is None:
-                await self._conn.commit()
-            else:
-                await self._conn.rollback()
-            await self._conn.__aexit__(exc_type, exc_val, exc_tb)
+            conn, self._conn = self._conn, None
+            try:
+                if exc_type is None:
+                    await conn.commit()
+                else:
+                    await conn.rollback()
+            finally:
+                try:
+                    await self.db._pool.release(conn)
+                finally:
+                    self.db._write_lock.release()
 
 
 def decimal_to_str(value: Decimal) -> str:
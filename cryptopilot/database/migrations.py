@@ -0,0 +1,128 @@
+"""Schema migrations applied on top of the baseline schema.
+
+``schema.sql`` defines schema version 1 and is always executed first (it is
+idempotent). Every later change is a :class:`Migration` registered in
+``MIGRATIONS``; pending migrations are applied in version order, each in its
+own write transaction, and recorded in ``schema_version``.
+"""
+
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+import aiosqlite
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Migration:
+    """A single schema migration.
+
+    Attributes:
+        version: Schema version this migration produces
+        description: Human-readable summary stored in schema_version
+        apply: Coroutine performing the change on an open connection
+    """
+
+    version: int
+    description: str
+    apply: Callable[[aiosqlite.Connection], Awaitable[None]]
+
+
+async def _add_market_data_float_columns(conn: aiosqlite.Connection) -> None:
+    """Add REAL copies of OHLCV values for analysis reads.
+
+    The TEXT columns remain the source of truth; the ``*_f`` columns let the
+    analysis path read float64 values without parsing strings.
+    """
+    for column in ("open", "high", "low", "close", "volume"):
+        await conn.execute(f"ALTER TABLE market_data ADD COLUMN {column}_f REAL")
+
+    await conn.execute(
+        """
+        UPDATE market_data SET
+            open_f = CAST(open AS REAL),
+            high_f = CAST(high AS REAL),
+            low_f = CAST(low AS REAL),
+            close_f = CAST(close AS REAL),
+            volume_f = CAST(volume AS REAL)
+        """
+    )
+
+
+async def _add_market_data_series_index(conn: aiosqlite.Connection) -> None:
+    """Index market_data by series key: (symbol, timeframe, provider, timestamp).
+
+    Every candle query filters on the full series key, so this index serves
+    the timestamp scans (gap detection, latest candle) without touching the
+    table and gives the OHLCV reads a contiguous range. It replaces
+    ``idx_market_data_lookup``, which lacked ``provider``.
+    """
+    await conn.execute("DROP INDEX IF EXISTS idx_market_data_lookup")
+    await conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_market_data_series
+            ON market_data(symbol, timeframe, provider, timestamp)
+        """
+    )
+
+
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration(
+        version=2,
+        description="Add REAL OHLCV columns to market_data for analysis reads",
+        apply=_add_market_data_float_columns,
+    ),
+    Migration(
+        version=3,
+        description="Index market_data by (symbol, timeframe, provider, timestamp)",
+        apply=_add_market_data_series_index,
+    ),
+)
+
+
+async def get_current_version(conn: aiosqlite.Connection) -> int:
+    """Return the highest applied schema version (0 if none)."""
+    cursor = await conn.execute("SELECT MAX(version) FROM schema_version")
+    row = await cursor.fetchone()
+    return int(row[0]) if row and row[0] is not None else 0
+
+
+async def apply_migrations(conn: aiosqlite.Connection) -> list[int]:
+    """Apply all pending migrations in version order.
+
+    Args:
+        conn: Open connection to a database initialized with schema.sql
+
+    Returns:
+        Versions that were applied (empty if already up to date)
+    """
+    applied: list[int] = []
+
+    for migration in sorted(MIGRATIONS, key=lambda m: m.version):
+        # Take the write lock before reading the version, so a second process
+        # opening the same database waits here and then sees the migration
+        # as applied instead of running it again
+        await conn.execute("BEGIN IMMEDIATE")
+        try:
+            if migration.version <= await get_current_version(conn):
+                await conn.rollback()
+                continue
+
+            logger.info(
+                "Applying schema migration %s: %s", migration.version, migration.description
+            )
+            await migration.apply(conn)
+            await conn.execute(
+                "INSERT INTO schema_version (version, description) VALUES (?, ?)",
+                (migration.version, migration.description),
+            )
+            await conn.commit()
+        except Exception:
+            await conn.rollback()
+            raise
+
+        applied.append(migration.version)
+
+    return applied
@@ -0,0 +1,141 @@
+"""Reusable aiosqlite connections to one database file.
+
+Opening a SQLite connection costs a file open, a schema read and the
+per-connection PRAGMAs, and throws away the page cache of the previous
+connection. The pool keeps released connections open so the queries of a
+command (market data fetch, result inserts, ...) reuse warm connections.
+"""
+
+import logging
+from collections.abc import AsyncGenerator, Sequence
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import aiosqlite
+
+logger = logging.getLogger(__name__)
+
+# Idle connections kept open for reuse; extra connections opened under
+# concurrency are closed when released
+DEFAULT_MAX_IDLE = 4
+
+# Compiled statements kept per connection by the sqlite3 driver, keyed by SQL text
+DEFAULT_STATEMENT_CACHE_SIZE = 256
+
+# Run on every new connection. synchronous=NORMAL is safe in WAL mode (a
+# crash can lose the last commits but never corrupts the file).
+CONNECTION_PRAGMAS = (
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA cache_size = -65536",  # 64 MiB page cache
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",  # read up to 256 MiB of the file through mmap
+)
+
+
+class SQLiteConnectionPool:
+    """Pool of aiosqlite connections to one database file.
+
+    Connections are opened on demand, configured once with ``pragmas`` and
+    ``row_factory = aiosqlite.Row``, and returned to the pool on release
+    (rolled back first if a transaction was left open). The pool never
+    blocks: when every pooled connection is in use a new one is opened.
+
+    :meth:`close` must be awaited before the event loop shuts down; after
+    that, connections are still handed out but closed on release.
+
+    Args:
+        db_path: SQLite database file
+        max_idle: Maximum connections kept open while unused
+        statement_cache_size: sqlite3 statement cache size per connection
+        pragmas: Statements run on every new connection
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        max_idle: int = DEFAULT_MAX_IDLE,
+        statement_cache_size: int = DEFAULT_STATEMENT_CACHE_SIZE,
+        pragmas: Sequence[str] = CONNECTION_PRAGMAS,
+    ) -> None:
+        if max_idle < 0:
+            raise ValueError(f"max_idle must be >= 0, got {max_idle}")
+
+        self.db_path = db_path
+        self.max_idle = max_idle
+        self.statement_cache_size = statement_cache_size
+        self.pragmas = tuple(pragmas)
+        self._idle: list[aiosqlite.Connection] = []
+        self._closed = False
+
+    @property
+    def idle_count(self) -> int:
+        """Number of open connections waiting to be reused."""
+        return len(self._idle)
+
+    async def _open(self) -> aiosqlite.Connection:
+        """Open and configure a new connection."""
+        conn = await aiosqlite.connect(self.db_path, cached_statements=self.statement_cache_size)
+        try:
+            for pragma in self.pragmas:
+                await conn.execute(pragma)
+        except BaseException:
+            await conn.close()
+            raise
+        conn.row_factory = aiosqlite.Row
+        logger.debug("Opened SQLite connection to %s", self.db_path)
+        return conn
+
+    async def acquire(self) -> aiosqlite.Connection:
+        """Take an idle connection, or open a new one if none is free."""
+        if self._idle:
+            return self._idle.pop()
+        return await self._open()
+
+    async def release(self, conn: aiosqlite.Connection) -> None:
+        """Return a connection taken with :meth:`acquire`."""
+        try:
+            if conn.in_transaction:
+                await conn.rollback()
+        except Exception:
+            # Unusable connection: drop it rather than pool it
+            await conn.close()
+            raise
+
+        if self._closed or len(self._idle) >= self.max_idle:
+            await conn.close()
+        else:
+            self._idle.append(conn)
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncGenerator[aiosqlite.Connection, None]:
+        """Borrow a connection for the duration of the block.
+
+        Usage:
+            async with pool.connection() as conn:
+                await conn.execute(...)
+        """
+        conn = await self.acquire()
+        try:
+            yield conn
+        finally:
+            await self.release(conn)
+
+    async def close(self) -> None:
+        """Close the idle connections; connections in use close on release.
+
+        ``PRAGMA optimize`` runs once before closing, so SQLite can refresh
+        the planner statistics of tables whose queries would benefit; the
+        analysis is sampled (``analysis_limit``) to stay fast on large tables.
+        """
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for index, conn in enumerate(idle):
+            try:
+                if index == 0:
+                    await conn.execute("PRAGMA analysis_limit = 400")
+                    await conn.execute("PRAGMA optimize")
+            except aiosqlite.Error as exc:
+                logger.debug("PRAGMA optimize failed on %s: %s", self.db_path, exc)
+            finally:
+                await conn.close()
@@ -1,7 +1,10 @@
 import json
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
 from datetime import UTC, datetime
 from decimal import Decimal
+from itertools import islice
+
+import aiosqlite
 
 from cryptopilot.database.connection import DatabaseConnection, decimal_to_str, str_to_decimal
 from cryptopilot.database.models import (
@@ -17,11 +20,152 @@ from cryptopilot.database.models import (
 
 def _to_utc(dt: datetime) -> datetime:
     """Ensure datetime is timezone-aware UTC."""
+    if dt.tzinfo is UTC:
+        # Already UTC (e.g. parsed from a stored "+00:00" string): no conversion
+        return dt
     if dt.tzinfo is None:
         return dt.replace(tzinfo=UTC)
     return dt.astimezone(UTC)
 
 
+def _timestamp_from_db(ts: object) -> datetime:
+    """Convert a stored candle timestamp (ISO string or epoch seconds) to UTC."""
+    if isinstance(ts, str):
+        return _to_utc(datetime.fromisoformat(ts))
+    if isinstance(ts, (int, float)):
+        return datetime.fromtimestamp(ts, tz=UTC)
+
+    raise TypeError(f"Unsupported timestamp type from DB: {type(ts)!r}")
+
+
+# SQL for the hot analysis reads is kept as module constants so the exact
+# same text is issued every time and hits the driver's statement cache.
+_OHLCV_FLOAT_QUERY = """
+    SELECT timestamp, open_f, high_f, low_f, close_f, volume_f
+    FROM market_data
+    WHERE symbol = ? AND timeframe = ? AND provider = ?
+    ORDER BY timestamp ASC
+"""
+
+# Walk the (symbol, timeframe, provider, timestamp) index backwards for the
+# newest rows, then restore ascending order for the caller.
+_OHLCV_FLOAT_RECENT_QUERY = """
+    SELECT timestamp, open_f, high_f, low_f, close_f, volume_f
+    FROM (
+        SELECT timestamp, open_f, high_f, low_f, close_f, volume_f
+        FROM market_data
+        WHERE symbol = ? AND timeframe = ? AND provider = ?
+        ORDER BY timestamp DESC
+        LIMIT ?
+    )
+    ORDER BY timestamp ASC
+"""
+
+# Multi-symbol reads; {placeholders} is expanded by _with_placeholders
+_OHLCV_FLOAT_SYMBOLS_QUERY = """
+    SELECT symbol, timestamp, open_f, high_f, low_f, close_f, volume_f
+    FROM market_data
+    WHERE symbol IN ({placeholders}) AND timeframe = ? AND provider = ?
+    ORDER BY symbol ASC, timestamp ASC
+"""
+
+_OHLCV_FLOAT_SYMBOLS_RECENT_QUERY = """
+    SELECT symbol, timestamp, open_f, high_f, low_f, close_f, volume_f
+    FROM (
+        SELECT symbol, timestamp, open_f, high_f, low_f, close_f, volume_f,
+               ROW_NUMBER() OVER (PARTITION BY symbol ORDER BY timestamp DESC) AS recency
+        FROM market_data
+        WHERE symbol IN ({placeholders}) AND timeframe = ? AND provider = ?
+    )
+    WHERE recency <= ?
+    ORDER BY symbol ASC, timestamp ASC
+"""
+
+_LATEST_TIMESTAMPS_QUERY = """
+    SELECT symbol, MAX(timestamp) AS timestamp
+    FROM market_data
+    WHERE symbol IN ({placeholders}) AND timeframe = ? AND provider = ?
+    GROUP BY symbol
+"""
+
+# SQLite takes bare columns (close) from the row holding MAX(timestamp)
+_LATEST_PRICES_QUERY = """
+    SELECT symbol, close, MAX(timestamp) AS timestamp
+    FROM market_data
+    WHERE symbol IN ({placeholders})
+    GROUP BY symbol
+"""
+
+
+def _with_placeholders(template: str, count: int) -> str:
+    """Expand the ``{placeholders}`` of an ``IN (...)`` query into ``count`` markers."""
+    # Only "?" markers are interpolated; the values themselves are always bound
+    return template.format(placeholders=",".join("?" * count))  # noqa: S608
+
+
+_INSERT_RESULT_QUERY = """
+    INSERT INTO analysis_results (
+        analysis_id, symbol, strategy, action, confidence,
+        confidence_score, evidence, risk_assessment,
+        timestamp, market_context
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _market_data_rows(records: Iterable[MarketDataRecord]) -> Iterator[tuple[object, ...]]:
+    """Build INSERT parameters for candles: TEXT Decimals plus their REAL copies.
+
+    Records from one collection run share ``collected_at``, so its ISO string
+    (about a microsecond to format) is only rebuilt when the value changes.
+    """
+    collected_at: datetime | None = None
+    collected_at_iso = ""
+    for rec in records:
+        if rec.collected_at != collected_at:
+            collected_at = rec.collected_at
+            collected_at_iso = _to_utc(collected_at).isoformat()
+
+        yield (
+            rec.symbol,
+            rec.base_currency,
+            _to_utc(rec.timestamp).isoformat(),
+            decimal_to_str(rec.open),
+            decimal_to_str(rec.high),
+            decimal_to_str(rec.low),
+            decimal_to_str(rec.close),
+            decimal_to_str(rec.volume),
+            rec.timeframe.value,
+            rec.provider,
+            collected_at_iso,
+            float(rec.open),
+            float(rec.high),
+            float(rec.low),
+            float(rec.close),
+            float(rec.volume),
+        )
+
+
+def _result_params(result: AnalysisResultRecord) -> tuple[object, ...]:
+    """Build INSERT parameters for an analysis result, serializing complex fields to JSON."""
+    evidence_json = json.dumps(result.evidence)
+    risk_json = json.dumps(result.risk_assessment, default=str) if result.risk_assessment else None
+    context_json = json.dumps(result.market_context, default=str) if result.market_context else None
+
+    return (
+        str(result.analysis_id),
+        result.symbol,
+        result.strategy,
+        result.action.value,
+        result.confidence.value,
+        decimal_to_str(result.confidence_score),
+        evidence_json,
+        risk_json,
+        _to_utc(result.timestamp).isoformat(),
+        context_json,
+    )
+
+
 class Repository:
     """Data-access layer for market_data table.
 
@@ -53,30 +197,53 @@ class Repository:
         if row is None:
             return None
 
-        ts = row["timestamp"]
-        if isinstance(ts, str):
-            dt = datetime.fromisoformat(ts)
-            return _to_utc(dt)
-        if isinstance(ts, (int, float)):
-            return datetime.fromtimestamp(ts, tz=UTC)
+        return _timestamp_from_db(row["timestamp"])
+
+    async def get_latest_timestamps(
+        self,
+        symbols: Sequence[str],
+        timeframe: Timeframe,
+        provider: str,
+    ) -> dict[str, datetime]:
+        """Latest candle timestamps of several symbols with one query.
 
-        raise TypeError(f"Unsupported timestamp type from DB: {type(ts)!r}")
+        Same per-symbol value as :meth:`get_latest_timestamp`.
+
+        Returns:
+            Dict of {SYMBOL: timestamp}; symbols without data are omitted
+        """
+        if not symbols:
+            return {}
+
+        rows = await self._db.fetch_all(
+            _with_placeholders(_LATEST_TIMESTAMPS_QUERY, len(symbols)),
+            (*(symbol.upper() for symbol in symbols), timeframe.value, provider),
+        )
+        return {row["symbol"]: _timestamp_from_db(row["timestamp"]) for row in rows}
 
     async def insert_market_data(
         self,
-        records: Sequence[MarketDataRecord],
+        records: Iterable[MarketDataRecord],
         batch_size: int | None = None,
     ) -> int:
         """Bulk insert market data records.
 
         Uses INSERT OR IGNORE to avoid blowing up on duplicates while still
-        keeping inserts idempotent.
+        keeping inserts idempotent. All records are written in one transaction.
+
+        Args:
+            records: Candles to insert; an iterator is consumed one batch at a
+                time, so only ``batch_size`` records are held at once
+            batch_size: Rows per ``executemany`` call (all rows at once if None)
 
         Returns:
             Number of rows reported inserted by SQLite.
 
         """
-        if not records:
+        rows = _market_data_rows(records)
+        chunk_size = batch_size if batch_size is not None and batch_size > 0 else None
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
             return 0
 
         query = """
@@ -91,44 +258,30 @@ class Repository:
                 volume,
                 timeframe,
                 provider,
-                collected_at
+                collected_at,
+                open_f,
+                high_f,
+                low_f,
+                close_f,
+                volume_f
             )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """
 
-        params: list[tuple[object, ...]] = []
-        for rec in records:
-            params.append(
-                (
-                    rec.symbol.upper(),
-                    rec.base_currency,
-                    _to_utc(rec.timestamp).isoformat(),
-                    decimal_to_str(rec.open),
-                    decimal_to_str(rec.high),
-                    decimal_to_str(rec.low),
-                    decimal_to_str(rec.close),
-                    decimal_to_str(rec.volume),
-                    rec.timeframe.value,
-                    rec.provider,
-                    _to_utc(rec.collected_at).isoformat(),
-                )
-            )
-
-        if batch_size is None or batch_size <= 0:
-            batch_size = len(params)
-
         total_inserted = 0
 
-        for i in range(0, len(params), batch_size):
-            chunk = params[i : i + batch_size]
-
-            tx = await self._db.transaction()
-            async with tx as conn:
+        # One transaction for all chunks: a single commit, and a failed chunk
+        # leaves none of the records behind
+        tx = await self._db.transaction()
+        async with tx as conn:
+            while chunk:
                 cursor = await conn.executemany(query, chunk)
 
-            # For INSERT OR IGNORE, rowcount is "rows actually inserted".
-            if cursor.rowcount is not None:
-                total_inserted += cursor.rowcount
+                # For INSERT OR IGNORE, rowcount is "rows actually inserted".
+                if cursor.rowcount is not None:
+                    total_inserted += cursor.rowcount
+
+                chunk = list(islice(rows, chunk_size))
 
         return total_inserted
 
@@ -160,17 +313,7 @@ class Repository:
             (symbol.upper(), timeframe.value, provider, start_utc, end_utc),
         )
 
-        timestamps: list[datetime] = []
-        for row in rows:
-            ts = row["timestamp"]
-            if isinstance(ts, str):
-                dt = datetime.fromisoformat(ts)
-                timestamps.append(_to_utc(dt))
-            elif isinstance(ts, (int, float)):
-                timestamps.append(datetime.fromtimestamp(ts, tz=UTC))
-            else:
-                raise TypeError(f"Unsupported timestamp type from DB: {type(ts)!r}")
-        return timestamps
+        return [_timestamp_from_db(row[0]) for row in rows]
 
     async def get_ohlcv_rows(
         self,
@@ -196,6 +339,75 @@ class Repository:
 
         return [dict(row) for row in rows]
 
+    async def iter_ohlcv_rows(
+        self,
+        symbol: str,
+        timeframe: Timeframe,
+        provider: str,
+        limit: int | None = None,
+        chunk_size: int = 10_000,
+    ) -> AsyncIterator[list[aiosqlite.Row]]:
+        """Stream OHLCV rows sorted by timestamp in batches of ``chunk_size``.
+
+        Rows are ``(timestamp, open, high, low, close, volume)`` with the
+        values read from the REAL ``*_f`` columns, ready for float analysis.
+
+        Args:
+            symbol: Symbol to fetch
+            timeframe: Timeframe
+            provider: Provider name
+            limit: If set, only the most recent ``limit`` candles (still ascending)
+            chunk_size: Rows per yielded batch
+        """
+        params: tuple[object, ...] = (symbol.upper(), timeframe.value, provider)
+
+        if limit is None:
+            query = _OHLCV_FLOAT_QUERY
+        else:
+            query = _OHLCV_FLOAT_RECENT_QUERY
+            params = (*params, limit)
+
+        async for batch in self._db.fetch_iter(query, params, chunk_size=chunk_size):
+            yield batch
+
+    async def iter_ohlcv_rows_for_symbols(
+        self,
+        symbols: Sequence[str],
+        timeframe: Timeframe,
+        provider: str,
+        limit: int | None = None,
+        chunk_size: int = 10_000,
+    ) -> AsyncIterator[list[aiosqlite.Row]]:
+        """Stream OHLCV rows for several symbols with one query.
+
+        Rows are ``(symbol, timestamp, open, high, low, close, volume)`` with
+        REAL values, sorted by symbol and then timestamp.
+
+        Args:
+            symbols: Symbols to fetch
+            timeframe: Timeframe
+            provider: Provider name
+            limit: If set, only the most recent ``limit`` candles per symbol
+            chunk_size: Rows per yielded batch
+        """
+        if not symbols:
+            return
+
+        params: tuple[object, ...] = (
+            *(symbol.upper() for symbol in symbols),
+            timeframe.value,
+            provider,
+        )
+
+        if limit is None:
+            query = _with_placeholders(_OHLCV_FLOAT_SYMBOLS_QUERY, len(symbols))
+        else:
+            query = _with_placeholders(_OHLCV_FLOAT_SYMBOLS_RECENT_QUERY, len(symbols))
+            params = (*params, limit)
+
+        async for batch in self._db.fetch_iter(query, params, chunk_size=chunk_size):
+            yield batch
+
     async def insert_trade(self, trade: TradeRecord) -> int:
         """Insert a trade record.
 
@@ -214,7 +426,7 @@ class Repository:
             query,
             (
                 str(trade.trade_id),
-                trade.symbol.upper(),
+                trade.symbol,
                 trade.side.value,
                 decimal_to_str(trade.quantity),
                 decimal_to_str(trade.price),
@@ -237,9 +449,13 @@ class Repository:
         end_date: datetime | None = None,
         limit: int | None = None,
     ) -> list[TradeRecord]:
-        """Query trades with filters."""
+        """Query trades with filters.
+
+        Only the WHERE clause varies with the filters (16 shapes at most);
+        the limit is bound so every call reuses a cached statement.
+        """
         conditions = []
-        params: list[str] = []
+        params: list[str | int] = []
 
         if symbol:
             conditions.append("symbol = ?")
@@ -258,16 +474,17 @@ class Repository:
             params.append(_to_utc(end_date).isoformat())
 
         where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-        limit_clause = f"LIMIT {limit}" if limit else ""
+        # A negative LIMIT means no limit in SQLite
+        params.append(limit if limit else -1)
 
         query = f"""
             SELECT * FROM trades
             {where_clause}
             ORDER BY timestamp DESC
-            {limit_clause}
+            LIMIT ?
         """
 
-        rows = await self._db.fetch_all(query, tuple(params) if params else None)
+        rows = await self._db.fetch_all(query, tuple(params))
 
         trades: list[TradeRecord] = []
         for row in rows:
@@ -317,6 +534,33 @@ class Repository:
 
         return price, _to_utc(timestamp)
 
+    async def get_latest_prices(
+        self,
+        symbols: Sequence[str],
+    ) -> dict[str, tuple[Decimal, datetime]]:
+        """Get the most recent price of several symbols with one query.
+
+        Same per-symbol row as :meth:`get_latest_price`.
+
+        Returns:
+            Dict of {SYMBOL: (price, timestamp)}; symbols without data are omitted
+        """
+        if not symbols:
+            return {}
+
+        rows = await self._db.fetch_all(
+            _with_placeholders(_LATEST_PRICES_QUERY, len(symbols)),
+            tuple(symbol.upper() for symbol in symbols),
+        )
+
+        return {
+            row["symbol"]: (
+                str_to_decimal(row["close"]),
+                _to_utc(datetime.fromisoformat(row["timestamp"])),
+            )
+            for row in rows
+        }
+
     async def insert_result(self, result: AnalysisResultRecord) -> int:
         """Insert analysis result.
 
@@ -326,41 +570,29 @@ class Repository:
         Returns:
             Row ID of inserted record
         """
-        query = """
-            INSERT INTO analysis_results (
-                analysis_id, symbol, strategy, action, confidence,
-                confidence_score, evidence, risk_assessment,
-                timestamp, market_context
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        cursor = await self._db.execute(_INSERT_RESULT_QUERY, _result_params(result))
+
+        return cursor.lastrowid or 0
+
+    async def insert_results_many(self, results: Sequence[AnalysisResultRecord]) -> int:
+        """Insert several analysis results in a single transaction.
+
+        Args:
+            results: AnalysisResultRecords to insert
+
+        Returns:
+            Number of rows inserted
         """
+        if not results:
+            return 0
 
-        # Serialize complex fields to JSON
-        evidence_json = json.dumps(result.evidence)
-        risk_json = (
-            json.dumps(result.risk_assessment, default=str) if result.risk_assessment else None
-        )
-        context_json = (
-            json.dumps(result.market_context, default=str) if result.market_context else None
-        )
+        params = [_result_params(result) for result in results]
 
-        cursor = await self._db.execute(
-            query,
-            (
-                str(result.analysis_id),
-                result.symbol.upper(),
-                result.strategy,
-                result.action.value,
-                result.confidence.value,
-                decimal_to_str(result.confidence_score),
-                evidence_json,
-                risk_json,
-                _to_utc(result.timestamp).isoformat(),
-                context_json,
-            ),
-        )
+        tx = await self._db.transaction()
+        async with tx as conn:
+            await conn.executemany(_INSERT_RESULT_QUERY, params)
 
-        return cursor.lastrowid or 0
+        return len(params)
 
     async def get_latest_result(
         self,
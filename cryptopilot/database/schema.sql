@@ -26,8 +26,7 @@ CREATE TABLE IF NOT EXISTS market_data (
     UNIQUE(symbol, timestamp, timeframe, provider)
 );
 
-CREATE INDEX IF NOT EXISTS idx_market_data_lookup
-    ON market_data(symbol, timeframe, timestamp DESC);
+-- Series lookups use idx_market_data_series (migration 3)
 
 CREATE INDEX IF NOT EXISTS idx_market_data_symbol
     ON market_data(symbol);
@@ -2,6 +2,7 @@
 
 import logging
 from collections import defaultdict
+from collections.abc import Mapping
 from datetime import UTC, datetime
 from decimal import Decimal
 
@@ -273,9 +274,11 @@ class PortfolioManager:
 
         positions_with_pnl: dict[str, PositionWithMarketData] = {}
 
+        # Current prices from market_data, one query for every symbol
+        latest_prices = await self._repo.get_latest_prices(list(positions))
+
         for symbol, position in positions.items():
-            # Fetch current price from market_data
-            price_data = await self._repo.get_latest_price(symbol)
+            price_data = latest_prices.get(symbol.upper())
 
             if price_data is None:
                 logger.warning(
@@ -314,7 +317,21 @@ class PortfolioManager:
             Dict with total_value, total_cost, total_pnl, total_pnl_pct
         """
         positions = await self.get_positions_with_pnl(account=account)
+        return self.summarize_positions(positions)
+
+    @staticmethod
+    def summarize_positions(positions: Mapping[str, PositionWithMarketData]) -> dict[str, Decimal]:
+        """Compute portfolio-level summary statistics from already priced positions.
+
+        Lets callers that already hold :meth:`get_positions_with_pnl` output
+        summarize it without fetching the positions and prices again.
+
+        Args:
+            positions: Output of :meth:`get_positions_with_pnl`
 
+        Returns:
+            Dict with total_value, total_cost, total_pnl, total_pnl_pct
+        """
         if not positions:
             return {
                 "total_value": Decimal("0"),
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
@@ -44,6 +45,7 @@ class CoinGeckoProvider(DataProviderBase):
         self._api_key = api_key
         self._timeout = request_timeout
         self._symbol_to_id: dict[str, str] = {}
+        self._symbol_map_lock = asyncio.Lock()
 
     def get_info(self) -> ProviderInfo:
         return ProviderInfo(
@@ -85,41 +87,46 @@ class CoinGeckoProvider(DataProviderBase):
         if self._symbol_to_id:
             return
 
-        data = await self._request("/coins/list", params={"include_platform": "false"})
-        mapping: dict[str, str] = {}
-
-        # Build initial mapping: first id for each symbol
-        for item in data:
-            sym = str(item.get("symbol", "")).upper()
-            cid = str(item.get("id", "")).strip()
-            if not sym or not cid:
-                continue
-            mapping.setdefault(sym, cid)
-
-        if not mapping:
-            raise ProviderError("Failed to load symbol list from CoinGecko")
-
-        # Canonical overrides for common base assets we care about.
-        # This prevents batcat / bridged tokens from hijacking BTC/ETH/SOL.
-        preferred_ids: dict[str, str] = {
-            "BTC": "bitcoin",
-            "ETH": "ethereum",
-            "SOL": "solana",
-        }
-
-        for sym, cid in preferred_ids.items():
-            # Always force our preferred id, regardless of what came first.
-            if sym in mapping and mapping[sym] != cid:
-                logger.debug(
-                    "Overriding CoinGecko id for %s: %s -> %s",
-                    sym,
-                    mapping[sym],
-                    cid,
-                )
-            mapping[sym] = cid
-
-        self._symbol_to_id = mapping
-        logger.debug("Loaded %d symbols from CoinGecko", len(mapping))
+        # Concurrent first callers share one download of the coin list
+        async with self._symbol_map_lock:
+            if self._symbol_to_id:
+                return
+
+            data = await self._request("/coins/list", params={"include_platform": "false"})
+            mapping: dict[str, str] = {}
+
+            # Build initial mapping: first id for each symbol
+            for item in data:
+                sym = str(item.get("symbol", "")).upper()
+                cid = str(item.get("id", "")).strip()
+                if not sym or not cid:
+                    continue
+                mapping.setdefault(sym, cid)
+
+            if not mapping:
+                raise ProviderError("Failed to load symbol list from CoinGecko")
+
+            # Canonical overrides for common base assets we care about.
+            # This prevents batcat / bridged tokens from hijacking BTC/ETH/SOL.
+            preferred_ids: dict[str, str] = {
+                "BTC": "bitcoin",
+                "ETH": "ethereum",
+                "SOL": "solana",
+            }
+
+            for sym, cid in preferred_ids.items():
+                # Always force our preferred id, regardless of what came first.
+                if sym in mapping and mapping[sym] != cid:
+                    logger.debug(
+                        "Overriding CoinGecko id for %s: %s -> %s",
+                        sym,
+                        mapping[sym],
+                        cid,
+                    )
+                mapping[sym] = cid
+
+            self._symbol_to_id = mapping
+            logger.debug("Loaded %d symbols from CoinGecko", len(mapping))
 
     async def _get_coin_id(self, symbol: str) -> str:
         await self._ensure_symbol_map()
@@ -0,0 +1,58 @@
+"""Tests for the analysis engine."""
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from cryptopilot.analysis.engine import AnalysisEngine
+from cryptopilot.analysis.registry import list_strategies
+from cryptopilot.database.connection import DatabaseConnection
+from cryptopilot.database.models import MarketDataRecord, Timeframe
+from cryptopilot.database.repository import Repository
+
+SCHEMA_PATH = Path(__file__).parents[2] / "cryptopilot" / "database" / "schema.sql"
+
+
+def _candles(seed: int, count: int = 500) -> list[MarketDataRecord]:
+    rng = np.random.default_rng(seed)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0.001, 0.03, count)))
+    volumes = rng.uniform(1, 10, count)
+    start = datetime(2023, 1, 1, tzinfo=UTC)
+    return [
+        MarketDataRecord(
+            symbol="BTC",
+            timestamp=start + timedelta(days=i),
+            open=Decimal(f"{close:.4f}"),
+            high=Decimal(f"{close * 1.01:.4f}"),
+            low=Decimal(f"{close * 0.99:.4f}"),
+            close=Decimal(f"{close:.4f}"),
+            volume=Decimal(f"{volume:.4f}"),
+            timeframe=Timeframe.ONE_DAY,
+            provider="test",
+        )
+        for i, (close, volume) in enumerate(zip(closes, volumes, strict=True))
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("seed", [1, 2, 3])
+async def test_analyze_strategies_matches_analyze(tmp_path, seed):
+    """Comparing strategies gives each one the same result as running it alone."""
+    async with DatabaseConnection(tmp_path / "test.db", SCHEMA_PATH) as db:
+        await db.initialize()
+        repo = Repository(db)
+        await repo.insert_market_data(_candles(seed))
+        engine = AnalysisEngine(repo)
+
+        names = list_strategies()
+        compared = await engine.analyze_strategies(
+            "BTC", names, provider="test", save_results=False
+        )
+
+        assert list(compared) == names
+        for name in names:
+            alone = await engine.analyze("BTC", name, provider="test", save_result=False)
+            assert compared[name] == alone, name
@@ -0,0 +1,229 @@
+"""Tests for technical indicators."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cryptopilot.analysis import kernels
+from cryptopilot.analysis.indicators import (
+    bollinger_bands_tail,
+    calculate_atr,
+    calculate_bollinger_bands,
+    calculate_ema,
+    calculate_macd,
+    calculate_macd_components,
+    calculate_rsi,
+    calculate_sma,
+    calculate_volatility,
+    detect_crossover,
+    ema_tail,
+    macd_tail,
+    rsi_tail,
+    sma_tail,
+)
+
+
+@pytest.fixture
+def prices() -> pd.Series:
+    """Deterministic random-walk close prices."""
+    rng = np.random.default_rng(42)
+    return pd.Series(100 + np.cumsum(rng.normal(0, 1, 300)))
+
+
+def test_sma_matches_pandas_rolling(prices):
+    """SMA kernel matches pandas rolling mean, including warm-up NaNs."""
+    expected = prices.rolling(window=20, min_periods=20).mean()
+    result = calculate_sma(prices, 20)
+
+    assert result.index.equals(prices.index)
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), equal_nan=True)
+
+
+def test_bollinger_bands_match_pandas_rolling(prices):
+    """Bollinger kernel matches pandas rolling mean and population std."""
+    upper, middle, lower = calculate_bollinger_bands(prices, period=20, num_std=2.0)
+    mean = prices.rolling(window=20).mean()
+    std = prices.rolling(window=20).std(ddof=0)
+
+    np.testing.assert_allclose(middle.to_numpy(), mean.to_numpy(), equal_nan=True)
+    np.testing.assert_allclose(upper.to_numpy(), (mean + 2 * std).to_numpy(), equal_nan=True)
+    np.testing.assert_allclose(lower.to_numpy(), (mean - 2 * std).to_numpy(), equal_nan=True)
+
+
+def test_volatility_matches_pandas_rolling(prices):
+    """Volatility kernel matches the sample std of pandas percentage returns."""
+    expected = prices.pct_change().rolling(window=20, min_periods=20).std()
+
+    np.testing.assert_allclose(
+        calculate_volatility(prices, 20).to_numpy(), expected.to_numpy(), equal_nan=True
+    )
+
+
+def test_rsi_wilder_smoothing(prices):
+    """RSI uses Wilder smoothing and stays within 0-100."""
+    rsi = calculate_rsi(prices, 14)
+
+    assert rsi.iloc[:14].isna().all()
+    assert rsi.iloc[14:].between(0, 100).all()
+
+    delta = prices.diff().iloc[1:]
+    gain = delta.clip(lower=0)
+    loss = -delta.clip(upper=0)
+    avg_gain = gain.iloc[:14].mean()
+    avg_loss = loss.iloc[:14].mean()
+    for g, lo in zip(gain.iloc[14:], loss.iloc[14:], strict=True):
+        avg_gain = (avg_gain * 13 + g) / 14
+        avg_loss = (avg_loss * 13 + lo) / 14
+
+    assert rsi.iloc[-1] == pytest.approx(100 - 100 / (1 + avg_gain / avg_loss))
+
+
+def test_rsi_all_gains_is_100():
+    """A strictly rising series has RSI of 100."""
+    rsi = calculate_rsi(pd.Series(np.arange(1.0, 40.0)), 14)
+
+    assert rsi.iloc[-1] == pytest.approx(100.0)
+
+
+def test_macd_matches_composed_emas(prices):
+    """Fused MACD equals fast EMA - slow EMA with an EMA signal line."""
+    macd_line, signal_line, histogram = calculate_macd(prices, 12, 26, 9)
+    expected_macd = calculate_ema(prices, 12) - calculate_ema(prices, 26)
+    expected_signal = calculate_ema(expected_macd, 9)
+
+    np.testing.assert_allclose(macd_line.to_numpy(), expected_macd.to_numpy(), equal_nan=True)
+    np.testing.assert_allclose(signal_line.to_numpy(), expected_signal.to_numpy(), equal_nan=True)
+    np.testing.assert_allclose(
+        histogram.to_numpy(), (expected_macd - expected_signal).to_numpy(), equal_nan=True
+    )
+    assert signal_line.first_valid_index() == 26 + 9 - 2
+
+
+def test_macd_components_expose_the_emas(prices):
+    """The EMAs kept from the MACD pass equal standalone calculate_ema."""
+    components = calculate_macd_components(prices, 12, 26, 9)
+
+    pd.testing.assert_series_equal(components.ema_fast, calculate_ema(prices, 12))
+    pd.testing.assert_series_equal(components.ema_slow, calculate_ema(prices, 26))
+    macd_lines = calculate_macd(prices, 12, 26, 9)
+    for line, component in zip(macd_lines, components, strict=False):
+        pd.testing.assert_series_equal(line, component)
+
+
+@pytest.mark.parametrize(
+    ("fast", "slow", "expected"),
+    [
+        ([1.0, 1.0, 3.0, 3.0], [2.0, 2.0, 2.0, 2.0], "bullish"),
+        ([3.0, 3.0, 1.0, 1.0], [2.0, 2.0, 2.0, 2.0], "bearish"),
+        ([1.0, 3.0, 1.0, 1.0], [2.0, 2.0, 2.0, 2.0], "bearish"),  # most recent wins
+        ([3.0, 3.0, 3.0, 3.0], [2.0, 2.0, 2.0, 2.0], None),
+    ],
+)
+def test_detect_crossover(fast, slow, expected):
+    """Crossover detection reports the most recent cross in the lookback window."""
+    assert detect_crossover(pd.Series(fast), pd.Series(slow), lookback=3) == expected
+
+
+def test_atr_wilder_smoothing(prices):
+    """ATR is Wilder-smoothed true range seeded with the SMA of the first period TRs."""
+    high = prices + 1.0
+    low = prices - 1.0
+    atr = calculate_atr(high, low, prices, period=14)
+
+    true_range = pd.concat(
+        [high - low, (high - prices.shift()).abs(), (low - prices.shift()).abs()], axis=1
+    ).max(axis=1)
+    expected = true_range.iloc[:14].mean()
+    for tr in true_range.iloc[14:]:
+        expected = (expected * 13 + tr) / 14
+
+    assert atr.iloc[:13].isna().all()
+    assert atr.iloc[-1] == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("ddof", [0, 1])
+def test_window_fallback_matches_loop_kernels(prices, ddof):
+    """The numpy sliding-window fallback agrees with the loop kernels."""
+    values = prices.to_numpy(copy=True)
+    values[50] = np.nan
+
+    np.testing.assert_allclose(
+        kernels._rolling_mean_windows(values, 20),
+        kernels._rolling_mean_loop(values, 20),
+        equal_nan=True,
+    )
+    np.testing.assert_allclose(
+        kernels._rolling_std_windows(values, 20, ddof),
+        kernels._rolling_std_loop(values, 20, ddof),
+        equal_nan=True,
+    )
+
+    values[60:85] = np.nan  # a window with no valid values
+    np.testing.assert_allclose(
+        kernels._trailing_nanmean_windows(values, 20),
+        kernels._trailing_nanmean_loop(values, 20),
+        equal_nan=True,
+    )
+
+
+def test_crossover_fallbacks_match_loop_kernels(prices):
+    """The numpy sign-diff crossover fallbacks agree with the loop kernels."""
+    fast = calculate_sma(prices, 5).to_numpy()
+    slow = calculate_sma(prices, 20).to_numpy()
+
+    labels = kernels._crossover_labels_loop(fast, slow, 5)
+    np.testing.assert_array_equal(kernels._crossover_labels_signs(fast, slow, 5), labels)
+    assert np.count_nonzero(labels) > 0
+    for end in range(30, len(prices)):
+        window = slice(end - 6, end)
+        assert kernels._crossover_signs(fast[window], slow[window], 5) == labels[end - 1]
+        assert kernels._crossover_lookup(fast[window], slow[window], 5) == labels[end - 1]
+
+
+def test_crossover_lookup_handles_ties_and_nans():
+    """The lookup table matches the loop kernel on touching and NaN bars."""
+    rng = np.random.default_rng(11)
+    for _ in range(2000):
+        fast = rng.integers(0, 3, 8).astype(float)
+        slow = rng.integers(0, 3, 8).astype(float)
+        fast[rng.random(8) < 0.1] = np.nan
+        assert kernels._crossover_lookup(fast, slow, 5) == kernels._crossover_loop(fast, slow, 5)
+
+
+def test_tail_helpers_match_last_values_of_full_series(prices):
+    """Tail-only kernels return the last bar of the corresponding full indicator."""
+    assert sma_tail(prices, 20) == pytest.approx(calculate_sma(prices, 20).iloc[-1])
+    assert ema_tail(prices, 12) == pytest.approx(calculate_ema(prices, 12).iloc[-1])
+    assert rsi_tail(prices, 14) == pytest.approx(calculate_rsi(prices, 14).iloc[-1])
+    assert bollinger_bands_tail(prices, 20, 2.0) == pytest.approx(
+        [band.iloc[-1] for band in calculate_bollinger_bands(prices, 20, 2.0)]
+    )
+    assert macd_tail(prices, 12, 26, 9) == pytest.approx(
+        [line.iloc[-1] for line in calculate_macd(prices, 12, 26, 9)]
+    )
+
+
+def test_float32_input_stays_close_to_float64():
+    """float32 series keep their dtype and track the float64 results on long series."""
+    rng = np.random.default_rng(7)
+    prices64 = pd.Series(30_000 + np.cumsum(rng.normal(0, 50, 10_000)))
+    prices32 = prices64.astype(np.float32)
+
+    rsi32 = calculate_rsi(prices32, 14)
+    upper32, _, _ = calculate_bollinger_bands(prices32, 20)
+
+    assert rsi32.dtype == np.float32
+    np.testing.assert_allclose(rsi32, calculate_rsi(prices64, 14), atol=1e-2, equal_nan=True)
+    np.testing.assert_allclose(
+        upper32, calculate_bollinger_bands(prices64, 20)[0], rtol=1e-6, equal_nan=True
+    )
+
+
+def test_indicators_see_in_place_edits(prices):
+    """Editing a Series in place changes the next result (nothing is cached globally)."""
+    series = prices.copy()
+    before = calculate_sma(series, 5).iloc[-1]
+
+    series.iloc[-3] += 1000.0
+
+    assert calculate_sma(series, 5).iloc[-1] == pytest.approx(before + 200.0)
@@ -0,0 +1,82 @@
+"""Tests for analysis strategies."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cryptopilot.analysis.ensemble import EnsembleRunner
+from cryptopilot.analysis.features import FeatureFrame
+from cryptopilot.analysis.strategies.base import StrategyBase
+from cryptopilot.analysis.strategies.mean_reversion import MeanReversionStrategy
+from cryptopilot.analysis.strategies.momentum import MomentumStrategy
+from cryptopilot.analysis.strategies.trend_following import TrendFollowingStrategy
+
+# Strategies exercised by every test below; trend following with shorter
+# SMAs so the 260-bar fixture leaves plenty of signal bars
+STRATEGIES: tuple[StrategyBase, ...] = (
+    TrendFollowingStrategy(fast_period=20, slow_period=50),
+    MomentumStrategy(),
+    MeanReversionStrategy(),
+)
+
+
+@pytest.fixture
+def ohlcv() -> pd.DataFrame:
+    """Deterministic OHLCV frame with a few missing volume bars."""
+    rng = np.random.default_rng(3)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.002, 0.03, 260)))
+    volume = rng.uniform(1, 10, 260)
+    volume[[30, 90, 200]] = np.nan
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=260, freq="D"),
+            "open": close,
+            "high": close * 1.01,
+            "low": close * 0.99,
+            "close": close,
+            "volume": volume,
+        }
+    )
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES, ids=lambda strategy: strategy.name)
+def test_analyze_batch_matches_per_bar_analyze(ohlcv, strategy):
+    """The vectorized batch gives the same signals as analyze() on every prefix."""
+    batch = strategy.analyze_batch(ohlcv)
+    expected = StrategyBase.analyze_batch(strategy, ohlcv)
+
+    assert batch.index.equals(expected.index)
+    assert len(batch) == len(ohlcv) - strategy.get_required_periods() + 1
+    assert list(batch["action"]) == list(expected["action"])
+    assert list(batch["confidence"]) == list(expected["confidence"])
+    np.testing.assert_allclose(batch["confidence_score"], expected["confidence_score"])
+
+
+def test_shared_feature_frame_matches_raw_frame(ohlcv):
+    """Strategies sharing one FeatureFrame give the same results as on the raw frame."""
+    features = FeatureFrame(ohlcv)
+
+    for strategy in STRATEGIES:
+        shared = strategy.analyze(features)
+        expected = strategy.analyze(ohlcv)
+
+        assert shared.action == expected.action
+        assert shared.confidence_score == expected.confidence_score
+        assert shared.evidence == expected.evidence
+        assert shared.risk_assessment == expected.risk_assessment
+
+    # Every strategy reads the 20-bar volatility; it is computed once
+    assert features.volatility(20) is features.volatility(20)
+
+
+def test_threaded_ensemble_matches_individual_runs(ohlcv):
+    """EnsembleRunner on worker threads returns each strategy's own results."""
+    runner = EnsembleRunner(STRATEGIES, max_workers=3)
+
+    batches = runner.run_batch(ohlcv)
+    results = runner.run(ohlcv)
+
+    assert list(results) == [strategy.name for strategy in STRATEGIES]
+    for strategy in STRATEGIES:
+        pd.testing.assert_frame_equal(batches[strategy.name], strategy.analyze_batch(ohlcv))
+        assert results[strategy.name].confidence_score == strategy.analyze(ohlcv).confidence_score
@@ -0,0 +1,84 @@
+"""Tests for schema migrations."""
+
+import asyncio
+from pathlib import Path
+
+import aiosqlite
+import pytest
+
+from cryptopilot.database.connection import DatabaseConnection
+from cryptopilot.database.migrations import MIGRATIONS, apply_migrations
+
+SCHEMA_PATH = Path(__file__).parents[2] / "cryptopilot" / "database" / "schema.sql"
+LATEST_VERSION = max(migration.version for migration in MIGRATIONS)
+
+
+@pytest.mark.asyncio
+async def test_initialize_applies_all_migrations(tmp_path):
+    """A fresh database ends up at the latest schema version."""
+    async with DatabaseConnection(tmp_path / "test.db", SCHEMA_PATH) as db:
+        await db.initialize()
+
+        assert await db.get_schema_version() == LATEST_VERSION
+
+
+@pytest.mark.asyncio
+async def test_migrations_upgrade_existing_rows(tmp_path):
+    """Migrations run once and backfill rows written under schema v1."""
+    db_path = tmp_path / "legacy.db"
+    async with aiosqlite.connect(db_path) as conn:
+        await conn.executescript(SCHEMA_PATH.read_text())
+        await conn.execute(
+            """
+            INSERT INTO market_data
+                (symbol, timestamp, open, high, low, close, volume, timeframe, provider)
+            VALUES ('BTC', '2024-01-01T00:00:00+00:00', '1.5', '2', '1', '1.75', '10', '1d', 'x')
+            """
+        )
+        await conn.commit()
+
+        assert await apply_migrations(conn) == [m.version for m in MIGRATIONS]
+        assert await apply_migrations(conn) == []
+
+        cursor = await conn.execute("SELECT close_f, volume_f FROM market_data")
+        assert await cursor.fetchone() == (1.75, 10.0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_initialize_applies_migrations_once(tmp_path):
+    """Two connections opening a v1 database at once don't both migrate it."""
+    db_path = tmp_path / "legacy.db"
+    async with aiosqlite.connect(db_path) as conn:
+        await conn.executescript(SCHEMA_PATH.read_text())
+        await conn.commit()
+
+    async with (
+        DatabaseConnection(db_path, SCHEMA_PATH) as first,
+        DatabaseConnection(db_path, SCHEMA_PATH) as second,
+    ):
+        await asyncio.gather(first.initialize(), second.initialize())
+
+        rows = await first.fetch_all("SELECT version FROM schema_version ORDER BY version")
+        assert [row[0] for row in rows] == [1, *(m.version for m in MIGRATIONS)]
+
+
+@pytest.mark.asyncio
+async def test_timestamp_scans_use_series_index(tmp_path):
+    """Gap detection reads timestamps from the covering series index only."""
+    async with DatabaseConnection(tmp_path / "test.db", SCHEMA_PATH) as db:
+        await db.initialize()
+
+        rows = await db.fetch_all(
+            """
+            EXPLAIN QUERY PLAN
+            SELECT timestamp FROM market_data
+            WHERE symbol = ? AND timeframe = ? AND provider = ?
+              AND timestamp >= ? AND timestamp <= ?
+            ORDER BY timestamp ASC
+            """,
+            ("BTC", "1h", "coingecko", "2024-01-01", "2025-01-01"),
+        )
+
+        plan = " ".join(row["detail"] for row in rows)
+        assert "COVERING INDEX idx_market_data_series" in plan
+        assert "TEMP B-TREE" not in plan
@@ -0,0 +1,45 @@
+"""Tests for the SQLite connection pool."""
+
+import pytest
+
+from cryptopilot.database.pool import SQLiteConnectionPool
+
+
+@pytest.mark.asyncio
+async def test_released_connections_are_reused(tmp_path):
+    """A released connection is handed out again, configured once."""
+    pool = SQLiteConnectionPool(tmp_path / "pool.db", max_idle=1)
+    try:
+        async with pool.connection() as conn:
+            cursor = await conn.execute("PRAGMA synchronous")
+            assert (await cursor.fetchone())[0] == 1  # NORMAL
+            first = conn
+
+        async with pool.connection() as conn:
+            assert conn is first
+
+        # Connections beyond max_idle are closed on release
+        async with pool.connection() as a, pool.connection() as b:
+            assert a is not b
+        assert pool.idle_count == 1
+    finally:
+        await pool.close()
+    assert pool.idle_count == 0
+
+
+@pytest.mark.asyncio
+async def test_release_rolls_back_open_transaction(tmp_path):
+    """Uncommitted writes do not leak to the next borrower."""
+    pool = SQLiteConnectionPool(tmp_path / "pool.db")
+    try:
+        async with pool.connection() as conn:
+            await conn.execute("CREATE TABLE t (x INTEGER)")
+            await conn.commit()
+            await conn.execute("INSERT INTO t VALUES (1)")
+
+        async with pool.connection() as conn:
+            assert not conn.in_transaction
+            cursor = await conn.execute("SELECT COUNT(*) FROM t")
+            assert (await cursor.fetchone())[0] == 0
+    finally:
+        await pool.close()